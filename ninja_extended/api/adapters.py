@@ -0,0 +1,160 @@
+"""Module api.adapters."""
+
+from collections import OrderedDict
+from threading import Lock
+from types import UnionType
+from typing import Annotated, Any, Union, get_args, get_origin
+
+from pydantic import BaseModel, Field, TypeAdapter
+from pydantic.fields import FieldInfo
+
+RESPONSE_ADAPTERS_MAXSIZE = 1024
+
+_response_adapters: OrderedDict[Any, TypeAdapter] = OrderedDict()
+_response_adapters_lock = Lock()
+
+
+def field_annotation(field: FieldInfo) -> Any:
+    """Get the annotation of a model field including the metadata pydantic moved into its FieldInfo.
+
+    pydantic splits ``Annotated[A | B, Field(discriminator="type")]`` into the annotation ``A | B`` and the
+    discriminator of the FieldInfo, so an adapter built from ``field.annotation`` alone would lose the discriminator.
+
+    Args:
+        field (FieldInfo): The field.
+
+    Returns:
+        Any: The annotation.
+    """
+
+    metadata = list(field.metadata)
+    if field.discriminator is not None:
+        metadata.append(Field(discriminator=field.discriminator))
+
+    if not metadata:
+        return field.annotation
+
+    return Annotated[(field.annotation, *metadata)]
+
+
+def _discriminator(annotation: Any) -> str | None:
+    """Get the discriminator of an ``Annotated[A | B, Field(discriminator=...)]`` union."""
+
+    if get_origin(annotation) is not Annotated:
+        return None
+
+    for metadata in annotation.__metadata__:
+        if isinstance(metadata, FieldInfo) and isinstance(metadata.discriminator, str):
+            return metadata.discriminator
+
+    return None
+
+
+def _union_members(annotation: Any, discriminator: str) -> tuple[Any, ...]:
+    """Get the members of a (nested) discriminated union, e.g. as built by response_factory."""
+
+    if _discriminator(annotation) == discriminator:
+        annotation = get_args(annotation)[0]
+
+    if get_origin(annotation) in (Union, UnionType):
+        return tuple(member for arg in get_args(annotation) for member in _union_members(arg, discriminator))
+
+    return (annotation,)
+
+
+def _intern_key(annotation: Any) -> Any:
+    """Get the key identifying equal response annotations across operations."""
+
+    discriminator = _discriminator(annotation)
+    if discriminator is not None:
+        return ("discriminated_union", discriminator, frozenset(_union_members(annotation, discriminator)))
+
+    try:
+        hash(annotation)
+    except TypeError:
+        return ("id", id(annotation))
+
+    return annotation
+
+
+def _canonical_annotation(annotation: Any) -> Any:
+    """Flatten nested discriminated unions into one union with a stable member order."""
+
+    discriminator = _discriminator(annotation)
+    if discriminator is None:
+        return annotation
+
+    members = sorted(
+        dict.fromkeys(_union_members(annotation, discriminator)),
+        key=lambda member: (getattr(member, "__module__", ""), getattr(member, "__qualname__", repr(member))),
+    )
+    if len(members) == 1:
+        return members[0]
+
+    return Annotated[Union[tuple(members)], Field(discriminator=discriminator)]  # noqa: UP007
+
+
+def response_adapter(annotation: Any, *, intern: bool = True) -> TypeAdapter:
+    """Get the TypeAdapter validating and serializing a response annotation.
+
+    Adapters are interned: equal annotations, including discriminated unions of the same schemas built separately by
+    response_factory for different operations, share one adapter and thereby one core schema. The interned adapters
+    are evicted least recently used beyond RESPONSE_ADAPTERS_MAXSIZE, operations keep their adapters anyway.
+
+    Args:
+        annotation (Any): The response annotation.
+        intern (bool, optional): Intern the adapter. Defaults to True.
+
+    Returns:
+        TypeAdapter: The adapter.
+    """
+
+    if not intern:
+        return TypeAdapter(_canonical_annotation(annotation))
+
+    key = _intern_key(annotation)
+    with _response_adapters_lock:
+        adapter = _response_adapters.get(key)
+        if adapter is not None:
+            _response_adapters.move_to_end(key)
+            return adapter
+
+    adapter = TypeAdapter(_canonical_annotation(annotation))
+    with _response_adapters_lock:
+        adapter = _response_adapters.setdefault(key, adapter)
+        _response_adapters.move_to_end(key)
+        while len(_response_adapters) > RESPONSE_ADAPTERS_MAXSIZE:
+            _response_adapters.popitem(last=False)
+
+    return adapter
+
+
+def clear_response_adapters() -> None:
+    """Remove all interned adapters."""
+
+    with _response_adapters_lock:
+        _response_adapters.clear()
+
+
+def response_models(annotation: Any) -> set[type[BaseModel]]:
+    """Get the pydantic models of a response annotation, including the models of their fields.
+
+    Args:
+        annotation (Any): The response annotation.
+
+    Returns:
+        set[type[BaseModel]]: The models.
+    """
+
+    models: set[type[BaseModel]] = set()
+    pending = [annotation]
+    while pending:
+        annotation = pending.pop()
+        if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+            if annotation not in models:
+                models.add(annotation)
+                pending.extend(field.annotation for field in annotation.model_fields.values())
+        else:
+            pending.extend(arg for arg in get_args(annotation) if arg is not Ellipsis)
+
+    return models
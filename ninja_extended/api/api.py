@@ -2,22 +2,34 @@
 
 # ruff: noqa: ARG002
 
+import gc
 import warnings
 from collections.abc import Callable, Sequence
 from typing import TYPE_CHECKING, Any, TypeVar
 
 from django.http import HttpRequest, HttpResponse
+from django.urls import NoReverseMatch, URLPattern, URLResolver
 from ninja import NinjaAPI
 from ninja.constants import NOT_SET, NOT_SET_TYPE
 from ninja.openapi.docs import DocsBase, Swagger
+from ninja.openapi.urls import get_root_url
 from ninja.parser import Parser
-from ninja.renderers import BaseRenderer, JSONRenderer
+from ninja.renderers import BaseRenderer
 from ninja.throttling import BaseThrottle
 from ninja.types import DictStrAny, TCallable
+from pydantic import BaseModel
 
-from ninja_extended.api.errors import HttpMethodOnAPINotAllowedError
+from ninja_extended.api.adapters import field_annotation, response_models
+from ninja_extended.api.errors import HttpMethodOnAPINotAllowedError, OperationIdNotFoundInAPIError
+from ninja_extended.api.instrumentation import Instrumentation
+from ninja_extended.api.openapi import OpenAPICache, get_openapi_urls
+from ninja_extended.api.operation import ExtendedOperation, LazyOperation
+from ninja_extended.api.parsers import FastParser
 from ninja_extended.api.registry import APIOperationRegistry
+from ninja_extended.api.renderers import FastJSONRenderer
 from ninja_extended.api.router import ExtendedRouter
+from ninja_extended.api.trie import route_trie_urls
+from ninja_extended.conf import settings
 
 if TYPE_CHECKING:
     pass  # noqa: TCH005
@@ -51,6 +63,9 @@ class ExtendedNinjaAPI(NinjaAPI):
         parser: Parser | None = None,
         default_router: ExtendedRouter | None = None,
         openapi_extra: dict[str, Any] | None = None,
+        instrumentation: Sequence[Instrumentation] | None = None,
+        openapi_cache: OpenAPICache | None = None,
+        route_trie: bool | None = None,
     ):
         APIOperationRegistry.register_api(api=self)
 
@@ -70,9 +85,12 @@ class ExtendedNinjaAPI(NinjaAPI):
                 DeprecationWarning,
                 stacklevel=2,
             )
-        self.renderer = renderer or JSONRenderer()
-        self.parser = parser or Parser()
+        self.renderer = renderer or FastJSONRenderer()
+        self.parser = parser or FastParser()
         self.openapi_extra = openapi_extra or {}
+        self.instrumentation = list(instrumentation or [])
+        self.openapi_cache = openapi_cache or OpenAPICache()
+        self.route_trie = route_trie if route_trie is not None else settings.ROUTE_TRIE
 
         self._exception_handlers: dict[Exc, ExcHandler] = {}
         self.set_default_exception_handlers()
@@ -87,6 +105,7 @@ class ExtendedNinjaAPI(NinjaAPI):
         self.throttle = throttle
 
         self._routers: list[tuple[str, ExtendedRouter]] = []
+        self._operations: dict[str, ExtendedOperation | LazyOperation] = {}
         self.default_router = default_router or ExtendedRouter(tags=["default"])
         self.add_router("", self.default_router)
 
@@ -224,6 +243,8 @@ class ExtendedNinjaAPI(NinjaAPI):
 
         APIOperationRegistry.register_routers_operation_ids(api=self, router=router)
 
+        routers = len(self._routers)
+
         super().add_router(
             prefix=prefix,
             router=router,
@@ -232,3 +253,82 @@ class ExtendedNinjaAPI(NinjaAPI):
             tags=tags,
             parent_router=parent_router,
         )
+
+        for _, added_router in self._routers[routers:]:
+            self._operations.update(added_router._operations)  # noqa: SLF001
+
+        self.openapi_cache.clear()
+
+    def _get_urls(self) -> list[URLPattern | URLResolver]:
+        result: list[URLPattern | URLResolver] = get_openapi_urls(self)
+
+        url_patterns = [url_pattern for prefix, router in self._routers for url_pattern in router.urls_paths(prefix)]
+        result.extend(route_trie_urls(url_patterns) if self.route_trie else url_patterns)
+
+        result.append(get_root_url(self))
+
+        return result
+
+    def get_operation(self, operation_id: str) -> ExtendedOperation:
+        """Get an operation of the API by its operation id.
+
+        Args:
+            operation_id (str): The operation id.
+
+        Raises:
+            OperationIdNotFoundInAPIError: If the operation id is not found.
+
+        Returns:
+            ExtendedOperation: The operation.
+        """
+
+        try:
+            operation = self._operations[operation_id]
+        except KeyError:
+            raise OperationIdNotFoundInAPIError(api=self, operation_id=operation_id) from None
+
+        return operation.compile() if isinstance(operation, LazyOperation) else operation
+
+    def warmup(self, *, freeze: bool = False) -> None:
+        """Build everything that is otherwise built on first use, e.g. before a pre-fork server forks its workers.
+
+        Compiles the lazy operations (signatures and response adapters), completes the pydantic schemas of all
+        responses and registered error handlers, builds the trusted response constructors, populates the URL resolvers
+        and builds the OpenAPI document (if the API is included in the URLconf without path parameters).
+
+        Args:
+            freeze (bool, optional): Collect garbage and move all remaining objects to the permanent generation of the
+                garbage collector (``gc.freeze()``), so collections in forked workers do not write to (and copy) the
+                pages shared with the parent. Defaults to False.
+        """
+
+        models: set[type[BaseModel]] = set()
+        for operation in self._operations.values():
+            compiled = operation.compile() if isinstance(operation, LazyOperation) else operation
+            for response_model in compiled.response_models.values():
+                if response_model in (NOT_SET, None):
+                    continue
+                models |= response_models(field_annotation(response_model.model_fields["response"]))
+                if compiled.trusted_response or compiled.values_planner is not None:
+                    compiled.get_response_constructor(response_model)
+
+        for exc_class in self._exception_handlers:
+            schema = getattr(exc_class, "schema", None)
+            if isinstance(schema, type) and issubclass(schema, BaseModel):
+                models |= response_models(schema)
+
+        for model in models:
+            if not model.__pydantic_complete__:
+                model.model_rebuild()
+
+        try:
+            root_path = self.get_root_path({})
+        except NoReverseMatch:
+            root_path = None
+
+        if self.openapi_url and root_path is not None:
+            self.openapi_cache.document(self, root_path)
+
+        if freeze:
+            gc.collect()
+            gc.freeze()
@@ -0,0 +1,479 @@
+"""Module api.cache."""
+
+# ruff: noqa: ARG002
+
+import hashlib
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from collections.abc import Iterable, Sequence
+from threading import Lock
+from time import monotonic, time_ns
+from typing import Any, NamedTuple
+
+from asgiref.sync import sync_to_async
+from django.core.cache import caches
+from django.db.models import Model
+from django.db.models.signals import post_delete, post_save
+from django.http import HttpRequest, HttpResponse
+from django.http.response import HttpResponseBase
+
+from ninja_extended.api.conditional import VALIDATOR_HEADERS
+
+CACHE_KEY_PREFIX = "ninja_extended:response"
+CACHEABLE_METHODS = frozenset({"GET", "HEAD"})
+
+
+class CachedResponse(NamedTuple):
+    """A rendered response stored in a cache backend."""
+
+    status: int
+    content: bytes
+    content_type: str
+    headers: tuple[tuple[str, str], ...] = ()
+
+    def to_response(self) -> HttpResponse:
+        """Create the response.
+
+        Returns:
+            HttpResponse: The response.
+        """
+
+        return HttpResponse(
+            self.content, status=self.status, content_type=self.content_type, headers=dict(self.headers)
+        )
+
+
+class CacheBackend(ABC):
+    """Base class for the backends of response caches.
+
+    Besides the responses, backends store a version per tag. The versions of the tags of a response are part of its
+    key, so invalidating a tag (incrementing its version) makes all responses cached for it unreachable. The async
+    methods used by async operations run the sync methods in a thread by default.
+    """
+
+    @abstractmethod
+    def get(self, key: str) -> CachedResponse | None:
+        """Get a cached response.
+
+        Args:
+            key (str): The key.
+
+        Returns:
+            CachedResponse | None: The response or None if it is not cached.
+        """
+
+    @abstractmethod
+    def set(self, key: str, value: CachedResponse, timeout: float | None) -> None:
+        """Cache a response.
+
+        Args:
+            key (str): The key.
+            value (CachedResponse): The response.
+            timeout (float | None): The number of seconds the response is cached or None to cache it forever.
+        """
+
+    @abstractmethod
+    def tag_versions(self, tags: Sequence[str]) -> list[int]:
+        """Get the current versions of tags.
+
+        Args:
+            tags (Sequence[str]): The tags.
+
+        Returns:
+            list[int]: The versions.
+        """
+
+    @abstractmethod
+    def invalidate(self, tags: Iterable[str]) -> None:
+        """Invalidate all responses cached for tags.
+
+        Args:
+            tags (Iterable[str]): The tags.
+        """
+
+    async def aget(self, key: str) -> CachedResponse | None:
+        """Get a cached response (async).
+
+        Args:
+            key (str): The key.
+
+        Returns:
+            CachedResponse | None: The response or None if it is not cached.
+        """
+
+        return await sync_to_async(self.get)(key)
+
+    async def aset(self, key: str, value: CachedResponse, timeout: float | None) -> None:
+        """Cache a response (async).
+
+        Args:
+            key (str): The key.
+            value (CachedResponse): The response.
+            timeout (float | None): The number of seconds the response is cached or None to cache it forever.
+        """
+
+        await sync_to_async(self.set)(key, value, timeout)
+
+    async def atag_versions(self, tags: Sequence[str]) -> list[int]:
+        """Get the current versions of tags (async).
+
+        Args:
+            tags (Sequence[str]): The tags.
+
+        Returns:
+            list[int]: The versions.
+        """
+
+        return await sync_to_async(self.tag_versions)(tags)
+
+
+class LRUCacheBackend(CacheBackend):
+    """In-process cache backend evicting the least recently used responses."""
+
+    def __init__(self, maxsize: int = 1024) -> None:
+        """Initialize a LRUCacheBackend.
+
+        Args:
+            maxsize (int, optional): The maximum number of cached responses. Defaults to 1024.
+        """
+
+        self.maxsize = maxsize
+        self._entries: OrderedDict[str, tuple[float | None, CachedResponse]] = OrderedDict()
+        self._versions: dict[str, int] = {}
+        self._lock = Lock()
+
+    def get(self, key: str) -> CachedResponse | None:
+        """Get a cached response."""
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+
+            expires, value = entry
+            if expires is not None and expires <= monotonic():
+                del self._entries[key]
+                return None
+
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: CachedResponse, timeout: float | None) -> None:
+        """Cache a response."""
+
+        with self._lock:
+            self._entries[key] = (monotonic() + timeout if timeout is not None else None, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def tag_versions(self, tags: Sequence[str]) -> list[int]:
+        """Get the current versions of tags."""
+
+        return [self._versions.get(tag, 0) for tag in tags]
+
+    def invalidate(self, tags: Iterable[str]) -> None:
+        """Invalidate all responses cached for tags."""
+
+        with self._lock:
+            for tag in tags:
+                self._versions[tag] = self._versions.get(tag, 0) + 1
+
+    async def aget(self, key: str) -> CachedResponse | None:
+        """Get a cached response, in-process without blocking."""
+
+        return self.get(key)
+
+    async def aset(self, key: str, value: CachedResponse, timeout: float | None) -> None:
+        """Cache a response, in-process without blocking."""
+
+        self.set(key, value, timeout)
+
+    async def atag_versions(self, tags: Sequence[str]) -> list[int]:
+        """Get the current versions of tags, in-process without blocking."""
+
+        return self.tag_versions(tags)
+
+    def clear(self) -> None:
+        """Remove all cached responses."""
+
+        with self._lock:
+            self._entries.clear()
+
+
+class DjangoCacheBackend(CacheBackend):
+    """Cache backend storing the responses in a cache of Django's cache framework, shared between processes."""
+
+    def __init__(self, alias: str = "default", key_prefix: str = CACHE_KEY_PREFIX) -> None:
+        """Initialize a DjangoCacheBackend.
+
+        Args:
+            alias (str, optional): The alias of the cache in the CACHES setting. Defaults to "default".
+            key_prefix (str, optional): The prefix of the tag version keys. Defaults to CACHE_KEY_PREFIX.
+        """
+
+        self.alias = alias
+        self.key_prefix = key_prefix
+
+    @property
+    def cache(self) -> Any:
+        """The Django cache."""
+
+        return caches[self.alias]
+
+    def get(self, key: str) -> CachedResponse | None:
+        """Get a cached response."""
+
+        value = self.cache.get(key)
+
+        return CachedResponse(*value) if value is not None else None
+
+    def set(self, key: str, value: CachedResponse, timeout: float | None) -> None:
+        """Cache a response."""
+
+        self.cache.set(key, tuple(value), timeout)
+
+    def tag_versions(self, tags: Sequence[str]) -> list[int]:
+        """Get the current versions of tags.
+
+        Missing versions (never invalidated or evicted) are initialized with the current time, so responses cached
+        for an evicted version can not become reachable again.
+        """
+
+        keys = [self._tag_key(tag) for tag in tags]
+        versions = self.cache.get_many(keys)
+        for key in keys:
+            if key not in versions:
+                self.cache.add(key, time_ns(), None)
+                versions[key] = self.cache.get(key)
+
+        return [versions[key] for key in keys]
+
+    def invalidate(self, tags: Iterable[str]) -> None:
+        """Invalidate all responses cached for tags."""
+
+        for tag in tags:
+            key = self._tag_key(tag)
+            try:
+                self.cache.incr(key)
+            except ValueError:
+                self.cache.add(key, time_ns(), None)
+
+    async def aget(self, key: str) -> CachedResponse | None:
+        """Get a cached response with the async API of the Django cache."""
+
+        value = await self.cache.aget(key)
+
+        return CachedResponse(*value) if value is not None else None
+
+    async def aset(self, key: str, value: CachedResponse, timeout: float | None) -> None:
+        """Cache a response with the async API of the Django cache."""
+
+        await self.cache.aset(key, tuple(value), timeout)
+
+    async def atag_versions(self, tags: Sequence[str]) -> list[int]:
+        """Get the current versions of tags with the async API of the Django cache."""
+
+        keys = [self._tag_key(tag) for tag in tags]
+        versions = await self.cache.aget_many(keys)
+        for key in keys:
+            if key not in versions:
+                await self.cache.aadd(key, time_ns(), None)
+                versions[key] = await self.cache.aget(key)
+
+        return [versions[key] for key in keys]
+
+    def _tag_key(self, tag: str) -> str:
+        return f"{self.key_prefix}:tag:{tag}"
+
+
+def model_tag(model: type[Model]) -> str:
+    """Get the tag of a model, e.g. ``api.Resource``.
+
+    Args:
+        model (type[Model]): The model.
+
+    Returns:
+        str: The tag.
+    """
+
+    return model._meta.label  # noqa: SLF001
+
+
+def _principal(request: HttpRequest) -> str | None:
+    auth = getattr(request, "auth", None)
+    if auth is None:
+        return None
+
+    pk = getattr(auth, "pk", None)
+    if pk is not None:
+        return f"{type(auth).__qualname__}:{pk}"
+
+    return repr(auth)
+
+
+class ResponseCache:
+    """Cache the rendered responses of an operation.
+
+    Responses are cached per operation id, path, query parameters, authenticated principal (``request.auth``) and
+    the request headers the response varies on. Only successful responses (200) of GET and HEAD requests that are
+    neither streamed nor set cookies are cached. Saving or deleting an instance of one of the models invalidates the
+    responses cached for the model tag, other tags can be invalidated with ``invalidate()``.
+    """
+
+    def __init__(
+        self,
+        backend: CacheBackend | None = None,
+        *,
+        timeout: float | None = 60,
+        models: Sequence[type[Model]] = (),
+        tags: Sequence[str] = (),
+        vary_headers: Sequence[str] = ("Accept",),
+    ) -> None:
+        """Initialize a ResponseCache.
+
+        Args:
+            backend (CacheBackend | None, optional): The backend. Defaults to a new LRUCacheBackend.
+            timeout (float | None, optional): The number of seconds a response is cached, None to cache it until it is
+                invalidated. Defaults to 60.
+            models (Sequence[type[Model]], optional): The models whose changes invalidate the cached responses.
+                Defaults to ().
+            tags (Sequence[str], optional): Additional tags of the cached responses. Defaults to ().
+            vary_headers (Sequence[str], optional): The request headers the responses vary on. Defaults to
+                ("Accept",).
+        """
+
+        self.backend = backend or LRUCacheBackend()
+        self.timeout = timeout
+        self.tags = (*(model_tag(model) for model in models), *tags)
+        self.vary_headers = tuple(vary_headers)
+
+        for model in models:
+            post_save.connect(self._invalidate_model, sender=model)
+            post_delete.connect(self._invalidate_model, sender=model)
+
+    def key(self, request: HttpRequest, operation_id: str) -> str:
+        """Build the key of the response to a request.
+
+        Args:
+            request (HttpRequest): The request.
+            operation_id (str): The operation id.
+
+        Returns:
+            str: The key.
+        """
+
+        return self._key(request, operation_id, self.backend.tag_versions(self.tags) if self.tags else [])
+
+    async def akey(self, request: HttpRequest, operation_id: str) -> str:
+        """Build the key of the response to a request (async).
+
+        Args:
+            request (HttpRequest): The request.
+            operation_id (str): The operation id.
+
+        Returns:
+            str: The key.
+        """
+
+        return self._key(request, operation_id, await self.backend.atag_versions(self.tags) if self.tags else [])
+
+    def _key(self, request: HttpRequest, operation_id: str, versions: list[int]) -> str:
+        parts = (
+            request.path,
+            sorted(request.GET.lists()),
+            _principal(request),
+            [request.headers.get(header, "") for header in self.vary_headers],
+            versions,
+        )
+        digest = hashlib.sha256(repr(parts).encode()).hexdigest()
+
+        return f"{CACHE_KEY_PREFIX}:{operation_id}:{digest}"
+
+    def lookup(self, request: HttpRequest, operation_id: str) -> tuple[str | None, HttpResponse | None]:
+        """Get the cached response to a request.
+
+        Args:
+            request (HttpRequest): The request.
+            operation_id (str): The operation id.
+
+        Returns:
+            tuple[str | None, HttpResponse | None]: The key (None if the request can not be cached) and the cached
+                response (None if it is not cached).
+        """
+
+        if request.method not in CACHEABLE_METHODS:
+            return None, None
+
+        key = self.key(request, operation_id)
+        cached = self.backend.get(key)
+
+        return key, cached.to_response() if cached is not None else None
+
+    async def alookup(self, request: HttpRequest, operation_id: str) -> tuple[str | None, HttpResponse | None]:
+        """Get the cached response to a request (async).
+
+        Args:
+            request (HttpRequest): The request.
+            operation_id (str): The operation id.
+
+        Returns:
+            tuple[str | None, HttpResponse | None]: The key (None if the request can not be cached) and the cached
+                response (None if it is not cached).
+        """
+
+        if request.method not in CACHEABLE_METHODS:
+            return None, None
+
+        key = await self.akey(request, operation_id)
+        cached = await self.backend.aget(key)
+
+        return key, cached.to_response() if cached is not None else None
+
+    def store(self, key: str, response: HttpResponseBase) -> None:
+        """Cache a response if it is cacheable.
+
+        Args:
+            key (str): The key returned by lookup.
+            response (HttpResponseBase): The response.
+        """
+
+        cached = self._cached_response(response)
+        if cached is not None:
+            self.backend.set(key, cached, self.timeout)
+
+    async def astore(self, key: str, response: HttpResponseBase) -> None:
+        """Cache a response if it is cacheable (async).
+
+        Args:
+            key (str): The key returned by alookup.
+            response (HttpResponseBase): The response.
+        """
+
+        cached = self._cached_response(response)
+        if cached is not None:
+            await self.backend.aset(key, cached, self.timeout)
+
+    @staticmethod
+    def _cached_response(response: HttpResponseBase) -> CachedResponse | None:
+        if not isinstance(response, HttpResponse) or response.status_code != 200 or response.cookies:  # noqa: PLR2004
+            return None
+
+        return CachedResponse(
+            status=response.status_code,
+            content=response.content,
+            content_type=response["Content-Type"],
+            headers=tuple((header, response[header]) for header in VALIDATOR_HEADERS if response.has_header(header)),
+        )
+
+    def invalidate(self, *tags: str) -> None:
+        """Invalidate the responses cached for tags.
+
+        Args:
+            *tags (str): The tags, defaults to all tags of the cache.
+        """
+
+        self.backend.invalidate(tags or self.tags)
+
+    def _invalidate_model(self, sender: type[Model], **kwargs: Any) -> None:
+        self.backend.invalidate([model_tag(sender)])
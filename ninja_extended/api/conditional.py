@@ -0,0 +1,182 @@
+"""Module api.conditional."""
+
+import hashlib
+from collections.abc import Callable
+from datetime import datetime
+from typing import Any
+
+from django.db.models import Count, Manager, Max, QuerySet
+from django.http import HttpRequest
+from django.http.response import HttpResponseBase
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date, parse_http_date_safe, quote_etag
+
+ETagFunc = Callable[[HttpRequest, Any], str | None]
+LastModifiedFunc = Callable[[HttpRequest, Any], datetime | None]
+
+CONDITIONAL_METHODS = frozenset({"GET", "HEAD"})
+VALIDATOR_HEADERS = ("ETag", "Last-Modified")
+
+
+def _queryset(result: Any) -> QuerySet | None:
+    if isinstance(result, Manager):
+        return result.all()
+
+    return result if isinstance(result, QuerySet) else None
+
+
+def aggregate_etag(*fields: str) -> ETagFunc:
+    """Build an ETag function aggregating the result queryset, e.g. ``aggregate_etag("updated_at")``.
+
+    The ETag is a weak ETag of the number of rows, the maximum of each field (e.g. a modification timestamp or a row
+    version) and the Accept header, computed with a single aggregate query without evaluating the queryset. Results
+    that are not querysets have no ETag.
+
+    Args:
+        *fields (str): The fields changing with every modification of a row.
+
+    Returns:
+        ETagFunc: The ETag function.
+    """
+
+    def etag(request: HttpRequest, result: Any) -> str | None:
+        queryset = _queryset(result)
+        if queryset is None:
+            return None
+
+        aggregates = queryset.order_by().aggregate(
+            ninja_extended_count=Count("pk"), **{f"ninja_extended_max_{field}": Max(field) for field in fields}
+        )
+        parts = (sorted(aggregates.items()), request.headers.get("Accept", ""))
+
+        return f'W/"{hashlib.sha256(repr(parts).encode()).hexdigest()[:32]}"'
+
+    return etag
+
+
+def aggregate_last_modified(field: str) -> LastModifiedFunc:
+    """Build a Last-Modified function returning the maximum of a field of the result queryset.
+
+    Args:
+        field (str): The modification timestamp field, e.g. ``updated_at``.
+
+    Returns:
+        LastModifiedFunc: The Last-Modified function.
+    """
+
+    def last_modified(request: HttpRequest, result: Any) -> datetime | None:  # noqa: ARG001
+        queryset = _queryset(result)
+        if queryset is None:
+            return None
+
+        return queryset.order_by().aggregate(last_modified=Max(field))["last_modified"]
+
+    return last_modified
+
+
+class Validators:
+    """The ETag and Last-Modified timestamp of a response."""
+
+    __slots__ = ("etag", "last_modified")
+
+    def __init__(self, etag: str | None, last_modified: int | None) -> None:
+        """Initialize Validators.
+
+        Args:
+            etag (str | None): The quoted ETag.
+            last_modified (int | None): The Last-Modified timestamp.
+        """
+
+        self.etag = etag
+        self.last_modified = last_modified
+
+    @classmethod
+    def from_response(cls, response: HttpResponseBase) -> "Validators":
+        """Get the validators from the headers of a response.
+
+        Args:
+            response (HttpResponseBase): The response.
+
+        Returns:
+            Validators: The validators.
+        """
+
+        last_modified = response.get("Last-Modified")
+
+        return cls(
+            etag=response.get("ETag"),
+            last_modified=parse_http_date_safe(last_modified) if last_modified is not None else None,
+        )
+
+    def not_modified(self, request: HttpRequest) -> HttpResponseBase | None:
+        """Evaluate the conditional headers of a GET or HEAD request.
+
+        Args:
+            request (HttpRequest): The request.
+
+        Returns:
+            HttpResponseBase | None: The response (304 Not Modified or 412 Precondition Failed) or None if the full
+                response has to be sent.
+        """
+
+        if request.method not in CONDITIONAL_METHODS or (self.etag is None and self.last_modified is None):
+            return None
+
+        response = get_conditional_response(request, etag=self.etag, last_modified=self.last_modified)
+        if response is not None:
+            self.set_headers(response)
+
+        return response
+
+    def set_headers(self, response: HttpResponseBase) -> None:
+        """Set the ETag and Last-Modified headers of a response (unless they are already set).
+
+        Args:
+            response (HttpResponseBase): The response.
+        """
+
+        if self.etag is not None and not response.has_header("ETag"):
+            response["ETag"] = self.etag
+        if self.last_modified is not None and not response.has_header("Last-Modified"):
+            response["Last-Modified"] = http_date(self.last_modified)
+
+
+class ConditionalGet:
+    """Answer conditional GET requests with 304 Not Modified before the result of the view is serialized.
+
+    The ETag and Last-Modified functions are called with the request and the result of the view (e.g. the unevaluated
+    queryset), so they can compute the validators cheaply, e.g. with an aggregate query. Requests whose
+    ``If-None-Match`` or ``If-Modified-Since`` headers match get an empty 304 response, other responses get the
+    ETag and Last-Modified headers.
+    """
+
+    def __init__(self, etag: ETagFunc | None = None, last_modified: LastModifiedFunc | None = None) -> None:
+        """Initialize a ConditionalGet.
+
+        Args:
+            etag (ETagFunc | None, optional): The function computing the ETag. Defaults to None.
+            last_modified (LastModifiedFunc | None, optional): The function computing the Last-Modified datetime.
+                Defaults to None.
+        """
+
+        self.etag = etag
+        self.last_modified = last_modified
+
+    def validators(self, request: HttpRequest, result: Any) -> Validators:
+        """Compute the validators of the result of the view.
+
+        Args:
+            request (HttpRequest): The request.
+            result (Any): The result of the view.
+
+        Returns:
+            Validators: The validators.
+        """
+
+        etag = self.etag(request, result) if self.etag is not None else None
+        last_modified = self.last_modified(request, result) if self.last_modified is not None else None
+
+        return Validators(
+            etag=quote_etag(etag) if etag is not None else None,
+            last_modified=int(last_modified.timestamp()) if last_modified is not None else None,
+        )
@@ -129,3 +129,29 @@ class OperationIdNotFoundInRouterError(APIConfigurationError):
             operation_id (str): The operation id.
         """
         super().__init__(f"Operation id '{operation_id}' not found in router with id {id(router)}.")
+
+
+class ResponseSchemaNotFoundError(APIConfigurationError):
+    """Error for an operation option that requires a response schema."""
+
+    def __init__(self, operation_id: str):
+        """Initialize a ResponseSchemaNotFoundError.
+
+        Args:
+            operation_id (str): The operation id.
+        """
+        super().__init__(f"Operation id '{operation_id}' has no successful response with a schema.")
+
+
+class ResponseSchemaNotFlatError(APIConfigurationError):
+    """Error for a values() fast path on a response schema that is not flat."""
+
+    def __init__(self, operation_id: str):
+        """Initialize a ResponseSchemaNotFlatError.
+
+        Args:
+            operation_id (str): The operation id.
+        """
+        super().__init__(
+            f"Operation id '{operation_id}' has a response schema with resolvers, nested schemas or dotted sources."
+        )
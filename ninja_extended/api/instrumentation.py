@@ -0,0 +1,384 @@
+"""Module api.instrumentation."""
+
+# ruff: noqa: ARG002
+
+from bisect import bisect_left
+from collections.abc import AsyncIterator, Iterator, Sequence
+from contextlib import AbstractContextManager, contextmanager, nullcontext
+from threading import Lock
+from time import perf_counter
+from typing import TYPE_CHECKING, Any
+
+from django.http import HttpRequest
+from django.http.response import HttpResponseBase, StreamingHttpResponse
+
+if TYPE_CHECKING:
+    from ninja_extended.api.operation import ExtendedOperation
+
+PHASES = ("params", "auth", "throttle", "view", "pagination", "serialization", "rendering", "streaming")
+TOTAL = "total"
+DEFAULT_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+class Instrumentation:
+    """Base class for the instrumentation of operations, all hooks are no-ops.
+
+    Instrumentation is passed to ExtendedNinjaAPI and called for every request of its operations. Durations are
+    measured with ``perf_counter`` in seconds, phases nested in other phases (e.g. the pagination within the view) are
+    not counted in the outer phase. The view phase includes the evaluation of a returned queryset, the serialization
+    phase the validation (or construction) of the result and the rendering phase its conversion to the response body.
+    The streaming phase covers the consumption of streamed response bodies, which happens after the operation returned
+    the response: the request is suspended in between the chunks and finished once the body is consumed.
+    """
+
+    def on_start(self, request: HttpRequest, operation: "ExtendedOperation") -> None:
+        """Handle the start of a request, before the operation runs.
+
+        Args:
+            request (HttpRequest): The request.
+            operation (ExtendedOperation): The operation.
+        """
+
+    def on_phase(self, request: HttpRequest, operation: "ExtendedOperation", phase: str, duration: float) -> None:
+        """Handle the end of a phase of the operation.
+
+        Args:
+            request (HttpRequest): The request.
+            operation (ExtendedOperation): The operation.
+            phase (str): The phase, one of PHASES.
+            duration (float): The duration of the phase in seconds.
+        """
+
+    def on_suspend(self, request: HttpRequest, operation: "ExtendedOperation") -> None:
+        """Handle the suspension of a request, after the operation returned a streaming response and between its chunks.
+
+        State set up in on_start (e.g. context variables) should be removed here and restored in on_resume, as the body
+        can be consumed in another context.
+
+        Args:
+            request (HttpRequest): The request.
+            operation (ExtendedOperation): The operation.
+        """
+
+    def on_resume(self, request: HttpRequest, operation: "ExtendedOperation") -> None:
+        """Handle the resumption of a suspended request, before the next chunk of its streamed body is produced.
+
+        Args:
+            request (HttpRequest): The request.
+            operation (ExtendedOperation): The operation.
+        """
+
+    def on_finish(
+        self,
+        request: HttpRequest,
+        operation: "ExtendedOperation",
+        response: HttpResponseBase | None,
+        timings: "Timings",
+    ) -> None:
+        """Handle the end of a request, after the operation created the response or raised an exception.
+
+        The hook is always called once the request started, so state set up in on_start can be cleaned up here. The
+        instrumentation is finished in reverse order of its start, like nested context managers.
+
+        Args:
+            request (HttpRequest): The request.
+            operation (ExtendedOperation): The operation.
+            response (HttpResponseBase | None): The response or None if the operation raised an exception.
+            timings (Timings): The timings of the request.
+        """
+
+
+class Timings:
+    """The phase durations of a single request."""
+
+    __slots__ = ("_nested", "durations", "instrumentation", "operation", "request", "start", "total")
+
+    def __init__(
+        self, request: HttpRequest, operation: "ExtendedOperation", instrumentation: Sequence[Instrumentation]
+    ) -> None:
+        """Initialize Timings.
+
+        Args:
+            request (HttpRequest): The request.
+            operation (ExtendedOperation): The operation.
+            instrumentation (Sequence[Instrumentation]): The instrumentation notified about the phases.
+        """
+
+        self.request = request
+        self.operation = operation
+        self.instrumentation = instrumentation
+        self.durations: dict[str, float] = {}
+        self.start = perf_counter()
+        self.total: float | None = None
+        self._nested: list[float] = []
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        """Time a phase, the durations of repeated phases are summed up.
+
+        Args:
+            name (str): The phase.
+        """
+
+        self._nested.append(0.0)
+        start = perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = perf_counter() - start
+            duration = elapsed - self._nested.pop()
+            if self._nested:
+                self._nested[-1] += elapsed
+            self.durations[name] = self.durations.get(name, 0.0) + duration
+            for instrumentation in self.instrumentation:
+                instrumentation.on_phase(self.request, self.operation, name, duration)
+
+    def finish(self, response: HttpResponseBase | None) -> HttpResponseBase | None:
+        """Stop the timer and notify the instrumentation.
+
+        Args:
+            response (HttpResponseBase | None): The response or None if the operation raised an exception.
+
+        Returns:
+            HttpResponseBase | None: The response.
+        """
+
+        self.total = perf_counter() - self.start
+        for instrumentation in reversed(self.instrumentation):
+            instrumentation.on_finish(self.request, self.operation, response, self)
+
+        return response
+
+    def suspend(self) -> None:
+        """Suspend the request, e.g. while its streamed body is not consumed."""
+
+        for instrumentation in reversed(self.instrumentation):
+            instrumentation.on_suspend(self.request, self.operation)
+
+    def resume(self) -> None:
+        """Resume the suspended request."""
+
+        for instrumentation in self.instrumentation:
+            instrumentation.on_resume(self.request, self.operation)
+
+    def stream(self, response: StreamingHttpResponse) -> StreamingHttpResponse:
+        """Suspend the request until the body of its streaming response is consumed and finish it afterwards.
+
+        Every chunk is produced with the request resumed and timed as streaming phase. The request is finished once the
+        body is consumed, raised an exception or the response is closed.
+
+        Args:
+            response (StreamingHttpResponse): The response.
+
+        Returns:
+            StreamingHttpResponse: The response with the instrumented body.
+        """
+
+        self.suspend()
+        stream_class = _AsyncInstrumentedStream if response.is_async else _InstrumentedStream
+        response.streaming_content = stream_class(self, response, response.streaming_content)
+
+        return response
+
+
+class _InstrumentedStreamBase:
+    """Body of a streaming response consumed with the instrumentation of its request resumed."""
+
+    def __init__(self, timings: Timings, response: StreamingHttpResponse, content: Any) -> None:
+        self.timings = timings
+        self.response = response
+        self.content = content
+        self.finished = False
+
+    def close(self) -> None:
+        """Finish the request if the body was not consumed completely, called when the response is closed."""
+
+        if not self.finished:
+            self.finished = True
+            self.timings.finish(self.response)
+
+    def _fail(self) -> None:
+        # finished while resumed, so the instrumentation cleans up the state restored for the chunk
+        self.finished = True
+        self.timings.finish(self.response)
+
+
+class _InstrumentedStream(_InstrumentedStreamBase):
+    def __iter__(self) -> Iterator:
+        return self
+
+    def __next__(self) -> Any:
+        if self.finished:
+            raise StopIteration
+
+        self.timings.resume()
+        try:
+            with self.timings.phase("streaming"):
+                chunk = next(self.content)
+        except BaseException:
+            self._fail()
+            raise
+        self.timings.suspend()
+
+        return chunk
+
+
+class _AsyncInstrumentedStream(_InstrumentedStreamBase):
+    def __aiter__(self) -> AsyncIterator:
+        return self
+
+    async def __anext__(self) -> Any:
+        if self.finished:
+            raise StopAsyncIteration
+
+        self.timings.resume()
+        try:
+            with self.timings.phase("streaming"):
+                chunk = await anext(self.content)
+        except BaseException:
+            self._fail()
+            raise
+        self.timings.suspend()
+
+        return chunk
+
+
+def phase(request: HttpRequest, name: str) -> AbstractContextManager:
+    """Time a phase of the request if its operation is instrumented.
+
+    Args:
+        request (HttpRequest): The request.
+        name (str): The phase.
+
+    Returns:
+        AbstractContextManager: The context manager timing the phase.
+    """
+
+    timings = getattr(request, "timings", None)
+    if not isinstance(timings, Timings):
+        return nullcontext()
+
+    return timings.phase(name)
+
+
+class ServerTiming(Instrumentation):
+    """Expose the phase durations of a request in the ``Server-Timing`` response header."""
+
+    def on_finish(
+        self, request: HttpRequest, operation: "ExtendedOperation", response: HttpResponseBase | None, timings: Timings
+    ) -> None:
+        """Set the Server-Timing header.
+
+        Args:
+            request (HttpRequest): The request.
+            operation (ExtendedOperation): The operation.
+            response (HttpResponseBase | None): The response or None if the operation raised an exception.
+            timings (Timings): The timings of the request.
+        """
+
+        if response is None:
+            return
+
+        metrics = [f"{name};dur={duration * 1000:.3f}" for name, duration in timings.durations.items()]
+        metrics.append(f"{TOTAL};dur={timings.total * 1000:.3f}")
+        response["Server-Timing"] = ", ".join(metrics)
+
+
+class Histogram:
+    """A histogram of durations with cumulative buckets."""
+
+    __slots__ = ("buckets", "count", "counts", "sum")
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_BUCKETS) -> None:
+        """Initialize a Histogram.
+
+        Args:
+            buckets (Sequence[float], optional): The sorted upper bounds of the buckets in seconds. Defaults to
+                DEFAULT_BUCKETS.
+        """
+
+        self.buckets = tuple(buckets)
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value: float) -> None:
+        """Add a duration.
+
+        Args:
+            value (float): The duration in seconds.
+        """
+
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.sum += value
+
+    def to_dict(self) -> dict[str, Any]:
+        """Get the histogram as dict with the cumulative count per upper bound ("+Inf" for all durations).
+
+        Returns:
+            dict[str, Any]: The histogram.
+        """
+
+        buckets = {}
+        cumulative = 0
+        for bound, count in zip((*self.buckets, "+Inf"), self.counts, strict=True):
+            cumulative += count
+            buckets[str(bound)] = cumulative
+
+        return {"buckets": buckets, "count": self.count, "sum": self.sum}
+
+
+class TimingHistograms(Instrumentation):
+    """Aggregate the phase durations of all requests into histograms per operation id and phase."""
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_BUCKETS) -> None:
+        """Initialize TimingHistograms.
+
+        Args:
+            buckets (Sequence[float], optional): The sorted upper bounds of the buckets in seconds. Defaults to
+                DEFAULT_BUCKETS.
+        """
+
+        self.buckets = tuple(buckets)
+        self.histograms: dict[str, dict[str, Histogram]] = {}
+        self._lock = Lock()
+
+    def on_finish(
+        self, request: HttpRequest, operation: "ExtendedOperation", response: HttpResponseBase | None, timings: Timings
+    ) -> None:
+        """Add the durations of the request to the histograms of its operation.
+
+        Args:
+            request (HttpRequest): The request.
+            operation (ExtendedOperation): The operation.
+            response (HttpResponseBase | None): The response or None if the operation raised an exception.
+            timings (Timings): The timings of the request.
+        """
+
+        with self._lock:
+            histograms = self.histograms.setdefault(operation.operation_id, {})
+            for name, duration in (*timings.durations.items(), (TOTAL, timings.total)):
+                histogram = histograms.get(name)
+                if histogram is None:
+                    histogram = histograms[name] = Histogram(buckets=self.buckets)
+                histogram.observe(duration)
+
+    def snapshot(self) -> dict[str, dict[str, dict[str, Any]]]:
+        """Get a copy of all histograms.
+
+        Returns:
+            dict[str, dict[str, dict[str, Any]]]: The histograms per operation id and phase.
+        """
+
+        with self._lock:
+            return {
+                operation_id: {name: histogram.to_dict() for name, histogram in histograms.items()}
+                for operation_id, histograms in self.histograms.items()
+            }
+
+    def reset(self) -> None:
+        """Remove all histograms."""
+
+        with self._lock:
+            self.histograms.clear()
@@ -0,0 +1,290 @@
+"""Module api.openapi."""
+
+import gzip
+import hashlib
+import json
+import logging
+import os
+import tempfile
+from functools import partial
+from pathlib import Path
+from threading import Lock
+from typing import TYPE_CHECKING, Any, NamedTuple
+
+import ninja
+from django.http import HttpRequest, HttpResponse
+from django.http.response import HttpResponseBase
+from django.urls import URLPattern, path
+from django.utils.cache import get_conditional_response, patch_vary_headers
+from ninja.openapi.urls import get_openapi_urls as get_ninja_openapi_urls
+from ninja.responses import NinjaJSONEncoder
+
+if TYPE_CHECKING:
+    from ninja_extended.api.api import ExtendedNinjaAPI
+
+logger = logging.getLogger(__name__)
+
+OPENAPI_CONTENT_TYPE = "application/json"
+GZIP_COMPRESSLEVEL = 9
+
+
+def accepts_gzip(request: HttpRequest) -> bool:
+    """Check if a request accepts gzip encoded responses.
+
+    Args:
+        request (HttpRequest): The request.
+
+    Returns:
+        bool: True if the Accept-Encoding header contains gzip without ``q=0``.
+    """
+
+    for coding in request.headers.get("Accept-Encoding", "").split(","):
+        name, *params = coding.split(";")
+        if name.strip().lower() != "gzip":
+            continue
+
+        for param in params:
+            key, _, value = param.strip().partition("=")
+            if key.lower() == "q":
+                try:
+                    return float(value) > 0
+                except ValueError:
+                    return False
+
+        return True
+
+    return False
+
+
+class OpenAPIDocument(NamedTuple):
+    """A rendered OpenAPI document with its gzip encoded variant."""
+
+    content: bytes
+    gzip_content: bytes
+    etag: str
+
+    @classmethod
+    def from_content(
+        cls, content: bytes, gzip_content: bytes | None = None, compresslevel: int = GZIP_COMPRESSLEVEL
+    ) -> "OpenAPIDocument":
+        """Create a document from its JSON bytes.
+
+        Args:
+            content (bytes): The JSON bytes.
+            gzip_content (bytes | None, optional): The gzip encoded JSON bytes. Defaults to compressing the content.
+            compresslevel (int, optional): The gzip compression level. Defaults to GZIP_COMPRESSLEVEL.
+
+        Returns:
+            OpenAPIDocument: The document.
+        """
+
+        if gzip_content is None:
+            gzip_content = gzip.compress(content, compresslevel=compresslevel, mtime=0)
+
+        return cls(content=content, gzip_content=gzip_content, etag=f'"{hashlib.sha256(content).hexdigest()[:32]}"')
+
+    @property
+    def gzip_etag(self) -> str:
+        """The strong ETag of the gzip encoded bytes."""
+
+        return f'{self.etag[:-1]}-gzip"'
+
+    def response(self, request: HttpRequest) -> HttpResponseBase:
+        """Create the response to a request, gzip encoded if the request accepts it.
+
+        Args:
+            request (HttpRequest): The request.
+
+        Returns:
+            HttpResponseBase: The response or 304 Not Modified if the ETag matches If-None-Match.
+        """
+
+        use_gzip = accepts_gzip(request)
+        etag = self.gzip_etag if use_gzip else self.etag
+
+        response = get_conditional_response(request, etag=etag)
+        if response is None:
+            response = HttpResponse(self.gzip_content if use_gzip else self.content, content_type=OPENAPI_CONTENT_TYPE)
+            if use_gzip:
+                response["Content-Encoding"] = "gzip"
+
+        response["ETag"] = etag
+        patch_vary_headers(response, ("Accept-Encoding",))
+
+        return response
+
+
+def operations_hash(api: "ExtendedNinjaAPI", path_prefix: str) -> str:
+    """Get a hash of the registered operations of an API identifying its OpenAPI document.
+
+    The hash covers the API metadata, the versions of Django Ninja and Django Ninja Extended, the path prefix and the
+    path, methods, operation id and view of every operation. Lazy operations are not compiled. Changes of schemas or
+    operation options are not covered, so persisted documents have to be stored per release.
+
+    Args:
+        api (ExtendedNinjaAPI): The API.
+        path_prefix (str): The path prefix of the operations.
+
+    Returns:
+        str: The hash.
+    """
+
+    parts: list[Any] = [
+        api.title,
+        api.version,
+        api.description,
+        api.servers,
+        api.openapi_extra,
+        ninja.__version__,
+        path_prefix,
+    ]
+    for prefix, router in api._routers:  # noqa: SLF001
+        for operation_path, path_view in router.path_operations.items():
+            for operation in path_view.operations:
+                view_func = operation.view_func
+                parts.append(
+                    (
+                        prefix,
+                        operation_path,
+                        operation.operation_id,
+                        sorted(operation.methods),
+                        f"{view_func.__module__}.{view_func.__qualname__}",
+                    )
+                )
+
+    return hashlib.sha256(repr(parts).encode()).hexdigest()[:32]
+
+
+class OpenAPICache:
+    """Build the OpenAPI document of an API once and serve the cached JSON and gzip bytes with a strong ETag.
+
+    The document is built on the first request per path prefix and kept in memory until a router is added. With a
+    directory, the gzip encoded document is also persisted to a file named after the hash of the registered
+    operations (see operations_hash), so later worker boots load it instead of building it. The directory should be
+    specific to a release, e.g. created during the deployment, as schema changes do not change the hash.
+    """
+
+    def __init__(self, directory: str | Path | None = None, compresslevel: int = GZIP_COMPRESSLEVEL) -> None:
+        """Initialize an OpenAPICache.
+
+        Args:
+            directory (str | Path | None, optional): The directory persisting the documents. Defaults to None.
+            compresslevel (int, optional): The gzip compression level. Defaults to GZIP_COMPRESSLEVEL.
+        """
+
+        self.directory = Path(directory) if directory is not None else None
+        self.compresslevel = compresslevel
+        self._documents: dict[str, OpenAPIDocument] = {}
+        self._lock = Lock()
+
+    def document(self, api: "ExtendedNinjaAPI", path_prefix: str) -> OpenAPIDocument:
+        """Get the OpenAPI document of an API.
+
+        Args:
+            api (ExtendedNinjaAPI): The API.
+            path_prefix (str): The path prefix of the operations.
+
+        Returns:
+            OpenAPIDocument: The document.
+        """
+
+        document = self._documents.get(path_prefix)
+        if document is not None:
+            return document
+
+        with self._lock:
+            document = self._documents.get(path_prefix)
+            if document is None:
+                document = self._documents[path_prefix] = self._load_or_build(api, path_prefix)
+
+        return document
+
+    def clear(self) -> None:
+        """Remove the documents from memory (persisted documents are kept)."""
+
+        with self._lock:
+            self._documents.clear()
+
+    def path(self, api: "ExtendedNinjaAPI", path_prefix: str) -> Path | None:
+        """Get the file persisting the document of an API.
+
+        Args:
+            api (ExtendedNinjaAPI): The API.
+            path_prefix (str): The path prefix of the operations.
+
+        Returns:
+            Path | None: The file or None if documents are not persisted.
+        """
+
+        if self.directory is None:
+            return None
+
+        return self.directory / f"openapi-{api.urls_namespace}-{operations_hash(api, path_prefix)}.json.gz"
+
+    def _load_or_build(self, api: "ExtendedNinjaAPI", path_prefix: str) -> OpenAPIDocument:
+        file = self.path(api, path_prefix)
+        if file is not None:
+            try:
+                gzip_content = file.read_bytes()
+                return OpenAPIDocument.from_content(gzip.decompress(gzip_content), gzip_content=gzip_content)
+            except FileNotFoundError:
+                pass
+            except (OSError, EOFError, gzip.BadGzipFile):
+                logger.warning("Ignoring unreadable OpenAPI document '%s'", file, exc_info=True)
+
+        schema = api.get_openapi_schema(path_prefix=path_prefix)
+        content = json.dumps(schema, cls=NinjaJSONEncoder, ensure_ascii=False, separators=(",", ":")).encode()
+        document = OpenAPIDocument.from_content(content, compresslevel=self.compresslevel)
+
+        if file is not None:
+            self._persist(file, document)
+
+        return document
+
+    def _persist(self, file: Path, document: OpenAPIDocument) -> None:
+        try:
+            file.parent.mkdir(parents=True, exist_ok=True)
+            # written to a temporary file first, so concurrently booting workers never read a partial document
+            descriptor, temporary = tempfile.mkstemp(dir=file.parent, prefix=f".{file.name}.")
+            with os.fdopen(descriptor, "wb") as temporary_file:
+                temporary_file.write(document.gzip_content)
+            Path(temporary).replace(file)
+        except OSError:
+            logger.warning("Could not persist OpenAPI document '%s'", file, exc_info=True)
+
+
+def openapi_json(request: HttpRequest, api: "ExtendedNinjaAPI", **kwargs: Any) -> HttpResponseBase:
+    """Serve the cached OpenAPI document of an API.
+
+    Args:
+        request (HttpRequest): The request.
+        api (ExtendedNinjaAPI): The API.
+        **kwargs: The path parameters of the API root.
+
+    Returns:
+        HttpResponseBase: The response.
+    """
+
+    return api.openapi_cache.document(api, api.get_root_path(kwargs)).response(request)
+
+
+def get_openapi_urls(api: "ExtendedNinjaAPI") -> list[URLPattern]:
+    """Get the OpenAPI and docs URL patterns of an API, serving the OpenAPI document from its cache.
+
+    Args:
+        api (ExtendedNinjaAPI): The API.
+
+    Returns:
+        list[URLPattern]: The URL patterns.
+    """
+
+    result = get_ninja_openapi_urls(api)
+
+    for index, pattern in enumerate(result):
+        if pattern.name == "openapi-json":
+            view = partial(openapi_json, api=api)
+            if api.docs_decorator:
+                view = api.docs_decorator(view)
+            result[index] = path(api.openapi_url.lstrip("/"), view, name="openapi-json")
+
+    return result
@@ -1,14 +1,40 @@
 """Module api.operation."""
 
 from collections.abc import Callable, Sequence
-from typing import Any
+from random import random
+from threading import Lock
+from typing import Any, get_origin
 
-from django.http import HttpRequest
+from asgiref.sync import sync_to_async
+from django.db.models import Manager, Model, QuerySet
+from django.http import HttpRequest, HttpResponse, StreamingHttpResponse
 from django.http.response import HttpResponseBase
+from ninja import Schema
 from ninja.constants import NOT_SET, NOT_SET_TYPE
-from ninja.operation import Operation, PathView
+from ninja.errors import ConfigError
+from ninja.operation import AsyncOperation, Operation, PathView
 from ninja.signature import is_async
+from ninja.signature.details import FuncParam
 from ninja.throttling import BaseThrottle
+from pydantic import TypeAdapter
+
+from ninja_extended.api.adapters import field_annotation, response_adapter
+from ninja_extended.api.cache import ResponseCache
+from ninja_extended.api.conditional import (
+    CONDITIONAL_METHODS,
+    ConditionalGet,
+    ETagFunc,
+    LastModifiedFunc,
+    Validators,
+)
+from ninja_extended.api.errors import ResponseSchemaNotFlatError, ResponseSchemaNotFoundError
+from ninja_extended.api.instrumentation import Timings, phase
+from ninja_extended.api.planner import QueryPlanner, ValuesPlanner, response_item_schema, values_field_map
+from ninja_extended.api.renderers import FastJSONRenderer
+from ninja_extended.api.sparse import SPARSE_FIELDS_ARG, SparseFieldsets
+from ninja_extended.api.streaming import JSONArrayFormat, StreamingSerializer, negotiate_stream_format
+from ninja_extended.api.trusted import Constructor, response_constructor
+from ninja_extended.conf import settings
 
 
 class ExtendedOperation(Operation):
@@ -35,6 +61,15 @@ class ExtendedOperation(Operation):
         include_in_schema: bool = True,
         url_name: str | None = None,
         openapi_extra: dict[str, Any] | None = None,
+        plan_queries: bool = False,
+        values_fast_path: bool = False,
+        sparse_fields: bool = False,
+        streaming_export: bool = False,
+        stream_json_array: bool = False,
+        trusted_response: bool = False,
+        cache: ResponseCache | None = None,
+        etag: ETagFunc | None = None,
+        last_modified: LastModifiedFunc | None = None,
     ) -> None:
         """Initialize an ExtendedOperation.
 
@@ -57,6 +92,15 @@ class ExtendedOperation(Operation):
             include_in_schema (bool, optional): Include the operation in the OpenAPI schema. Defaults to True.
             url_name (str | None, optional): The url name. Defaults to None.
             openapi_extra (dict[str, Any] | None, optional): Extras for the OpenAPI schema. Defaults to None.
+            plan_queries (bool, optional): Plan select_related/prefetch_related/only from the response schema. Defaults to False.
+            values_fast_path (bool, optional): Fetch the rows of returned querysets with values() for a flat response schema and construct the response from them without validation, unless the schema has validators. Defaults to False.
+            sparse_fields (bool, optional): Let clients select a subset of the response schema fields with the fields query parameter. Defaults to False.
+            streaming_export (bool, optional): Stream list results as NDJSON or CSV if the request accepts application/x-ndjson or text/csv. Defaults to False.
+            stream_json_array (bool, optional): Write list responses as a JSON array incrementally from a chunked queryset iterator. Defaults to False.
+            trusted_response (bool, optional): Construct the response without validating it against the response schema. Defaults to False.
+            cache (ResponseCache | None, optional): Cache the rendered responses of GET requests. Defaults to None.
+            etag (ETagFunc | None, optional): Compute the ETag of the result of the view. Defaults to None.
+            last_modified (LastModifiedFunc | None, optional): Compute the Last-Modified datetime of the result of the view. Defaults to None.
         """
         super().__init__(
             path=path,
@@ -85,6 +129,73 @@ class ExtendedOperation(Operation):
         self.tags: list[str]
         self.response = response
 
+        self.response_adapters: dict[Any, TypeAdapter] = {
+            status: response_adapter(field_annotation(response_model.model_fields["response"]))
+            for status, response_model in self.response_models.items()
+            if response_model not in (NOT_SET, None)
+        }
+
+        self.response_cache = cache
+        self.conditional_get = (
+            ConditionalGet(etag=etag, last_modified=last_modified)
+            if etag is not None or last_modified is not None
+            else None
+        )
+
+        self.trusted_response = trusted_response
+        if trusted_response:
+            for response_model in self.response_models.values():
+                if response_model not in (NOT_SET, None):
+                    self.get_response_constructor(response_model)
+
+        requires_schema = plan_queries or values_fast_path or sparse_fields or streaming_export or stream_json_array
+        schema = response_item_schema(response) if requires_schema else None
+        if requires_schema and schema is None:
+            raise ResponseSchemaNotFoundError(operation_id=operation_id)
+
+        self.query_planner: QueryPlanner | None = None
+        if plan_queries:
+            self.query_planner = QueryPlanner(schema=schema)
+
+        self.values_planner: ValuesPlanner | None = None
+        if values_fast_path:
+            field_map = values_field_map(schema)
+            if field_map is None:
+                raise ResponseSchemaNotFlatError(operation_id=operation_id)
+            self.values_planner = ValuesPlanner(field_map=field_map)
+
+        self.sparse_fieldsets: SparseFieldsets | None = None
+        if sparse_fields:
+            self.sparse_fieldsets = SparseFieldsets(schema=schema, values=values_fast_path)
+            self._contribute_sparse_fields_param()
+
+        self.streaming_serializer: StreamingSerializer | None = None
+        if streaming_export or stream_json_array:
+            self.streaming_serializer = StreamingSerializer(
+                schema=schema,
+                by_alias=by_alias,
+                exclude_unset=exclude_unset,
+                exclude_defaults=exclude_defaults,
+                exclude_none=exclude_none,
+            )
+
+        self.streaming_export = streaming_export
+        self.json_array_statuses: frozenset[int] = frozenset()
+        if stream_json_array:
+            self.json_array_statuses = frozenset(
+                status
+                for status, response_model in self.response_models.items()
+                if response_model not in (NOT_SET, None)
+                and get_origin(response_model.model_fields["response"].annotation) is list
+            )
+
+    def _contribute_sparse_fields_param(self) -> None:
+        """Add the query parameter of the sparse field sets to the signature, so it is documented in the OpenAPI schema."""
+
+        source = self.sparse_fieldsets.param_source
+        self.signature.params.append(FuncParam(SPARSE_FIELDS_ARG, source.alias, source, str | None, False))  # noqa: FBT003
+        self.models = self.signature.models = self.signature._create_models()  # noqa: SLF001
+
     def run(self, request: HttpRequest, **kw: Any) -> HttpResponseBase:
         """Run the operation.
 
@@ -96,12 +207,327 @@ class ExtendedOperation(Operation):
             HttpResponseBase: The response.
         """
 
+        timings = self._start(request)
+        if timings is None:
+            return self._run(request, **kw)
+
+        response = None
+        try:
+            response = self._run(request, **kw)
+        finally:
+            if isinstance(response, StreamingHttpResponse):
+                # the body is consumed after the operation returned
+                timings.stream(response)
+            else:
+                timings.finish(response)
+
+        return response
+
+    def _start(self, request: HttpRequest) -> Timings | None:
         request.operation_id = self.operation_id
+        request.timings = None
+        request.validators = None
+        request.values_rows = False
+        if not self.api.instrumentation:
+            return None
+
+        request.timings = Timings(request=request, operation=self, instrumentation=self.api.instrumentation)
+        for instrumentation in self.api.instrumentation:
+            instrumentation.on_start(request, self)
+
+        return request.timings
+
+    def _run(self, request: HttpRequest, **kw: Any) -> HttpResponseBase:
+        error = self._run_checks(request)
+        if error:
+            return error
+
+        cache_key, response = self._lookup_cache(request)
+        if response is not None:
+            return Validators.from_response(response).not_modified(request) or response
+
+        try:
+            temporal_response = self.api.create_temporal_response(request)
+            values = self._get_values(request, kw, temporal_response)
+            with phase(request, "view"):
+                result = self.view_func(request, **values)
+            response = self._result_to_response(request, result, temporal_response)
+        except Exception as e:  # noqa: BLE001
+            if isinstance(e, TypeError) and "required positional argument" in str(e):
+                msg = "Did you fail to use functools.wraps() in a decorator?"
+                msg = f"{e.args[0]}: {msg}" if e.args else msg
+                e.args = (msg, *e.args[1:])
+            return self.api.on_exception(request, e)
+
+        if cache_key is not None:
+            self.response_cache.store(cache_key, response)
+
+        return response
+
+    def _lookup_cache(self, request: HttpRequest) -> tuple[str | None, HttpResponse | None]:
+        if self.response_cache is None:
+            return None, None
+
+        return self.response_cache.lookup(request, self.operation_id)
+
+    def _get_validators(self, request: HttpRequest, status: int, result: Any) -> Validators | None:
+        if self.conditional_get is None or request.method not in CONDITIONAL_METHODS or status != 200:  # noqa: PLR2004
+            return None
+
+        with phase(request, "view"):
+            return self.conditional_get.validators(request, result)
+
+    def _run_authentication(self, request: HttpRequest) -> HttpResponse | None:
+        with phase(request, "auth"):
+            return super()._run_authentication(request)
+
+    def _check_throttles(self, request: HttpRequest) -> HttpResponse | None:
+        with phase(request, "throttle"):
+            return super()._check_throttles(request)
+
+    def _get_values(self, request: HttpRequest, path_params: Any, temporal_response: HttpResponse) -> dict[str, Any]:
+        with phase(request, "params"):
+            values = super()._get_values(request, path_params, temporal_response)
 
-        return super().run(request=request, **kw)
+        values.pop(SPARSE_FIELDS_ARG, None)
 
+        return values
 
-class ExtendedAsyncOperation(ExtendedOperation):
+    def prepare_items(self, request: HttpRequest, items: Any) -> Any:
+        """Prepare the items of a paginated view before they are paginated.
+
+        The ETag and Last-Modified functions get the unpaginated items (e.g. the queryset to aggregate), a conditional
+        request is answered before the page is fetched.
+
+        Args:
+            request (HttpRequest): The request.
+            items (Any): The items returned by the view.
+
+        Returns:
+            Any: The prepared items or the Not Modified response.
+        """
+
+        request.validators = self._get_validators(request, 200, items)
+        if request.validators is not None:
+            response = request.validators.not_modified(request)
+            if response is not None:
+                return response
+
+        return self.prepare_result(request, items)
+
+    def prepare_result(self, request: HttpRequest, result: Any) -> Any:
+        """Prepare the result of the view before it is paginated and serialized.
+
+        Args:
+            request (HttpRequest): The request.
+            result (Any): The result of the view.
+
+        Returns:
+            Any: The prepared result.
+        """
+
+        fieldset = self.sparse_fieldsets.from_request(request) if self.sparse_fieldsets is not None else None
+        values_planner = fieldset.values_planner if fieldset is not None else self.values_planner
+        if values_planner is not None:
+            values = values_planner.apply(result)
+            request.values_rows = values is not result
+            result = values
+        if fieldset is not None:
+            result = fieldset.query_planner.apply(result)
+        elif self.query_planner is not None:
+            result = self.query_planner.apply(result)
+
+        if self.streaming_export and self.streaming_serializer.is_streamable(result):
+            stream_format = negotiate_stream_format(request)
+            if stream_format is not None:
+                return self.streaming_serializer.response(
+                    request,
+                    result,
+                    stream_format,
+                    schema=fieldset.schema if fieldset is not None else None,
+                    renderer=self.api.renderer,
+                    is_async=self.is_async,
+                )
+
+        return result
+
+    def get_response_model(self, request: HttpRequest, status: int) -> type[Schema] | NOT_SET_TYPE | None:
+        """Get the response model for the status of a result.
+
+        Args:
+            request (HttpRequest): The request.
+            status (int): The status.
+
+        Raises:
+            ConfigError: If no response model is set for the status.
+
+        Returns:
+            type[Schema] | NOT_SET_TYPE | None: The response model.
+        """
+
+        if status in self.response_models:
+            response_model = self.response_models[status]
+        elif Ellipsis in self.response_models:
+            response_model = self.response_models[Ellipsis]
+        else:
+            message = f"Schema for status {status} is not set in response {self.response_models.keys()}"
+            raise ConfigError(message)
+
+        if self.sparse_fieldsets is not None and response_model not in (NOT_SET, None) and 200 <= status < 300:  # noqa: PLR2004
+            fieldset = self.sparse_fieldsets.from_request(request)
+            if fieldset is not None:
+                response_model = self.sparse_fieldsets.response_model(response_model, fieldset)
+
+        return response_model
+
+    def get_response_adapter(self, status: int, response_model: type[Schema]) -> TypeAdapter:
+        """Get the TypeAdapter validating and serializing the response for a status.
+
+        The adapters of the response models of the operation are compiled when the operation is created, the adapters
+        of response models restricted to a sparse field set are cached with the field sets.
+
+        Args:
+            status (int): The status.
+            response_model (type[Schema]): The response model returned by get_response_model.
+
+        Returns:
+            TypeAdapter: The adapter.
+        """
+
+        key = status if status in self.response_models else Ellipsis
+        if self.response_models.get(key) is response_model:
+            return self.response_adapters[key]
+
+        if self.sparse_fieldsets is not None:
+            return self.sparse_fieldsets.response_adapter(response_model)
+
+        return response_adapter(field_annotation(response_model.model_fields["response"]))
+
+    def get_response_constructor(self, response_model: type[Schema]) -> Constructor | None:
+        """Get the constructor building a trusted response without validation.
+
+        Args:
+            response_model (type[Schema]): The response model returned by get_response_model.
+
+        Returns:
+            Constructor | None: The constructor or None if the response has to be validated.
+        """
+
+        if response_model not in self.response_models.values() and self.sparse_fieldsets is not None:
+            return self.sparse_fieldsets.response_constructor(response_model)
+
+        return response_constructor(field_annotation(response_model.model_fields["response"]))
+
+    def _status_and_body(self, result: Any) -> tuple[int, Any]:
+        status: int = 200
+        if len(self.response_models) == 1:
+            status = next(iter(self.response_models))
+
+        if isinstance(result, tuple) and len(result) == 2:  # noqa: PLR2004
+            status, result = result
+
+        return status, result
+
+    def _stream_json_array(self, request: HttpRequest, status: int, result: Any) -> HttpResponseBase | None:
+        if status not in self.json_array_statuses or not self.streaming_serializer.is_streamable(result):
+            return None
+
+        fieldset = self.sparse_fieldsets.from_request(request) if self.sparse_fieldsets is not None else None
+        response = self.streaming_serializer.response(
+            request,
+            result,
+            JSONArrayFormat(),
+            schema=fieldset.schema if fieldset is not None else None,
+            renderer=self.api.renderer,
+            is_async=self.is_async,
+        )
+        response.status_code = status
+
+        return response
+
+    def _render_result(
+        self, request: HttpRequest, status: int, result: Any, temporal_response: HttpResponse
+    ) -> HttpResponseBase:
+        response_model = self.get_response_model(request, status)
+
+        temporal_response.status_code = status
+
+        if response_model is NOT_SET:
+            return self.api.create_response(request, result, temporal_response=temporal_response)
+
+        if response_model is None:
+            return temporal_response
+
+        if isinstance(result, Manager | QuerySet):
+            with phase(request, "view"):
+                result = list(result.all() if isinstance(result, Manager) else result)
+
+        adapter = self.get_response_adapter(status, response_model)
+        context = {"request": request, "response_status": status}
+        # values() rows of a flat schema are trusted like trusted responses, the constructor is None (and the rows are
+        # validated) if the schema has validators
+        trusted = self.trusted_response or getattr(request, "values_rows", False)
+        constructor = self.get_response_constructor(response_model) if trusted else None
+        with phase(request, "serialization"):
+            if constructor is not None and random() >= settings.TRUSTED_RESPONSE_VALIDATION_RATE:  # noqa: S311
+                validated = constructor(result, context)
+            else:
+                validated = adapter.validate_python(result, context=context)
+        dump_kwargs = {
+            "by_alias": self.by_alias,
+            "exclude_unset": self.exclude_unset,
+            "exclude_defaults": self.exclude_defaults,
+            "exclude_none": self.exclude_none,
+            "context": context,
+        }
+
+        with phase(request, "rendering"):
+            if isinstance(self.api.renderer, FastJSONRenderer):
+                temporal_response.content = self.api.renderer.render_validated(
+                    request, adapter, validated, response_status=status, **dump_kwargs
+                )
+                return temporal_response
+
+            result = adapter.dump_python(validated, **dump_kwargs)
+
+            return self.api.create_response(request, result, temporal_response=temporal_response)
+
+    def _result_to_response(
+        self, request: HttpRequest, result: Any, temporal_response: HttpResponse
+    ) -> HttpResponseBase:
+        if isinstance(result, HttpResponseBase):
+            return result
+
+        status, result = self._status_and_body(result)
+
+        # the validators of paginated views are computed from the items before they are paginated
+        validators = getattr(request, "validators", None) or self._get_validators(request, status, result)
+        if validators is not None:
+            response = validators.not_modified(request)
+            if response is not None:
+                return response
+
+        response = self._body_to_response(request, status, result, temporal_response)
+        if validators is not None:
+            validators.set_headers(response)
+
+        return response
+
+    def _body_to_response(
+        self, request: HttpRequest, status: int, result: Any, temporal_response: HttpResponse
+    ) -> HttpResponseBase:
+        result = self.prepare_result(request, result)
+        if isinstance(result, HttpResponseBase):
+            return result
+
+        response = self._stream_json_array(request, status, result)
+        if response is not None:
+            return response
+
+        return self._render_result(request, status, result, temporal_response)
+
+
+class ExtendedAsyncOperation(ExtendedOperation, AsyncOperation):
     """Extended Async Operation."""
 
     def __init__(  # noqa: PLR0913
@@ -125,6 +551,15 @@ class ExtendedAsyncOperation(ExtendedOperation):
         include_in_schema: bool = True,
         url_name: str | None = None,
         openapi_extra: dict[str, Any] | None = None,
+        plan_queries: bool = False,
+        values_fast_path: bool = False,
+        sparse_fields: bool = False,
+        streaming_export: bool = False,
+        stream_json_array: bool = False,
+        trusted_response: bool = False,
+        cache: ResponseCache | None = None,
+        etag: ETagFunc | None = None,
+        last_modified: LastModifiedFunc | None = None,
     ) -> None:
         """Initialize an ExtendedOperation.
 
@@ -147,6 +582,15 @@ class ExtendedAsyncOperation(ExtendedOperation):
             include_in_schema (bool, optional): Include the operation in the OpenAPI schema. Defaults to True.
             url_name (str | None, optional): The url name. Defaults to None.
             openapi_extra (dict[str, Any] | None, optional): Extras for the OpenAPI schema. Defaults to None.
+            plan_queries (bool, optional): Plan select_related/prefetch_related/only from the response schema. Defaults to False.
+            values_fast_path (bool, optional): Fetch the rows of returned querysets with values() for a flat response schema and construct the response from them without validation, unless the schema has validators. Defaults to False.
+            sparse_fields (bool, optional): Let clients select a subset of the response schema fields with the fields query parameter. Defaults to False.
+            streaming_export (bool, optional): Stream list results as NDJSON or CSV if the request accepts application/x-ndjson or text/csv. Defaults to False.
+            stream_json_array (bool, optional): Write list responses as a JSON array incrementally from a chunked queryset iterator. Defaults to False.
+            trusted_response (bool, optional): Construct the response without validating it against the response schema. Defaults to False.
+            cache (ResponseCache | None, optional): Cache the rendered responses of GET requests. Defaults to None.
+            etag (ETagFunc | None, optional): Compute the ETag of the result of the view. Defaults to None.
+            last_modified (LastModifiedFunc | None, optional): Compute the Last-Modified datetime of the result of the view. Defaults to None.
         """
         super().__init__(
             path=path,
@@ -167,6 +611,15 @@ class ExtendedAsyncOperation(ExtendedOperation):
             include_in_schema=include_in_schema,
             url_name=url_name,
             openapi_extra=openapi_extra,
+            plan_queries=plan_queries,
+            values_fast_path=values_fast_path,
+            sparse_fields=sparse_fields,
+            streaming_export=streaming_export,
+            stream_json_array=stream_json_array,
+            trusted_response=trusted_response,
+            cache=cache,
+            etag=etag,
+            last_modified=last_modified,
         )
 
         self.is_async = True
@@ -174,6 +627,9 @@ class ExtendedAsyncOperation(ExtendedOperation):
     async def run(self, request: HttpRequest, **kw: Any) -> HttpResponseBase:
         """Run the operation.
 
+        Async auth callbacks, the view, the pagination and the evaluation of the result are awaited, only the
+        validation and rendering of the evaluated result run synchronously.
+
         Args:
             request (HttpRequest): The request.
             **kw: Additional keyword arguments.
@@ -182,9 +638,209 @@ class ExtendedAsyncOperation(ExtendedOperation):
             HttpResponseBase: The response.
         """
 
-        request.operation_id = self.operation_id
+        timings = self._start(request)
+        if timings is None:
+            return await self._arun(request, **kw)
+
+        response = None
+        try:
+            response = await self._arun(request, **kw)
+        finally:
+            if isinstance(response, StreamingHttpResponse):
+                # the body is consumed after the operation returned
+                timings.stream(response)
+            else:
+                timings.finish(response)
+
+        return response
+
+    async def _arun(self, request: HttpRequest, **kw: Any) -> HttpResponseBase:
+        error = await self._run_checks(request)
+        if error:
+            return error
+
+        cache_key, response = await self._alookup_cache(request)
+        if response is not None:
+            return Validators.from_response(response).not_modified(request) or response
 
-        return super().run(request, **kw)
+        try:
+            temporal_response = self.api.create_temporal_response(request)
+            values = self._get_values(request, kw, temporal_response)
+            with phase(request, "view"):
+                result = await self.view_func(request, **values)
+            response = await self._aresult_to_response(request, result, temporal_response)
+        except Exception as e:  # noqa: BLE001
+            return self.api.on_exception(request, e)
+
+        if cache_key is not None:
+            await self.response_cache.astore(cache_key, response)
+
+        return response
+
+    async def _alookup_cache(self, request: HttpRequest) -> tuple[str | None, HttpResponse | None]:
+        if self.response_cache is None:
+            return None, None
+
+        return await self.response_cache.alookup(request, self.operation_id)
+
+    async def _run_authentication(self, request: HttpRequest) -> HttpResponse | None:
+        with phase(request, "auth"):
+            return await AsyncOperation._run_authentication(self, request)  # noqa: SLF001
+
+    async def aprepare_items(self, request: HttpRequest, items: Any) -> Any:
+        """Prepare the items of a paginated view before they are paginated (async).
+
+        Args:
+            request (HttpRequest): The request.
+            items (Any): The items returned by the view.
+
+        Returns:
+            Any: The prepared items or the Not Modified response.
+        """
+
+        if self.conditional_get is not None:
+            request.validators = await sync_to_async(self._get_validators)(request, 200, items)
+            if request.validators is not None:
+                response = request.validators.not_modified(request)
+                if response is not None:
+                    return response
+
+        return self.prepare_result(request, items)
+
+    async def _aresult_to_response(
+        self, request: HttpRequest, result: Any, temporal_response: HttpResponse
+    ) -> HttpResponseBase:
+        if isinstance(result, HttpResponseBase):
+            return result
+
+        status, result = self._status_and_body(result)
+
+        # the validators of paginated views are computed from the items before they are paginated
+        validators = getattr(request, "validators", None)
+        if validators is None and self.conditional_get is not None:
+            validators = await sync_to_async(self._get_validators)(request, status, result)
+        if validators is not None:
+            response = validators.not_modified(request)
+            if response is not None:
+                return response
+
+        response = await self._abody_to_response(request, status, result, temporal_response)
+        if validators is not None:
+            validators.set_headers(response)
+
+        return response
+
+    async def _abody_to_response(
+        self, request: HttpRequest, status: int, result: Any, temporal_response: HttpResponse
+    ) -> HttpResponseBase:
+        if isinstance(result, Model):
+            # prefetching the relations of a model instance queries the database
+            result = await sync_to_async(self.prepare_result)(request, result)
+        else:
+            result = self.prepare_result(request, result)
+        if isinstance(result, HttpResponseBase):
+            return result
+
+        response = self._stream_json_array(request, status, result)
+        if response is not None:
+            return response
+
+        if isinstance(result, QuerySet):
+            with phase(request, "view"):
+                result = [item async for item in result]
+
+        return self._render_result(request, status, result, temporal_response)
+
+
+class LazyOperation:
+    """An operation that is compiled on first use.
+
+    Only the registration arguments are stored, the operation (with its view signature and the pydantic models of the
+    parameters and responses) is built on the first request, on the first access to an attribute that is not known
+    from the registration arguments (e.g. during the OpenAPI schema generation) or on an explicit warmup.
+    """
+
+    def __init__(self, operation_class: type["ExtendedOperation"], kwargs: dict[str, Any]) -> None:
+        """Initialize a LazyOperation.
+
+        Args:
+            operation_class (type[ExtendedOperation]): The class of the operation.
+            kwargs (dict[str, Any]): The arguments of the operation.
+        """
+
+        self._operation: ExtendedOperation | None = None
+        self._api_instances: list[tuple[Any, Any]] = []
+        self._lock = Lock()
+        self.operation_class = operation_class
+        self.kwargs = kwargs
+        self.path: str = kwargs["path"]
+        self.methods: list[str] = kwargs["methods"]
+        self.operation_id: str = kwargs["operation_id"]
+        self.view_func: Callable = kwargs["view_func"]
+        self.url_name: str | None = kwargs["url_name"]
+        self.is_async = issubclass(operation_class, ExtendedAsyncOperation)
+
+    @property
+    def is_compiled(self) -> bool:
+        """Check if the operation is compiled."""
+
+        return self._operation is not None
+
+    def compile(self) -> "ExtendedOperation":
+        """Build the operation (once).
+
+        Returns:
+            ExtendedOperation: The operation.
+        """
+
+        operation = self._operation
+        if operation is None:
+            with self._lock:
+                if self._operation is None:
+                    operation = self.operation_class(**self.kwargs)
+                    for api, router in self._api_instances:
+                        operation.set_api_instance(api, router)
+                    self._operation = operation
+                operation = self._operation
+
+        return operation
+
+    def set_api_instance(self, api: Any, router: Any) -> None:
+        """Set the API and router of the operation, replayed on compilation.
+
+        Args:
+            api (Any): The API.
+            router (Any): The router.
+        """
+
+        with self._lock:
+            if self._operation is None:
+                self._api_instances.append((api, router))
+                return
+
+        self._operation.set_api_instance(api, router)
+
+    def run(self, request: HttpRequest, *args: Any, **kwargs: Any) -> Any:
+        """Run the operation, compiling it first if needed.
+
+        Args:
+            request (HttpRequest): The request.
+            *args: Additional arguments.
+            **kwargs: Additional keyword arguments.
+
+        Returns:
+            Any: The response, awaitable for async operations.
+        """
+
+        return self.compile().run(request, *args, **kwargs)
+
+    def __getattr__(self, name: str) -> Any:
+        """Get an attribute of the compiled operation."""
+
+        if name.startswith("_"):
+            raise AttributeError(name)
+
+        return getattr(self.compile(), name)
 
 
 class ExtendedPathView(PathView):
@@ -195,7 +851,7 @@ class ExtendedPathView(PathView):
 
         super().__init__()
 
-        self.operations: list[ExtendedOperation] = []
+        self.operations: list[ExtendedOperation | LazyOperation] = []
 
     def add_operation(  # noqa: PLR0913
         self,
@@ -218,7 +874,17 @@ class ExtendedPathView(PathView):
         url_name: str | None = None,
         include_in_schema: bool = True,
         openapi_extra: dict[str, Any] | None = None,
-    ) -> Operation:
+        plan_queries: bool = False,
+        values_fast_path: bool = False,
+        sparse_fields: bool = False,
+        streaming_export: bool = False,
+        stream_json_array: bool = False,
+        trusted_response: bool = False,
+        cache: ResponseCache | None = None,
+        etag: ETagFunc | None = None,
+        last_modified: LastModifiedFunc | None = None,
+        lazy: bool = False,
+    ) -> ExtendedOperation | LazyOperation:
         """Add an operation.
 
         Args:
@@ -240,9 +906,19 @@ class ExtendedPathView(PathView):
             url_name (str | None, optional): The url name. Defaults to None.
             include_in_schema (bool, optional): Include the operation in the OpenAPI schema. Defaults to True.
             openapi_extra (dict[str, Any] | None, optional): Extras for the OpenAPI schema. Defaults to None.
+            plan_queries (bool, optional): Plan select_related/prefetch_related/only from the response schema. Defaults to False.
+            values_fast_path (bool, optional): Fetch the rows of returned querysets with values() for a flat response schema and construct the response from them without validation, unless the schema has validators. Defaults to False.
+            sparse_fields (bool, optional): Let clients select a subset of the response schema fields with the fields query parameter. Defaults to False.
+            streaming_export (bool, optional): Stream list results as NDJSON or CSV if the request accepts application/x-ndjson or text/csv. Defaults to False.
+            stream_json_array (bool, optional): Write list responses as a JSON array incrementally from a chunked queryset iterator. Defaults to False.
+            trusted_response (bool, optional): Construct the response without validating it against the response schema. Defaults to False.
+            cache (ResponseCache | None, optional): Cache the rendered responses of GET requests. Defaults to None.
+            etag (ETagFunc | None, optional): Compute the ETag of the result of the view. Defaults to None.
+            last_modified (LastModifiedFunc | None, optional): Compute the Last-Modified datetime of the result of the view. Defaults to None.
+            lazy (bool, optional): Build the operation on first use. Defaults to False.
 
         Returns:
-            Operation: _description_
+            ExtendedOperation | LazyOperation: The operation.
         """
         if url_name:
             self.url_name = url_name
@@ -252,26 +928,36 @@ class ExtendedPathView(PathView):
             self.is_async = True
             operation_class = ExtendedAsyncOperation
 
-        operation = operation_class(
-            path=path,
-            operation_id=operation_id,
-            summary=summary,
-            description=description,
-            tags=tags,
-            methods=methods,
-            view_func=view_func,
-            auth=auth,
-            throttle=throttle,
-            response=response,
-            deprecated=deprecated,
-            by_alias=by_alias,
-            exclude_unset=exclude_unset,
-            exclude_defaults=exclude_defaults,
-            exclude_none=exclude_none,
-            include_in_schema=include_in_schema,
-            url_name=url_name,
-            openapi_extra=openapi_extra,
-        )
+        kwargs: dict[str, Any] = {
+            "path": path,
+            "operation_id": operation_id,
+            "summary": summary,
+            "description": description,
+            "tags": tags,
+            "methods": methods,
+            "view_func": view_func,
+            "auth": auth,
+            "throttle": throttle,
+            "response": response,
+            "deprecated": deprecated,
+            "by_alias": by_alias,
+            "exclude_unset": exclude_unset,
+            "exclude_defaults": exclude_defaults,
+            "exclude_none": exclude_none,
+            "include_in_schema": include_in_schema,
+            "url_name": url_name,
+            "openapi_extra": openapi_extra,
+            "plan_queries": plan_queries,
+            "values_fast_path": values_fast_path,
+            "sparse_fields": sparse_fields,
+            "streaming_export": streaming_export,
+            "stream_json_array": stream_json_array,
+            "trusted_response": trusted_response,
+            "cache": cache,
+            "etag": etag,
+            "last_modified": last_modified,
+        }
+        operation = LazyOperation(operation_class, kwargs) if lazy else operation_class(**kwargs)
 
         self.operations.append(operation)
         view_func._ninja_operation = operation  # noqa: SLF001
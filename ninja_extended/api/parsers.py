@@ -0,0 +1,32 @@
+"""Module api.parsers."""
+
+import json
+from typing import cast
+
+from django.http import HttpRequest
+from ninja.parser import Parser
+from ninja.types import DictStrAny
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
+
+class FastParser(Parser):
+    """JSON parser using orjson if it is installed and the stdlib otherwise."""
+
+    def parse_body(self, request: HttpRequest) -> DictStrAny:
+        """Parse the JSON body of a request.
+
+        Args:
+            request (HttpRequest): The request.
+
+        Returns:
+            DictStrAny: The parsed body.
+        """
+
+        if orjson is not None:
+            return cast(DictStrAny, orjson.loads(request.body))
+
+        return cast(DictStrAny, json.loads(request.body))
@@ -0,0 +1,283 @@
+"""Module api.planner."""
+
+from types import UnionType
+from typing import Any, NamedTuple, Union, get_args, get_origin
+
+from django.core.exceptions import FieldDoesNotExist
+from django.db.models import Model, Prefetch, QuerySet, prefetch_related_objects
+from ninja import Schema
+from ninja.constants import NOT_SET
+
+
+def _nested_schema(annotation: Any) -> type[Schema] | None:
+    """Get the schema nested in an annotation like ``Schema``, ``Schema | None`` or ``list[Schema]``.
+
+    Args:
+        annotation (Any): The annotation.
+
+    Returns:
+        type[Schema] | None: The nested schema or None if the annotation does not contain a schema.
+    """
+
+    if isinstance(annotation, type) and issubclass(annotation, Schema):
+        return annotation
+
+    if get_origin(annotation) in (Union, UnionType, list, tuple, set, frozenset):
+        for arg in get_args(annotation):
+            schema = _nested_schema(arg)
+            if schema is not None:
+                return schema
+
+    return None
+
+
+def response_item_schema(response: Any) -> type[Schema] | None:
+    """Get the schema of the (list) items of the successful response of an operation.
+
+    Args:
+        response (Any): The response of the operation, e.g. created with response_factory.
+
+    Returns:
+        type[Schema] | None: The schema or None if the successful response is not a schema.
+    """
+
+    if response is NOT_SET or response is None:
+        return None
+
+    if isinstance(response, dict):
+        for status in sorted(status for status in response if isinstance(status, int)):
+            if 200 <= status < 300:  # noqa: PLR2004
+                return _nested_schema(response[status])
+
+        return None
+
+    return _nested_schema(response)
+
+
+class QueryPlan(NamedTuple):
+    """The select_related, prefetch_related and only arguments for a queryset."""
+
+    select_related: tuple[str, ...] = ()
+    prefetch_related: tuple[Prefetch, ...] = ()
+    only: tuple[str, ...] | None = None
+
+    def apply(self, queryset: QuerySet) -> QuerySet:
+        """Apply the plan to a queryset.
+
+        Args:
+            queryset (QuerySet): The queryset.
+
+        Returns:
+            QuerySet: The planned queryset.
+        """
+
+        if queryset._fields is not None:
+            # values() querysets select their columns themselves
+            return queryset
+
+        if self.select_related:
+            queryset = queryset.select_related(*self.select_related)
+        if self.prefetch_related:
+            queryset = queryset.prefetch_related(*self.prefetch_related)
+        if self.only is not None and queryset.query.deferred_loading == (frozenset(), True):
+            queryset = queryset.only(*self.only)
+
+        return queryset
+
+
+class QueryPlanner:
+    """Plan select_related/prefetch_related/only for the querysets serialized against a response schema.
+
+    The plan is derived from the schema fields: nested schemas for forward and reverse one-to-one and foreign key
+    relations are joined with select_related, nested lists for reverse foreign keys and many-to-many relations are
+    prefetched (planned recursively) and only the columns used by the schema are loaded. Fields backed by resolvers or
+    properties disable the column restriction of their model. Plans are computed once per model and cached.
+    """
+
+    def __init__(self, schema: type[Schema]):
+        """Initialize a QueryPlanner.
+
+        Args:
+            schema (type[Schema]): The schema the querysets are serialized against.
+        """
+
+        self.schema = schema
+        self._plans: dict[type[Model], QueryPlan] = {}
+
+    def plan(self, model: type[Model]) -> QueryPlan:
+        """Get the plan for a model.
+
+        Args:
+            model (type[Model]): The model.
+
+        Returns:
+            QueryPlan: The plan.
+        """
+
+        if model not in self._plans:
+            self._plans[model] = self._build(self.schema, model)
+
+        return self._plans[model]
+
+    def apply(self, result: Any) -> Any:
+        """Apply the plan to the result of an operation.
+
+        Querysets are planned before they are evaluated, already fetched model instances get their relations
+        prefetched.
+
+        Args:
+            result (Any): The result.
+
+        Returns:
+            Any: The planned result.
+        """
+
+        if isinstance(result, QuerySet):
+            return self.plan(result.model).apply(result)
+
+        if isinstance(result, Model):
+            plan = self.plan(type(result))
+            lookups = [*plan.select_related, *plan.prefetch_related]
+            if lookups:
+                prefetch_related_objects([result], *lookups)
+
+        return result
+
+    def _build(self, schema: type[Schema], model: type[Model]) -> QueryPlan:
+        select_related: list[str] = []
+        prefetch_related: list[Prefetch] = []
+        only: list[str] | None = [model._meta.pk.name]  # noqa: SLF001
+
+        for name, field in schema.model_fields.items():
+            source = field.validation_alias if isinstance(field.validation_alias, str) else field.alias or name
+            attribute, *path = source.split(".")
+
+            if hasattr(schema, f"resolve_{name}"):
+                only = None
+                continue
+
+            try:
+                model_field = model._meta.get_field(attribute)  # noqa: SLF001
+            except FieldDoesNotExist:
+                only = None
+                continue
+
+            if not model_field.is_relation:
+                if only is not None and attribute not in only:
+                    only.append(attribute)
+                continue
+
+            nested = _nested_schema(field.annotation)
+            related_model = model_field.related_model
+            child = self._build(nested, related_model) if nested is not None and not path else QueryPlan()
+
+            if model_field.many_to_many or model_field.one_to_many:
+                queryset = child._replace(only=None).apply(related_model._default_manager.all())  # noqa: SLF001
+                if model_field.one_to_many and child.only is not None:
+                    queryset = queryset.only(*child.only, model_field.field.name)
+                prefetch_related.append(Prefetch(attribute, queryset=queryset))
+                continue
+
+            if model_field.concrete and only is not None:
+                only.append(attribute)
+                if child.only is not None:
+                    only.extend(f"{attribute}__{column}" for column in child.only)
+
+            select_related.append(attribute)
+            select_related.extend(f"{attribute}__{lookup}" for lookup in child.select_related)
+            prefetch_related.extend(
+                Prefetch(f"{attribute}__{prefetch.prefetch_through}", queryset=prefetch.queryset)
+                for prefetch in child.prefetch_related
+            )
+
+        return QueryPlan(
+            select_related=tuple(select_related),
+            prefetch_related=tuple(prefetch_related),
+            only=tuple(only) if only is not None else None,
+        )
+
+
+def values_field_map(schema: type[Schema]) -> dict[str, str] | None:
+    """Get the model columns of the fields of a flat schema.
+
+    A schema is flat if its fields neither use resolvers, nested schemas nor dotted sources.
+
+    Args:
+        schema (type[Schema]): The schema.
+
+    Returns:
+        dict[str, str] | None: The map from the schema field names to the model columns or None if the schema is not
+            flat.
+    """
+
+    field_map: dict[str, str] = {}
+
+    for name, field in schema.model_fields.items():
+        source = field.validation_alias if isinstance(field.validation_alias, str) else field.alias or name
+
+        if hasattr(schema, f"resolve_{name}") or "." in source or _nested_schema(field.annotation) is not None:
+            return None
+
+        field_map[name] = source
+
+    return field_map
+
+
+class ValuesPlanner:
+    """Fetch the rows of querysets serialized against a flat response schema with values().
+
+    The rows are plain dicts keyed by the columns of the field map, the response is constructed from them without
+    building model instances and without validation (like a trusted response). The rows are validated if the schema
+    (or the sparse schema of the request) has field or model validators. Querysets of models that do not provide all
+    columns as concrete fields are left unchanged and validated, the check is done once per model and cached.
+    """
+
+    def __init__(self, field_map: dict[str, str]):
+        """Initialize a ValuesPlanner.
+
+        Args:
+            field_map (dict[str, str]): The map from the schema field names to the model columns.
+        """
+
+        self.field_map = field_map
+        self.columns = tuple(dict.fromkeys(field_map.values()))
+        self._models: dict[type[Model], bool] = {}
+
+    def supports(self, model: type[Model]) -> bool:
+        """Check if all columns are concrete fields of a model.
+
+        Args:
+            model (type[Model]): The model.
+
+        Returns:
+            bool: If the model supports the values() fast path.
+        """
+
+        if model not in self._models:
+            self._models[model] = all(self._is_column(model, column) for column in self.columns)
+
+        return self._models[model]
+
+    @staticmethod
+    def _is_column(model: type[Model], column: str) -> bool:
+        try:
+            model_field = model._meta.get_field(column)  # noqa: SLF001
+        except FieldDoesNotExist:
+            return False
+
+        return model_field.concrete and not model_field.many_to_many
+
+    def apply(self, result: Any) -> Any:
+        """Switch a queryset result to values() rows.
+
+        Args:
+            result (Any): The result.
+
+        Returns:
+            Any: The values() queryset or the unchanged result.
+        """
+
+        if isinstance(result, QuerySet) and result._fields is None and self.supports(result.model):
+            return result.values(*self.columns)
+
+        return result
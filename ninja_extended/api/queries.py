@@ -0,0 +1,269 @@
+"""Module api.queries."""
+
+# ruff: noqa: ARG002
+
+import logging
+import re
+from collections import Counter
+from collections.abc import Callable
+from contextvars import ContextVar, Token
+from threading import Lock
+from time import perf_counter
+from typing import TYPE_CHECKING, Any
+
+from django.db import connections
+from django.db.backends.base.base import BaseDatabaseWrapper
+from django.db.backends.signals import connection_created
+from django.http import HttpRequest
+from django.http.response import HttpResponseBase
+
+from ninja_extended.api.instrumentation import Instrumentation, Timings
+from ninja_extended.conf import settings
+
+if TYPE_CHECKING:
+    from ninja_extended.api.operation import ExtendedOperation
+
+logger = logging.getLogger(__name__)
+
+_WHITESPACE = re.compile(r"\s+")
+_IN_PLACEHOLDERS = re.compile(r"\bIN \((?:%s, )*%s\)", re.IGNORECASE)
+
+
+def fingerprint(sql: str) -> str:
+    """Get the fingerprint of a query, equal for queries differing only in their parameters.
+
+    Args:
+        sql (str): The SQL with placeholders for the parameters.
+
+    Returns:
+        str: The fingerprint.
+    """
+
+    return _IN_PLACEHOLDERS.sub("IN (...)", _WHITESPACE.sub(" ", sql).strip())
+
+
+class QueryRecord:
+    """The queries executed during a single request."""
+
+    __slots__ = ("count", "duration", "fingerprints")
+
+    def __init__(self) -> None:
+        """Initialize a QueryRecord."""
+
+        self.count = 0
+        self.duration = 0.0
+        self.fingerprints: Counter[str] = Counter()
+
+    def add(self, sql: str, duration: float) -> None:
+        """Add an executed query.
+
+        Args:
+            sql (str): The SQL.
+            duration (float): The duration in seconds.
+        """
+
+        self.count += 1
+        self.duration += duration
+        self.fingerprints[fingerprint(sql)] += 1
+
+    @property
+    def duplicates(self) -> dict[str, int]:
+        """The fingerprints of queries executed more than once with their number of executions."""
+
+        return {sql: count for sql, count in self.fingerprints.items() if count > 1}
+
+
+_records: ContextVar[tuple[QueryRecord, ...]] = ContextVar("ninja_extended_query_records", default=())
+
+
+def _execute_wrapper(execute: Callable, sql: str, params: Any, many: bool, context: dict[str, Any]) -> Any:  # noqa: FBT001
+    records = _records.get()
+    if not records:
+        return execute(sql, params, many, context)
+
+    start = perf_counter()
+    try:
+        return execute(sql, params, many, context)
+    finally:
+        duration = perf_counter() - start
+        for record in records:
+            record.add(sql, duration)
+
+
+def install_execute_wrapper(connection: BaseDatabaseWrapper, **kwargs: Any) -> None:  # noqa: ARG001
+    """Install the execute wrapper recording queries on a database connection (once).
+
+    The wrapper stays installed and only records queries while a request of an instrumented operation runs in the
+    current context, which also covers queries of async operations executed in other threads by ``sync_to_async``.
+
+    Args:
+        connection (BaseDatabaseWrapper): The connection.
+        **kwargs: The additional arguments of the connection_created signal.
+    """
+
+    if _execute_wrapper not in connection.execute_wrappers:
+        connection.execute_wrappers.append(_execute_wrapper)
+
+
+class QueryStats:
+    """The queries executed by all requests of an operation.
+
+    The duplicates count the repeated executions of the same query within a request, e.g. ``n`` for an N+1 query.
+    """
+
+    __slots__ = ("duplicates", "duration", "max_queries", "queries", "requests")
+
+    def __init__(self) -> None:
+        """Initialize QueryStats."""
+
+        self.requests = 0
+        self.queries = 0
+        self.duration = 0.0
+        self.max_queries = 0
+        self.duplicates: Counter[str] = Counter()
+
+    def add(self, record: QueryRecord) -> None:
+        """Add the queries of a request.
+
+        Args:
+            record (QueryRecord): The queries of the request.
+        """
+
+        self.requests += 1
+        self.queries += record.count
+        self.duration += record.duration
+        self.max_queries = max(self.max_queries, record.count)
+        self.duplicates.update({sql: count - 1 for sql, count in record.duplicates.items()})
+
+    def to_dict(self) -> dict[str, Any]:
+        """Get the stats as dict.
+
+        Returns:
+            dict[str, Any]: The stats.
+        """
+
+        return {
+            "requests": self.requests,
+            "queries": self.queries,
+            "duration": self.duration,
+            "max_queries": self.max_queries,
+            "duplicates": dict(self.duplicates),
+        }
+
+
+class QueryAccounting(Instrumentation):
+    """Count the queries, their total duration and duplicated queries (N+1) per operation id.
+
+    Queries are recorded with an execute wrapper on the database connections. Requests executing more queries than
+    the query budget of their operation are logged as warning together with their duplicated queries.
+    """
+
+    def __init__(self, budget: int | None = None, budgets: dict[str, int] | None = None) -> None:
+        """Initialize QueryAccounting.
+
+        Args:
+            budget (int | None, optional): The query budget of all operations. Defaults to the setting
+                NINJA_EXTENDED_QUERY_BUDGET (no budget).
+            budgets (dict[str, int] | None, optional): The query budgets per operation id. Defaults to None.
+        """
+
+        self.budget = budget if budget is not None else settings.QUERY_BUDGET
+        self.budgets = budgets or {}
+        self.stats: dict[str, QueryStats] = {}
+        self._lock = Lock()
+        # the tokens are None while the request is suspended
+        self._tokens: dict[HttpRequest, Token[tuple[QueryRecord, ...]] | None] = {}
+
+        connection_created.connect(install_execute_wrapper, dispatch_uid="ninja_extended_query_accounting")
+
+    def on_start(self, request: HttpRequest, operation: "ExtendedOperation") -> None:
+        """Start recording the queries of the request.
+
+        Args:
+            request (HttpRequest): The request.
+            operation (ExtendedOperation): The operation.
+        """
+
+        for connection in connections.all():
+            install_execute_wrapper(connection)
+
+        if not isinstance(getattr(request, "queries", None), QueryRecord):
+            # the record is shared with other query accounting of the same API
+            request.queries = QueryRecord()
+            self._tokens[request] = _records.set((*_records.get(), request.queries))
+
+    def on_suspend(self, request: HttpRequest, operation: "ExtendedOperation") -> None:
+        """Pause recording the queries of the request.
+
+        Args:
+            request (HttpRequest): The request.
+            operation (ExtendedOperation): The operation.
+        """
+
+        token = self._tokens.get(request)
+        if token is not None:
+            _records.reset(token)
+            self._tokens[request] = None
+
+    def on_resume(self, request: HttpRequest, operation: "ExtendedOperation") -> None:
+        """Resume recording the queries of the request, e.g. of its streamed body.
+
+        Args:
+            request (HttpRequest): The request.
+            operation (ExtendedOperation): The operation.
+        """
+
+        if request in self._tokens:
+            for connection in connections.all():
+                install_execute_wrapper(connection)
+            self._tokens[request] = _records.set((*_records.get(), request.queries))
+
+    def on_finish(
+        self, request: HttpRequest, operation: "ExtendedOperation", response: HttpResponseBase | None, timings: Timings
+    ) -> None:
+        """Stop recording the queries of the request and add them to the stats of its operation.
+
+        Args:
+            request (HttpRequest): The request.
+            operation (ExtendedOperation): The operation.
+            response (HttpResponseBase | None): The response or None if the operation raised an exception.
+            timings (Timings): The timings of the request.
+        """
+
+        token = self._tokens.pop(request, None)
+        if token is not None:
+            _records.reset(token)
+
+        record: QueryRecord = request.queries
+
+        with self._lock:
+            stats = self.stats.get(operation.operation_id)
+            if stats is None:
+                stats = self.stats[operation.operation_id] = QueryStats()
+            stats.add(record)
+
+        budget = self.budgets.get(operation.operation_id, self.budget)
+        if budget is not None and record.count > budget:
+            logger.warning(
+                "Operation '%s' executed %d queries exceeding its budget of %d queries, duplicated queries: %s",
+                operation.operation_id,
+                record.count,
+                budget,
+                record.duplicates,
+            )
+
+    def snapshot(self) -> dict[str, dict[str, Any]]:
+        """Get a copy of the stats of all operations.
+
+        Returns:
+            dict[str, dict[str, Any]]: The stats per operation id.
+        """
+
+        with self._lock:
+            return {operation_id: stats.to_dict() for operation_id, stats in self.stats.items()}
+
+    def reset(self) -> None:
+        """Remove the stats of all operations."""
+
+        with self._lock:
+            self.stats.clear()
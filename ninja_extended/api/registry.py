@@ -1,9 +1,13 @@
 """Operation id registries for router and API."""
 
+from collections.abc import Iterator
+from contextlib import contextmanager
 from typing import ClassVar
+from weakref import WeakKeyDictionary
 
 from ninja import NinjaAPI, Router
 
+from ninja_extended.api.adapters import clear_response_adapters
 from ninja_extended.api.errors import (
     APIAlreadyRegisteredError,
     APINotRegisteredError,
@@ -12,12 +16,37 @@ from ninja_extended.api.errors import (
     RouterAlreadyRegisteredError,
     RouterNotRegisteredError,
 )
+from ninja_extended.api.trusted import clear_response_constructors
 
 
 class RouterOperationRegistry:
-    """Operation id registry for router."""
+    """Operation id registry for router.
 
-    registry: ClassVar[dict[int, list[str]]] = {}
+    Routers are weakly referenced, so their entries are released together with them, and their operation ids are kept
+    in insertion ordered sets (dicts with None values).
+    """
+
+    registry: ClassVar[WeakKeyDictionary[Router, dict[str, None]]] = WeakKeyDictionary()
+
+    @classmethod
+    def reset(cls):
+        """Remove all registered routers and the interned response adapters and constructors."""
+
+        cls.registry = WeakKeyDictionary()
+        clear_response_adapters()
+        clear_response_constructors()
+
+    @classmethod
+    @contextmanager
+    def scoped(cls) -> Iterator[None]:
+        """Use an empty registry within the block and restore the previous registry afterwards."""
+
+        registry = cls.registry
+        cls.reset()
+        try:
+            yield
+        finally:
+            cls.registry = registry
 
     @classmethod
     def register_router(cls, router: Router):
@@ -29,12 +58,10 @@ class RouterOperationRegistry:
         Raises:
             RouterAlreadyRegisteredError: If the router is already registered.
         """
-        router_id = id(router)
-
-        if router_id in cls.registry:
+        if router in cls.registry:
             raise RouterAlreadyRegisteredError(router=router)
 
-        cls.registry[router_id] = []
+        cls.registry[router] = {}
 
     @classmethod
     def register_operation_id(cls, router: Router, operation_id: str):
@@ -48,15 +75,15 @@ class RouterOperationRegistry:
             RouterNotRegisteredError: If  the router is not registered.
             OperationIdOnRouterAlreadyRegisteredError: If the oepration id as already registered for the router.
         """
-        router_id = id(router)
+        operation_ids = cls.registry.get(router)
 
-        if router_id not in cls.registry:
+        if operation_ids is None:
             raise RouterNotRegisteredError(router=router)
 
-        if operation_id in cls.registry[router_id]:
+        if operation_id in operation_ids:
             raise OperationIdOnRouterAlreadyRegisteredError(router=router, operation_id=operation_id)
 
-        cls.registry[router_id].append(operation_id)
+        operation_ids[operation_id] = None
 
     @classmethod
     def operation_ids(cls, router: Router) -> list[str]:
@@ -71,18 +98,42 @@ class RouterOperationRegistry:
         Returns:
             list[str]: The operation ids registered for the router.
         """
-        router_id = id(router)
+        operation_ids = cls.registry.get(router)
 
-        if router_id not in cls.registry:
+        if operation_ids is None:
             raise RouterNotRegisteredError(router=router)
 
-        return cls.registry[router_id]
+        return list(operation_ids)
 
 
 class APIOperationRegistry:
-    """Operation id registry for API."""
+    """Operation id registry for API.
 
-    registry: ClassVar[dict[int, list[str]]] = {}
+    APIs are weakly referenced, so their entries are released together with them, and their operation ids are kept in
+    insertion ordered sets (dicts with None values).
+    """
+
+    registry: ClassVar[WeakKeyDictionary[NinjaAPI, dict[str, None]]] = WeakKeyDictionary()
+
+    @classmethod
+    def reset(cls):
+        """Remove all registered APIs and the interned response adapters and constructors."""
+
+        cls.registry = WeakKeyDictionary()
+        clear_response_adapters()
+        clear_response_constructors()
+
+    @classmethod
+    @contextmanager
+    def scoped(cls) -> Iterator[None]:
+        """Use an empty registry within the block and restore the previous registry afterwards."""
+
+        registry = cls.registry
+        cls.reset()
+        try:
+            yield
+        finally:
+            cls.registry = registry
 
     @classmethod
     def register_api(cls, api: NinjaAPI):
@@ -94,12 +145,10 @@ class APIOperationRegistry:
         Raises:
             RouterAlreadyRegisteredError: If the router is already registered.
         """
-        api_id = id(api)
-
-        if api_id in cls.registry:
+        if api in cls.registry:
             raise APIAlreadyRegisteredError(api=api)
 
-        cls.registry[api_id] = []
+        cls.registry[api] = {}
 
     @classmethod
     def register_routers_operation_ids(cls, api: NinjaAPI, router: Router):
@@ -113,18 +162,18 @@ class APIOperationRegistry:
             APINotRegisteredError: If the API is not registered.
             OperationIdOnAPIAlreadyRegisteredError: If the oepration id as already registered for the API.
         """
-        api_id = id(api)
+        api_operation_ids = cls.registry.get(api)
 
-        if api_id not in cls.registry:
+        if api_operation_ids is None:
             raise APINotRegisteredError(api=api)
 
         operation_ids = RouterOperationRegistry.operation_ids(router=router)
 
         for operation_id in operation_ids:
-            if operation_id in cls.registry[api_id]:
+            if operation_id in api_operation_ids:
                 raise OperationIdOnAPIAlreadyRegisteredError(api=api, operation_id=operation_id)
 
-            cls.registry[api_id].append(operation_id)
+        api_operation_ids.update(dict.fromkeys(operation_ids))
 
     @classmethod
     def operation_ids(cls, api: NinjaAPI) -> list[str]:
@@ -139,9 +188,9 @@ class APIOperationRegistry:
         Returns:
             list[str]: The operation ids registered for the API.
         """
-        api_id = id(api)
+        operation_ids = cls.registry.get(api)
 
-        if api_id not in cls.registry:
+        if operation_ids is None:
             raise APINotRegisteredError(api=api)
 
-        return cls.registry[api_id]
+        return list(operation_ids)
@@ -0,0 +1,112 @@
+"""Module api.renderers."""
+
+import json
+from typing import Any
+from weakref import WeakKeyDictionary
+
+from django.http import HttpRequest
+from ninja.renderers import JSONRenderer
+from pydantic import TypeAdapter
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
+# core schema types that pydantic serializes to JSON differently than Ninja's JSON encoder (e.g. datetimes with
+# microseconds instead of milliseconds) or whose values are only known at runtime
+_ENCODER_TYPES = frozenset({"any", "bytes", "datetime", "enum", "is-instance", "time", "timedelta"})
+_FUNCTION_SERIALIZERS = frozenset({"function-plain", "function-wrap"})
+
+
+def _dumps_like_encoder(schema: Any) -> bool:
+    """Check whether pydantic serializes values of a core schema to the same JSON as Ninja's JSON encoder.
+
+    Args:
+        schema (Any): The core schema (or a part of it).
+
+    Returns:
+        bool: True if no part of the schema has a type rendered differently or a serializer without return schema.
+    """
+
+    if isinstance(schema, list | tuple):
+        return all(_dumps_like_encoder(item) for item in schema)
+
+    if not isinstance(schema, dict):
+        return True
+
+    schema_type = schema.get("type")
+    if isinstance(schema_type, str) and schema_type in _ENCODER_TYPES:
+        return False
+
+    serialization = schema.get("serialization")
+    if (
+        isinstance(serialization, dict)
+        and serialization.get("type") in _FUNCTION_SERIALIZERS
+        and "return_schema" not in serialization
+    ):
+        return False
+
+    return all(_dumps_like_encoder(value) for key, value in schema.items() if key != "metadata")
+
+
+class FastJSONRenderer(JSONRenderer):
+    """JSON renderer using orjson if it is installed and a compact stdlib fallback otherwise.
+
+    Validated responses are serialized straight to bytes by pydantic with ``render_validated``, so the intermediate
+    dict of ``model_dump`` is never built. Values that orjson does not handle natively (datetimes, decimals, lazy
+    translations, ...) are passed to Ninja's JSON encoder, so the output matches the default JSONRenderer. Responses containing values pydantic renders differently (datetimes, times, durations, enums, ...)
+    are dumped to Python and rendered with the encoder instead.
+    """
+
+    def __init__(self) -> None:
+        """Initialize a FastJSONRenderer."""
+
+        self._encoder = self.encoder_class()
+        self._dump_json: WeakKeyDictionary[TypeAdapter, bool] = WeakKeyDictionary()
+
+    def render(self, request: HttpRequest, data: Any, *, response_status: int) -> bytes:  # noqa: ARG002
+        """Render data to JSON bytes.
+
+        Args:
+            request (HttpRequest): The request.
+            data (Any): The data.
+            response_status (int): The status of the response.
+
+        Returns:
+            bytes: The JSON document.
+        """
+
+        if orjson is not None:
+            return orjson.dumps(
+                data,
+                default=self._encoder.default,
+                option=orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME,
+            )
+
+        return json.dumps(data, cls=self.encoder_class, separators=(",", ":")).encode()
+
+    def render_validated(
+        self, request: HttpRequest, type_adapter: TypeAdapter, data: Any, *, response_status: int = 200, **kwargs: Any
+    ) -> bytes:
+        """Render data validated by a TypeAdapter to JSON bytes, straight with pydantic if the output is the same.
+
+        Args:
+            request (HttpRequest): The request.
+            type_adapter (TypeAdapter): The adapter the data was validated with, e.g. of the response of an operation.
+            data (Any): The validated data.
+            response_status (int, optional): The status of the response. Defaults to 200.
+            **kwargs: The keyword arguments of ``TypeAdapter.dump_json`` (by_alias, exclude_none, context, ...).
+
+        Returns:
+            bytes: The JSON document.
+        """
+
+        dump_json = self._dump_json.get(type_adapter)
+        if dump_json is None:
+            dump_json = self._dump_json[type_adapter] = _dumps_like_encoder(type_adapter.core_schema)
+
+        if dump_json:
+            return type_adapter.dump_json(data, **kwargs)
+
+        return self.render(request, type_adapter.dump_python(data, **kwargs), response_status=response_status)
@@ -8,8 +8,12 @@ from ninja.constants import NOT_SET, NOT_SET_TYPE
 from ninja.throttling import BaseThrottle
 from ninja.types import TCallable
 
-from ninja_extended.api.operation import ExtendedPathView
+from ninja_extended.api.cache import ResponseCache
+from ninja_extended.api.conditional import ETagFunc, LastModifiedFunc
+from ninja_extended.api.errors import OperationIdNotFoundInRouterError
+from ninja_extended.api.operation import ExtendedOperation, ExtendedPathView, LazyOperation
 from ninja_extended.api.registry import RouterOperationRegistry
+from ninja_extended.conf import settings
 
 if TYPE_CHECKING:
     from ninja_extended.api import ExtendedNinjaAPI
@@ -24,8 +28,18 @@ class ExtendedRouter(Router):
         tags: list[str],
         auth: Any = NOT_SET,
         throttle: BaseThrottle | list[BaseThrottle] | NOT_SET_TYPE = NOT_SET,
+        lazy: bool | None = None,
     ) -> None:
-        """Initialize an ExtendedRouter."""
+        """Initialize an ExtendedRouter.
+
+        Args:
+            tags (list[str]): The tags of the operations.
+            auth (Any, optional): The authentication of the operations. Defaults to NOT_SET.
+            throttle (BaseThrottle | list[BaseThrottle] | NOT_SET_TYPE, optional): The throttles of the operations.
+                Defaults to NOT_SET.
+            lazy (bool | None, optional): Build the operations on first use instead of on registration. Defaults to
+                the setting NINJA_EXTENDED_LAZY_OPERATIONS (False).
+        """
 
         RouterOperationRegistry.register_router(router=self)
 
@@ -35,6 +49,8 @@ class ExtendedRouter(Router):
         self.tags = tags
         self.path_operations: dict[str, ExtendedPathView] = {}
         self._routers: list[tuple[str, ExtendedRouter]] = []
+        self.lazy = settings.LAZY_OPERATIONS if lazy is None else lazy
+        self._operations: dict[str, ExtendedOperation | LazyOperation] = {}
 
     def get(  # noqa: PLR0913
         self,
@@ -55,6 +71,15 @@ class ExtendedRouter(Router):
         url_name: str | None = None,
         include_in_schema: bool = True,
         openapi_extra: dict[str, Any] | None = None,
+        plan_queries: bool = False,
+        values_fast_path: bool = False,
+        sparse_fields: bool = False,
+        streaming_export: bool = False,
+        stream_json_array: bool = False,
+        trusted_response: bool = False,
+        cache: ResponseCache | None = None,
+        etag: ETagFunc | None = None,
+        last_modified: LastModifiedFunc | None = None,
     ) -> Callable[[TCallable], TCallable]:
         """GET operation decorator."""
 
@@ -76,6 +101,15 @@ class ExtendedRouter(Router):
             url_name=url_name,
             include_in_schema=include_in_schema,
             openapi_extra=openapi_extra,
+            plan_queries=plan_queries,
+            values_fast_path=values_fast_path,
+            sparse_fields=sparse_fields,
+            streaming_export=streaming_export,
+            stream_json_array=stream_json_array,
+            trusted_response=trusted_response,
+            cache=cache,
+            etag=etag,
+            last_modified=last_modified,
         )
 
     def post(  # noqa: PLR0913
@@ -97,6 +131,10 @@ class ExtendedRouter(Router):
         url_name: str | None = None,
         include_in_schema: bool = True,
         openapi_extra: dict[str, Any] | None = None,
+        plan_queries: bool = False,
+        values_fast_path: bool = False,
+        sparse_fields: bool = False,
+        trusted_response: bool = False,
     ) -> Callable[[TCallable], TCallable]:
         """POST operation decorator."""
 
@@ -118,6 +156,10 @@ class ExtendedRouter(Router):
             url_name=url_name,
             include_in_schema=include_in_schema,
             openapi_extra=openapi_extra,
+            plan_queries=plan_queries,
+            values_fast_path=values_fast_path,
+            sparse_fields=sparse_fields,
+            trusted_response=trusted_response,
         )
 
     def delete(  # noqa: PLR0913
@@ -139,6 +181,10 @@ class ExtendedRouter(Router):
         url_name: str | None = None,
         include_in_schema: bool = True,
         openapi_extra: dict[str, Any] | None = None,
+        plan_queries: bool = False,
+        values_fast_path: bool = False,
+        sparse_fields: bool = False,
+        trusted_response: bool = False,
     ) -> Callable[[TCallable], TCallable]:
         """DELETE operation decorator."""
 
@@ -160,6 +206,10 @@ class ExtendedRouter(Router):
             url_name=url_name,
             include_in_schema=include_in_schema,
             openapi_extra=openapi_extra,
+            plan_queries=plan_queries,
+            values_fast_path=values_fast_path,
+            sparse_fields=sparse_fields,
+            trusted_response=trusted_response,
         )
 
     def patch(  # noqa: PLR0913
@@ -181,6 +231,10 @@ class ExtendedRouter(Router):
         url_name: str | None = None,
         include_in_schema: bool = True,
         openapi_extra: dict[str, Any] | None = None,
+        plan_queries: bool = False,
+        values_fast_path: bool = False,
+        sparse_fields: bool = False,
+        trusted_response: bool = False,
     ) -> Callable[[TCallable], TCallable]:
         """PATCH operation decorator."""
 
@@ -202,6 +256,10 @@ class ExtendedRouter(Router):
             url_name=url_name,
             include_in_schema=include_in_schema,
             openapi_extra=openapi_extra,
+            plan_queries=plan_queries,
+            values_fast_path=values_fast_path,
+            sparse_fields=sparse_fields,
+            trusted_response=trusted_response,
         )
 
     def put(  # noqa: PLR0913
@@ -223,6 +281,10 @@ class ExtendedRouter(Router):
         url_name: str | None = None,
         include_in_schema: bool = True,
         openapi_extra: dict[str, Any] | None = None,
+        plan_queries: bool = False,
+        values_fast_path: bool = False,
+        sparse_fields: bool = False,
+        trusted_response: bool = False,
     ) -> Callable[[TCallable], TCallable]:
         """PUT operation decorator."""
 
@@ -244,6 +306,10 @@ class ExtendedRouter(Router):
             url_name=url_name,
             include_in_schema=include_in_schema,
             openapi_extra=openapi_extra,
+            plan_queries=plan_queries,
+            values_fast_path=values_fast_path,
+            sparse_fields=sparse_fields,
+            trusted_response=trusted_response,
         )
 
     def api_operation(  # noqa: PLR0913
@@ -266,6 +332,15 @@ class ExtendedRouter(Router):
         url_name: str | None = None,
         include_in_schema: bool = True,
         openapi_extra: dict[str, Any] | None = None,
+        plan_queries: bool = False,
+        values_fast_path: bool = False,
+        sparse_fields: bool = False,
+        streaming_export: bool = False,
+        stream_json_array: bool = False,
+        trusted_response: bool = False,
+        cache: ResponseCache | None = None,
+        etag: ETagFunc | None = None,
+        last_modified: LastModifiedFunc | None = None,
     ) -> Callable[[TCallable], TCallable]:
         """Add generic HTTP method handler."""
 
@@ -291,6 +366,15 @@ class ExtendedRouter(Router):
                 url_name=url_name,
                 include_in_schema=include_in_schema,
                 openapi_extra=openapi_extra,
+                plan_queries=plan_queries,
+                values_fast_path=values_fast_path,
+                sparse_fields=sparse_fields,
+                streaming_export=streaming_export,
+                stream_json_array=stream_json_array,
+                trusted_response=trusted_response,
+                cache=cache,
+                etag=etag,
+                last_modified=last_modified,
             )
             return view_func
 
@@ -317,6 +401,15 @@ class ExtendedRouter(Router):
         url_name: str | None = None,
         include_in_schema: bool = True,
         openapi_extra: dict[str, Any] | None = None,
+        plan_queries: bool = False,
+        values_fast_path: bool = False,
+        sparse_fields: bool = False,
+        streaming_export: bool = False,
+        stream_json_array: bool = False,
+        trusted_response: bool = False,
+        cache: ResponseCache | None = None,
+        etag: ETagFunc | None = None,
+        last_modified: LastModifiedFunc | None = None,
     ) -> None:
         """Add an API operation."""
 
@@ -325,7 +418,7 @@ class ExtendedRouter(Router):
             self.path_operations[path] = path_view
         else:
             path_view = self.path_operations[path]
-        path_view.add_operation(
+        operation = path_view.add_operation(
             path=path,
             operation_id=operation_id,
             summary=summary,
@@ -344,6 +437,38 @@ class ExtendedRouter(Router):
             url_name=url_name,
             include_in_schema=include_in_schema,
             openapi_extra=openapi_extra,
+            plan_queries=plan_queries,
+            values_fast_path=values_fast_path,
+            sparse_fields=sparse_fields,
+            streaming_export=streaming_export,
+            stream_json_array=stream_json_array,
+            trusted_response=trusted_response,
+            cache=cache,
+            etag=etag,
+            last_modified=last_modified,
+            lazy=self.lazy,
         )
+        self._operations[operation_id] = operation
         if self.api:
+            self.api._operations[operation_id] = operation  # noqa: SLF001
             path_view.set_api_instance(self.api, self)
+
+    def get_operation(self, operation_id: str) -> ExtendedOperation:
+        """Get an operation of the router by its operation id.
+
+        Args:
+            operation_id (str): The operation id.
+
+        Raises:
+            OperationIdNotFoundInRouterError: If the operation id is not found.
+
+        Returns:
+            ExtendedOperation: The operation.
+        """
+
+        try:
+            operation = self._operations[operation_id]
+        except KeyError:
+            raise OperationIdNotFoundInRouterError(router=self, operation_id=operation_id) from None
+
+        return operation.compile() if isinstance(operation, LazyOperation) else operation
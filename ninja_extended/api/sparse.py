@@ -0,0 +1,294 @@
+"""Module api.sparse."""
+
+from inspect import getattr_static
+from types import UnionType
+from typing import Any, NamedTuple, Union, get_args, get_origin
+
+from django.http import HttpRequest
+from ninja import Query, Schema
+from ninja.errors import ValidationError
+from ninja.params.models import Param
+from pydantic import BaseModel, TypeAdapter, field_serializer, field_validator, model_serializer, model_validator
+
+from ninja_extended.api.adapters import field_annotation, response_adapter
+from ninja_extended.api.planner import QueryPlanner, ValuesPlanner, values_field_map
+from ninja_extended.api.trusted import Constructor, response_constructor
+
+SPARSE_FIELDS_ARG = "ninja_sparse_fields"
+
+
+class SparseFieldset(NamedTuple):
+    """A validated subset of the fields of a response schema."""
+
+    fields: frozenset[str]
+    schema: type[Schema]
+    query_planner: QueryPlanner
+    values_planner: ValuesPlanner | None
+
+
+def _substitute(annotation: Any, schema: type[Schema], sparse_schema: type[Schema]) -> Any:  # noqa: PLR0911
+    """Replace a schema in an annotation, including the fields of models like the paginated output.
+
+    Args:
+        annotation (Any): The annotation.
+        schema (type[Schema]): The schema to replace.
+        sparse_schema (type[Schema]): The replacement.
+
+    Returns:
+        Any: The annotation with the schema replaced.
+    """
+
+    if annotation is schema:
+        return sparse_schema
+
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        annotations = {}
+        for name, field in annotation.model_fields.items():
+            field_type = field_annotation(field)
+            substituted = _substitute(field_type, schema, sparse_schema)
+            if substituted is not field_type:
+                annotations[name] = substituted
+        if not annotations:
+            return annotation
+
+        return type(annotation.__name__, (annotation,), {"__annotations__": annotations})
+
+    args = get_args(annotation)
+    if not args:
+        return annotation
+
+    substituted_args = tuple(_substitute(arg, schema, sparse_schema) for arg in args)
+    if all(substituted is arg for substituted, arg in zip(substituted_args, args, strict=True)):
+        return annotation
+
+    origin = get_origin(annotation)
+    if origin in (Union, UnionType):
+        return Union[substituted_args]  # noqa: UP007
+
+    return origin[substituted_args]
+
+
+class SparseFieldsets:
+    """Client-driven sparse fieldsets for the response schema of an operation.
+
+    Clients select a subset of the top level fields of the response schema with a comma separated query parameter,
+    e.g. ``?fields=id,value_unique``. Each distinct field set is validated once and cached together with a schema
+    restricted to the selected fields, which is used to plan the queryset (``only()``/``values()``) and to validate and
+    render the response. The restricted response models, their adapters and constructors are cached here as well (and
+    not in the global caches), so they are evicted with the field sets.
+    """
+
+    def __init__(self, schema: type[Schema], *, param: str = "fields", values: bool = False, maxsize: int = 128):
+        """Initialize SparseFieldsets.
+
+        Args:
+            schema (type[Schema]): The response schema.
+            param (str, optional): The query parameter. Defaults to "fields".
+            values (bool, optional): Fetch the rows with values() if the selected fields are flat. Defaults to False.
+            maxsize (int, optional): The maximum number of cached field sets. Defaults to 128.
+        """
+
+        self.schema = schema
+        self.param = param
+        self.values = values
+        self.maxsize = maxsize
+        self._fieldsets: dict[frozenset[str], SparseFieldset] = {}
+        self._response_models: dict[tuple[type[Schema], frozenset[str]], type[Schema]] = {}
+        self._response_adapters: dict[type[Schema], TypeAdapter] = {}
+        self._response_constructors: dict[type[Schema], Constructor | None] = {}
+
+    def from_request(self, request: HttpRequest) -> SparseFieldset | None:
+        """Get the field set selected by a request.
+
+        Args:
+            request (HttpRequest): The request.
+
+        Raises:
+            ValidationError: If the query parameter contains fields that are not part of the schema.
+
+        Returns:
+            SparseFieldset | None: The field set or None if the request selects all fields.
+        """
+
+        value = request.GET.get(self.param)
+        if not value:
+            return None
+
+        return self.resolve(frozenset(field for field in (field.strip() for field in value.split(",")) if field))
+
+    def resolve(self, fields: frozenset[str]) -> SparseFieldset:
+        """Validate a field set and build its schema and planners (cached).
+
+        Args:
+            fields (frozenset[str]): The selected fields.
+
+        Raises:
+            ValidationError: If the field set contains fields that are not part of the schema.
+
+        Returns:
+            SparseFieldset: The field set.
+        """
+
+        fieldset = self._fieldsets.get(fields)
+        if fieldset is not None:
+            return fieldset
+
+        unknown = sorted(fields - self.schema.model_fields.keys())
+        if unknown or not fields:
+            raise ValidationError(
+                [
+                    {
+                        "type": "value_error",
+                        "loc": ("query", self.param),
+                        "msg": f"Unknown fields: {', '.join(unknown)}" if unknown else "No fields selected",
+                    }
+                ]
+            )
+
+        schema = self._sparse_schema(fields)
+        field_map = values_field_map(schema) if self.values else None
+        fieldset = SparseFieldset(
+            fields=fields,
+            schema=schema,
+            query_planner=QueryPlanner(schema=schema),
+            values_planner=ValuesPlanner(field_map=field_map) if field_map is not None else None,
+        )
+
+        if len(self._fieldsets) >= self.maxsize:
+            self._fieldsets.clear()
+        self._fieldsets[fields] = fieldset
+
+        return fieldset
+
+    def response_model(self, response_model: type[Schema], fieldset: SparseFieldset) -> type[Schema]:
+        """Get the response model of an operation with the response schema restricted to a field set (cached).
+
+        Args:
+            response_model (type[Schema]): The response model of the operation.
+            fieldset (SparseFieldset): The field set.
+
+        Returns:
+            type[Schema]: The restricted response model.
+        """
+
+        key = (response_model, fieldset.fields)
+        if key not in self._response_models:
+            if len(self._response_models) >= self.maxsize:
+                self._response_models.clear()
+            self._response_models[key] = _substitute(response_model, self.schema, fieldset.schema)
+
+        return self._response_models[key]
+
+    def response_adapter(self, response_model: type[Schema]) -> TypeAdapter:
+        """Get the TypeAdapter of a restricted response model (cached).
+
+        Args:
+            response_model (type[Schema]): The restricted response model returned by response_model.
+
+        Returns:
+            TypeAdapter: The adapter.
+        """
+
+        adapter = self._response_adapters.get(response_model)
+        if adapter is None:
+            if len(self._response_adapters) >= self.maxsize:
+                self._response_adapters.clear()
+            adapter = self._response_adapters[response_model] = response_adapter(
+                field_annotation(response_model.model_fields["response"]), intern=False
+            )
+
+        return adapter
+
+    def response_constructor(self, response_model: type[Schema]) -> Constructor | None:
+        """Get the constructor building a trusted response of a restricted response model (cached).
+
+        Args:
+            response_model (type[Schema]): The restricted response model returned by response_model.
+
+        Returns:
+            Constructor | None: The constructor or None if the response has to be validated.
+        """
+
+        if response_model not in self._response_constructors:
+            if len(self._response_constructors) >= self.maxsize:
+                self._response_constructors.clear()
+            self._response_constructors[response_model] = response_constructor(
+                field_annotation(response_model.model_fields["response"]), cache=False
+            )
+
+        return self._response_constructors[response_model]
+
+    @property
+    def param_source(self) -> Param:
+        """Get the source of the query parameter, documenting it in the OpenAPI schema.
+
+        Returns:
+            Param: The source.
+        """
+
+        return Query(
+            None,
+            alias=self.param,
+            description=f"Comma separated subset of the fields to include: {', '.join(self.schema.model_fields)}.",
+        )
+
+    def _decorators(self, fields: frozenset[str]) -> dict[str, Any]:
+        """Redeclare the validators and serializers of the schema for the selected fields.
+
+        Field validators and serializers are restricted to the selected fields (and dropped if none of their fields is
+        selected), model validators and serializers are kept as they are. The validators of the ninja Schema base are
+        inherited by the sparse schema anyway.
+        """
+
+        decorators = self.schema.__pydantic_decorators__
+        namespace: dict[str, Any] = {}
+
+        for name, decorator in decorators.field_validators.items():
+            selected = [field for field in decorator.info.fields if field == "*" or field in fields]
+            if selected and not hasattr(Schema, name):
+                namespace[name] = field_validator(*selected, mode=decorator.info.mode, check_fields=False)(
+                    getattr_static(self.schema, name)
+                )
+
+        for name, decorator in decorators.field_serializers.items():
+            selected = [field for field in decorator.info.fields if field == "*" or field in fields]
+            if selected and not hasattr(Schema, name):
+                namespace[name] = field_serializer(
+                    *selected,
+                    mode=decorator.info.mode,
+                    return_type=decorator.info.return_type,
+                    when_used=decorator.info.when_used,
+                    check_fields=False,
+                )(getattr_static(self.schema, name))
+
+        for name, decorator in decorators.model_validators.items():
+            if not hasattr(Schema, name):
+                namespace[name] = model_validator(mode=decorator.info.mode)(getattr_static(self.schema, name))
+
+        for name, decorator in decorators.model_serializers.items():
+            if not hasattr(Schema, name):
+                namespace[name] = model_serializer(
+                    mode=decorator.info.mode,
+                    when_used=decorator.info.when_used,
+                    return_type=decorator.info.return_type,
+                )(getattr_static(self.schema, name))
+
+        return namespace
+
+    def _sparse_schema(self, fields: frozenset[str]) -> type[Schema]:
+        model_fields = {name: field for name, field in self.schema.model_fields.items() if name in fields}
+        resolvers = {
+            f"resolve_{name}": resolver
+            for name in model_fields
+            if (resolver := getattr_static(self.schema, f"resolve_{name}", None)) is not None
+        }
+        namespace: dict[str, Any] = {
+            "__module__": self.schema.__module__,
+            "__annotations__": {name: field.annotation for name, field in model_fields.items()},
+            "model_config": self.schema.model_config,
+            **model_fields,
+            **resolvers,
+            **self._decorators(fields),
+        }
+
+        return type(f"Sparse{self.schema.__name__}", (Schema,), namespace)
@@ -0,0 +1,168 @@
+"""Module api.sqlcomment."""
+
+# ruff: noqa: ARG002
+
+from collections.abc import Callable
+from contextvars import ContextVar, Token
+from typing import TYPE_CHECKING, Any
+from urllib.parse import quote
+
+from django.db import connections
+from django.db.backends.base.base import BaseDatabaseWrapper
+from django.db.backends.signals import connection_created
+from django.http import HttpRequest
+from django.http.response import HttpResponseBase
+
+from ninja_extended.api.instrumentation import Instrumentation, Timings
+
+if TYPE_CHECKING:
+    from ninja_extended.api.operation import ExtendedOperation
+
+# the comment and the comment with escaped "%" for queries with parameters (formatted by the database driver)
+_comment: ContextVar[tuple[str, str] | None] = ContextVar("ninja_extended_sql_comment", default=None)
+
+
+def sql_comment(**tags: Any) -> str:
+    """Format tags as sqlcommenter-style comment, e.g. ``/*method='GET',operation_id='listResources'*/``.
+
+    Keys are sorted and values are URL encoded, so a value can not terminate the comment. The encoded values can
+    contain "%" (e.g. "%2C" for a comma), which has to be escaped as "%%" if the query has parameters.
+
+    Args:
+        **tags: The tags, tags with value None are omitted.
+
+    Returns:
+        str: The comment followed by a space.
+    """
+
+    pairs = ",".join(
+        f"{quote(key, safe='')}='{quote(str(value), safe='')}'"
+        for key, value in sorted(tags.items())
+        if value is not None
+    )
+
+    return f"/*{pairs}*/ "
+
+
+def _comment_wrapper(execute: Callable, sql: str, params: Any, many: bool, context: dict[str, Any]) -> Any:  # noqa: FBT001
+    comment = _comment.get()
+    if comment is not None:
+        sql = (comment[0] if params is None else comment[1]) + sql
+
+    return execute(sql, params, many, context)
+
+
+def install_comment_wrapper(connection: BaseDatabaseWrapper, **kwargs: Any) -> None:  # noqa: ARG001
+    """Install the execute wrapper prefixing the SQL with the comment of the current operation (once).
+
+    Args:
+        connection (BaseDatabaseWrapper): The connection.
+        **kwargs: The additional arguments of the connection_created signal.
+    """
+
+    if _comment_wrapper not in connection.execute_wrappers:
+        connection.execute_wrappers.append(_comment_wrapper)
+
+
+class SQLCommenter(Instrumentation):
+    """Prefix every SQL statement of an operation with a comment identifying the operation.
+
+    The comment contains the operation id, the (comma separated) router tags and the HTTP method, e.g.
+    ``/*method='GET',operation_id='listResources',tag='resources'*/ SELECT ...``, so slow queries in database logs
+    like ``pg_stat_statements`` can be attributed to their endpoint. The comments are built once per operation and
+    method.
+    """
+
+    def __init__(self, tags: dict[str, str] | None = None) -> None:
+        """Initialize a SQLCommenter.
+
+        Args:
+            tags (dict[str, str] | None, optional): Additional static tags, e.g. the application. Defaults to None.
+        """
+
+        self.tags = tags or {}
+        self._comments: dict[tuple[ExtendedOperation, str], str] = {}
+        # the tokens are None while the request is suspended
+        self._tokens: dict[HttpRequest, Token[tuple[str, str] | None] | None] = {}
+
+        connection_created.connect(install_comment_wrapper, dispatch_uid="ninja_extended_sql_commenter")
+
+    def get_comment(self, operation: "ExtendedOperation", method: str) -> str:
+        """Get the comment of an operation (cached).
+
+        Args:
+            operation (ExtendedOperation): The operation.
+            method (str): The HTTP method of the request.
+
+        Returns:
+            str: The comment.
+        """
+
+        key = (operation, method)
+        comment = self._comments.get(key)
+        if comment is None:
+            comment = self._comments[key] = sql_comment(
+                **self.tags,
+                operation_id=operation.operation_id,
+                tag=",".join(operation.tags) if operation.tags else None,
+                method=method,
+            )
+
+        return comment
+
+    def on_start(self, request: HttpRequest, operation: "ExtendedOperation") -> None:
+        """Start commenting the SQL of the request.
+
+        Args:
+            request (HttpRequest): The request.
+            operation (ExtendedOperation): The operation.
+        """
+
+        for connection in connections.all():
+            install_comment_wrapper(connection)
+
+        comment = self.get_comment(operation, request.method)
+        self._tokens[request] = _comment.set((comment, comment.replace("%", "%%")))
+
+    def on_suspend(self, request: HttpRequest, operation: "ExtendedOperation") -> None:
+        """Pause commenting the SQL of the request.
+
+        Args:
+            request (HttpRequest): The request.
+            operation (ExtendedOperation): The operation.
+        """
+
+        token = self._tokens.get(request)
+        if token is not None:
+            _comment.reset(token)
+            self._tokens[request] = None
+
+    def on_resume(self, request: HttpRequest, operation: "ExtendedOperation") -> None:
+        """Resume commenting the SQL of the request, e.g. of its streamed body.
+
+        Args:
+            request (HttpRequest): The request.
+            operation (ExtendedOperation): The operation.
+        """
+
+        if request in self._tokens:
+            for connection in connections.all():
+                install_comment_wrapper(connection)
+            comment = self.get_comment(operation, request.method)
+            self._tokens[request] = _comment.set((comment, comment.replace("%", "%%")))
+
+    def on_finish(
+        self, request: HttpRequest, operation: "ExtendedOperation", response: HttpResponseBase | None, timings: Timings
+    ) -> None:
+        """Stop commenting the SQL of the request.
+
+        Args:
+            request (HttpRequest): The request.
+            operation (ExtendedOperation): The operation.
+            response (HttpResponseBase | None): The response or None if the operation raised an exception.
+            timings (Timings): The timings of the request.
+        """
+
+        token = self._tokens.pop(request, None)
+        if token is not None:
+            _comment.reset(token)
@@ -0,0 +1,298 @@
+"""Module api.streaming."""
+
+import csv
+import json
+from abc import ABC, abstractmethod
+from collections.abc import AsyncIterator, Callable, Iterable, Iterator
+from typing import Any
+
+from django.db.models import QuerySet
+from django.http import HttpRequest, StreamingHttpResponse
+from ninja import Schema
+from ninja.renderers import BaseRenderer, JSONRenderer
+from pydantic import TypeAdapter
+
+from ninja_extended.api.adapters import response_adapter
+from ninja_extended.api.renderers import FastJSONRenderer
+
+STREAMING_CHUNK_SIZE = 2_000
+
+
+async def _aiter(items: Iterable) -> AsyncIterator:
+    for item in items:
+        yield item
+
+
+class _Echo:
+    """Pseudo buffer returning the written value, used to let a csv writer format a single row."""
+
+    def write(self, value: str) -> str:
+        return value
+
+
+class StreamFormat(ABC):
+    """Base class for the formats of streamed list responses."""
+
+    media_type: str
+    content_type: str
+    separator: str = ""
+    json_rows: bool = False
+
+    def header(self, columns: list[str]) -> str:  # noqa: ARG002
+        """Get the header written before the rows."""
+
+        return ""
+
+    def footer(self) -> str:
+        """Get the footer written after the rows."""
+
+        return ""
+
+    @abstractmethod
+    def row(self, columns: list[str], data: Any) -> str:
+        """Format a row, serialized to a dict or rendered to a JSON document if ``json_rows`` is set."""
+
+
+class NDJSONFormat(StreamFormat):
+    """Newline delimited JSON, one object per row."""
+
+    media_type = "application/x-ndjson"
+    content_type = "application/x-ndjson"
+    json_rows = True
+
+    def row(self, columns: list[str], data: str) -> str:  # noqa: ARG002
+        """Format a row rendered to a JSON document."""
+
+        return data + "\n"
+
+
+class CSVFormat(StreamFormat):
+    """Comma separated values with a header row, nested values are written as JSON."""
+
+    media_type = "text/csv"
+    content_type = "text/csv; charset=utf-8"
+
+    def __init__(self) -> None:
+        """Initialize a CSVFormat."""
+
+        self._writer = csv.writer(_Echo())
+
+    def header(self, columns: list[str]) -> str:
+        """Get the header written before the rows."""
+
+        return self._writer.writerow(columns)
+
+    def row(self, columns: list[str], data: dict[str, Any]) -> str:
+        """Format a row serialized to a dict."""
+
+        return self._writer.writerow(
+            json.dumps(value) if isinstance(value, dict | list) else value
+            for value in (data.get(column) for column in columns)
+        )
+
+
+class JSONArrayFormat(StreamFormat):
+    """A JSON array written incrementally, the regular JSON response of a list operation."""
+
+    media_type = "application/json"
+    content_type = "application/json"
+    separator = ","
+    json_rows = True
+
+    def header(self, columns: list[str]) -> str:  # noqa: ARG002
+        """Get the header written before the rows."""
+
+        return "["
+
+    def footer(self) -> str:
+        """Get the footer written after the rows."""
+
+        return "]"
+
+    def row(self, columns: list[str], data: str) -> str:  # noqa: ARG002
+        """Format a row rendered to a JSON document."""
+
+        return data
+
+
+STREAM_FORMATS: dict[str, StreamFormat] = {
+    stream_format.media_type: stream_format for stream_format in (NDJSONFormat(), CSVFormat())
+}
+
+
+def negotiate_stream_format(request: HttpRequest) -> StreamFormat | None:
+    """Get the stream format explicitly accepted by a request.
+
+    Only exact media types select a stream format, wildcards like ``*/*`` keep the regular JSON response.
+
+    Args:
+        request (HttpRequest): The request.
+
+    Returns:
+        StreamFormat | None: The stream format or None if the request does not accept one.
+    """
+
+    for media_range in request.headers.get("Accept", "").split(","):
+        stream_format = STREAM_FORMATS.get(media_range.split(";", 1)[0].strip().lower())
+        if stream_format is not None:
+            return stream_format
+
+    return None
+
+
+class StreamingSerializer:
+    """Serialize the rows of a list result one by one against the response schema into a StreamingHttpResponse.
+
+    Querysets are iterated in chunks with ``iterator()``/``aiterator()``, so memory stays flat no matter how large the
+    result is. The rows are validated with the interned TypeAdapter of the schema and JSON rows are rendered with the
+    renderer of the API, like the rows of regular responses.
+    """
+
+    def __init__(  # noqa: PLR0913
+        self,
+        schema: type[Schema],
+        *,
+        by_alias: bool = False,
+        exclude_unset: bool = False,
+        exclude_defaults: bool = False,
+        exclude_none: bool = False,
+        chunk_size: int = STREAMING_CHUNK_SIZE,
+    ):
+        """Initialize a StreamingSerializer.
+
+        Args:
+            schema (type[Schema]): The schema of the rows.
+            by_alias (bool, optional): Serialize the attributes by alias. Defaults to False.
+            exclude_unset (bool, optional): Exclude attributes that are not set. Defaults to False.
+            exclude_defaults (bool, optional): Exclude default attributes. Defaults to False.
+            exclude_none (bool, optional): Exclude attributes that are None. Defaults to False.
+            chunk_size (int, optional): The number of rows fetched and written at once. Defaults to 2_000.
+        """
+
+        self.schema = schema
+        self.by_alias = by_alias
+        self.exclude_unset = exclude_unset
+        self.exclude_defaults = exclude_defaults
+        self.exclude_none = exclude_none
+        self.chunk_size = chunk_size
+
+    @staticmethod
+    def is_streamable(result: Any) -> bool:
+        """Check if a result is a list result that can be streamed."""
+
+        return isinstance(result, QuerySet | list | tuple)
+
+    def response(  # noqa: PLR0913
+        self,
+        request: HttpRequest,
+        result: Iterable,
+        stream_format: StreamFormat,
+        *,
+        schema: type[Schema] | None = None,
+        renderer: BaseRenderer | None = None,
+        is_async: bool = False,
+    ) -> StreamingHttpResponse:
+        """Create the streaming response for a list result.
+
+        Args:
+            request (HttpRequest): The request.
+            result (Iterable): The list result.
+            stream_format (StreamFormat): The stream format.
+            schema (type[Schema] | None, optional): The schema of the rows if it differs from the schema of the
+                serializer, e.g. for sparse field sets. Defaults to None.
+            renderer (BaseRenderer | None, optional): The renderer of JSON rows, e.g. of the API. Defaults to None
+                (Ninja's JSONRenderer).
+            is_async (bool, optional): Iterate the result asynchronously. Defaults to False.
+
+        Returns:
+            StreamingHttpResponse: The response.
+        """
+
+        serialize = self._serializer(request, response_adapter(schema or self.schema), stream_format, renderer)
+        columns = self._columns(schema or self.schema)
+        content = (
+            self._astream(result, stream_format, columns, serialize)
+            if is_async
+            else self._stream(result, stream_format, columns, serialize)
+        )
+
+        return StreamingHttpResponse(content, content_type=stream_format.content_type)
+
+    def _columns(self, schema: type[Schema]) -> list[str]:
+        return [
+            field.serialization_alias or field.alias or name if self.by_alias else name
+            for name, field in schema.model_fields.items()
+        ]
+
+    def _serializer(
+        self,
+        request: HttpRequest,
+        adapter: TypeAdapter,
+        stream_format: StreamFormat,
+        renderer: BaseRenderer | None,
+    ) -> Callable[[Any], Any]:
+        """Get the function validating a row and serializing it to a dict or rendering it to a JSON document."""
+
+        context = {"request": request, "response_status": 200}
+        dump_kwargs = {
+            "by_alias": self.by_alias,
+            "exclude_unset": self.exclude_unset,
+            "exclude_defaults": self.exclude_defaults,
+            "exclude_none": self.exclude_none,
+            "context": context,
+        }
+
+        if not stream_format.json_rows:
+            return lambda row: adapter.dump_python(
+                adapter.validate_python(row, context=context), mode="json", **dump_kwargs
+            )
+
+        renderer = renderer or JSONRenderer()
+        if isinstance(renderer, FastJSONRenderer):
+            return lambda row: renderer.render_validated(
+                request, adapter, adapter.validate_python(row, context=context), **dump_kwargs
+            ).decode()
+
+        def render(row: Any) -> str:
+            data = adapter.dump_python(adapter.validate_python(row, context=context), **dump_kwargs)
+            content = renderer.render(request, data, response_status=200)
+
+            return content.decode() if isinstance(content, bytes) else content
+
+        return render
+
+    def _stream(
+        self, result: Iterable, stream_format: StreamFormat, columns: list[str], serialize: Callable[[Any], Any]
+    ) -> Iterator[str]:
+        rows = result.iterator(chunk_size=self.chunk_size) if isinstance(result, QuerySet) else iter(result)
+        chunk = [stream_format.header(columns)]
+        separator = ""
+
+        for row in rows:
+            chunk.append(separator + stream_format.row(columns, serialize(row)))
+            separator = stream_format.separator
+            if len(chunk) >= self.chunk_size:
+                yield "".join(chunk)
+                chunk = []
+
+        chunk.append(stream_format.footer())
+        if content := "".join(chunk):
+            yield content
+
+    async def _astream(
+        self, result: Iterable, stream_format: StreamFormat, columns: list[str], serialize: Callable[[Any], Any]
+    ) -> AsyncIterator[str]:
+        rows = result.aiterator(chunk_size=self.chunk_size) if isinstance(result, QuerySet) else _aiter(result)
+        chunk = [stream_format.header(columns)]
+        separator = ""
+
+        async for row in rows:
+            chunk.append(separator + stream_format.row(columns, serialize(row)))
+            separator = stream_format.separator
+            if len(chunk) >= self.chunk_size:
+                yield "".join(chunk)
+                chunk = []
+
+        chunk.append(stream_format.footer())
+        if content := "".join(chunk):
+            yield content
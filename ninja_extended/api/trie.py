@@ -0,0 +1,264 @@
+"""Module api.trie."""
+
+import re
+from collections.abc import Iterable
+from typing import Any
+
+from django.urls import URLPattern
+from django.urls.converters import PathConverter
+from django.urls.resolvers import RegexPattern, ResolverMatch, RoutePattern
+
+_PARAMETER = re.compile(r"^<(?:(?P<converter>[^>:]+):)?(?P<parameter>[^>]+)>$")
+
+
+class RouteTrieNode:
+    """A node of a RouteTrie, matching one path segment.
+
+    The first index is the position of the first pattern added through the node, a lower bound of the positions of
+    all patterns below the node.
+    """
+
+    __slots__ = ("endpoint", "first", "index", "parameters", "static")
+
+    def __init__(self, first: int) -> None:
+        """Initialize a RouteTrieNode.
+
+        Args:
+            first (int): The position of the first pattern added through the node.
+        """
+
+        self.first = first
+        self.static: dict[str, RouteTrieNode] = {}
+        self.parameters: list[tuple[str, Any, re.Pattern, RouteTrieNode]] = []
+        self.endpoint: URLPattern | None = None
+        self.index = -1
+
+    def static_child(self, segment: str, index: int) -> "RouteTrieNode":
+        """Get the child matching a static segment, added if it does not exist.
+
+        Args:
+            segment (str): The segment.
+            index (int): The position of the pattern.
+
+        Returns:
+            RouteTrieNode: The child.
+        """
+
+        child = self.static.get(segment)
+        if child is None:
+            child = self.static[segment] = RouteTrieNode(index)
+
+        return child
+
+    def parameter_child(self, name: str, converter: Any, index: int) -> "RouteTrieNode":
+        """Get the child matching a path parameter, added if it does not exist.
+
+        Args:
+            name (str): The name of the parameter.
+            converter (Any): The path converter of the parameter.
+            index (int): The position of the pattern.
+
+        Returns:
+            RouteTrieNode: The child.
+        """
+
+        for parameter_name, parameter_converter, _, child in self.parameters:
+            if parameter_name == name and type(parameter_converter) is type(converter):
+                return child
+
+        child = RouteTrieNode(index)
+        self.parameters.append((name, converter, re.compile(converter.regex), child))
+
+        return child
+
+
+class RouteTrie:
+    """A trie of URL patterns by path segment, resolving a path in time proportional to its depth.
+
+    Like Django's resolver, a path resolves to the first added pattern matching it, parameters are converted with
+    their path converter (e.g. ``<int:id>``). Branches are only explored while they can contain an earlier pattern
+    than the best match, so usually a single branch is walked. Only routes whose segments are either static or
+    consist of a single path parameter whose converter does not match slashes can be added.
+    """
+
+    def __init__(self) -> None:
+        """Initialize a RouteTrie."""
+
+        self.root = RouteTrieNode(0)
+        self.size = 0
+
+    def add(self, url_pattern: URLPattern) -> bool:
+        """Add a URL pattern, patterns added before take precedence for equal routes.
+
+        Args:
+            url_pattern (URLPattern): The URL pattern created with ``django.urls.path``.
+
+        Returns:
+            bool: False if the route of the pattern can not be represented in the trie.
+        """
+
+        pattern = url_pattern.pattern
+        if not isinstance(pattern, RoutePattern) or url_pattern.default_args:
+            return False
+
+        segments = []
+        for segment in str(pattern).split("/"):
+            match = _PARAMETER.match(segment)
+            if match is not None:
+                converter = pattern.converters[match["parameter"]]
+                if isinstance(converter, PathConverter):
+                    return False
+                segments.append((match["parameter"], converter))
+            elif "<" in segment or ">" in segment:
+                return False
+            else:
+                segments.append(segment)
+
+        index = self.size
+        self.size += 1
+
+        node = self.root
+        for segment in segments:
+            if isinstance(segment, str):
+                node = node.static_child(segment, index)
+            else:
+                node = node.parameter_child(*segment, index)
+
+        if node.endpoint is None:
+            node.endpoint = url_pattern
+            node.index = index
+
+        return True
+
+    def resolve(self, path: str) -> ResolverMatch | None:
+        """Resolve a path.
+
+        Args:
+            path (str): The path relative to the patterns (without leading slash).
+
+        Returns:
+            ResolverMatch | None: The match or None if no pattern matches.
+        """
+
+        match = self._match(self.root, path.split("/"), 0, {})
+        if match is None:
+            return None
+
+        _, endpoint, kwargs = match
+
+        return ResolverMatch(
+            endpoint.callback,
+            (),
+            kwargs,
+            endpoint.pattern.name,
+            route=str(endpoint.pattern),
+            captured_kwargs=kwargs,
+            extra_kwargs={},
+        )
+
+    def _match(
+        self, node: RouteTrieNode, segments: list[str], index: int, kwargs: dict[str, Any]
+    ) -> tuple[int, URLPattern, dict[str, Any]] | None:
+        if index == len(segments):
+            return (node.index, node.endpoint, kwargs) if node.endpoint is not None else None
+
+        segment = segments[index]
+        best: tuple[int, URLPattern, dict[str, Any]] | None = None
+
+        static = node.static.get(segment)
+        # children are visited in the order of their first pattern, the static child before the parameters added later
+        for name, converter, regex, child in node.parameters:
+            if static is not None and static.first < child.first:
+                best = self._better(best, self._match(static, segments, index + 1, kwargs))
+                static = None
+            if best is not None and best[0] < child.first:
+                return best
+            if regex.fullmatch(segment) is None:
+                continue
+            try:
+                value = converter.to_python(segment)
+            except ValueError:
+                continue
+            best = self._better(best, self._match(child, segments, index + 1, {**kwargs, name: value}))
+
+        if static is not None and (best is None or static.first < best[0]):
+            best = self._better(best, self._match(static, segments, index + 1, kwargs))
+
+        return best
+
+    @staticmethod
+    def _better(
+        best: tuple[int, URLPattern, dict[str, Any]] | None, match: tuple[int, URLPattern, dict[str, Any]] | None
+    ) -> tuple[int, URLPattern, dict[str, Any]] | None:
+        if match is None:
+            return best
+
+        return match if best is None or match[0] < best[0] else best
+
+
+def _unresolvable(*args: Any, **kwargs: Any) -> None:  # pragma: no cover
+    pass
+
+
+class RouteTrieURLPattern(URLPattern):
+    """A single URL pattern dispatching to the patterns of a RouteTrie."""
+
+    def __init__(self, trie: RouteTrie) -> None:
+        """Initialize a RouteTrieURLPattern.
+
+        Args:
+            trie (RouteTrie): The trie.
+        """
+
+        super().__init__(RegexPattern(r"(?!)"), _unresolvable)
+
+        self.trie = trie
+
+    def resolve(self, path: str) -> ResolverMatch | None:
+        """Resolve a path with the trie.
+
+        Args:
+            path (str): The path.
+
+        Returns:
+            ResolverMatch | None: The match or None if no pattern of the trie matches.
+        """
+
+        return self.trie.resolve(path)
+
+
+class ReverseOnlyURLPattern(URLPattern):
+    """A URL pattern only used to reverse URLs, resolved by a RouteTrieURLPattern instead."""
+
+    def resolve(self, path: str) -> None:
+        """Do not resolve a path.
+
+        Args:
+            path (str): The path.
+        """
+
+
+def route_trie_urls(url_patterns: Iterable[URLPattern]) -> list[URLPattern]:
+    """Compile URL patterns into a single pattern resolving them with a RouteTrie.
+
+    The compiled patterns are kept (after the trie pattern) to reverse URLs by name only. Patterns that can not be
+    represented in the trie, e.g. with segments mixing text and parameters or with ``path`` converters, keep being
+    resolved by Django after the trie.
+
+    Args:
+        url_patterns (Iterable[URLPattern]): The URL patterns.
+
+    Returns:
+        list[URLPattern]: The URL patterns.
+    """
+
+    trie = RouteTrie()
+    result: list[URLPattern] = [RouteTrieURLPattern(trie)]
+
+    for url_pattern in url_patterns:
+        if trie.add(url_pattern):
+            result.append(ReverseOnlyURLPattern(url_pattern.pattern, url_pattern.callback, name=url_pattern.name))
+        else:
+            result.append(url_pattern)
+
+    return result
@@ -0,0 +1,169 @@
+"""Module api.trusted."""
+
+from collections import OrderedDict
+from collections.abc import Callable
+from threading import Lock
+from types import UnionType
+from typing import Annotated, Any, Literal, Union, get_args, get_origin
+
+from ninja import Schema
+from ninja.schema import DjangoGetter
+from pydantic.functional_validators import AfterValidator, BeforeValidator, PlainValidator, WrapValidator
+from pydantic_core import PydanticUndefined
+
+Constructor = Callable[[Any, Any], Any]
+
+_PLAIN_TYPES = (str, int, float, bool, bytes)
+_VALIDATORS = (AfterValidator, BeforeValidator, PlainValidator, WrapValidator)
+
+RESPONSE_CONSTRUCTORS_MAXSIZE = 1024
+
+_response_constructors: OrderedDict[Any, Constructor | None] = OrderedDict()
+_response_constructors_lock = Lock()
+_building: set[type[Schema]] = set()
+
+
+def _identity(value: Any, context: Any) -> Any:  # noqa: ARG001
+    return value
+
+
+def _has_validators(metadata: list[Any]) -> bool:
+    return any(isinstance(item, _VALIDATORS) for item in metadata)
+
+
+def _schema_constructor(schema: type[Schema]) -> Constructor | None:
+    """Build a constructor reading the fields of a schema like Ninja's validation but without validating them."""
+
+    decorators = schema.__pydantic_decorators__
+    if (
+        schema in _building
+        or decorators.field_validators
+        or decorators.validators
+        or decorators.root_validators
+        or decorators.model_validators.keys() - {"_run_root_validator"}
+        or any(_has_validators(field.metadata) for field in schema.model_fields.values())
+    ):
+        # recursive schemas and schemas transforming values in validators are validated
+        return None
+
+    fields = []
+    _building.add(schema)
+    try:
+        nested_constructors = [_constructor(field.annotation) for field in schema.model_fields.values()]
+    finally:
+        _building.discard(schema)
+
+    for (name, field), nested in zip(schema.model_fields.items(), nested_constructors, strict=True):
+        if nested is None:
+            return None
+
+        source = field.validation_alias if isinstance(field.validation_alias, str) else field.alias or name
+        fields.append((name, source, field, nested))
+
+    def construct(obj: Any, context: Any) -> Schema:
+        if isinstance(obj, schema):
+            return obj
+
+        getter = DjangoGetter(obj, schema, context)
+        values = {}
+        for name, source, field, nested in fields:
+            try:
+                value = getattr(getter, source)
+            except AttributeError:
+                if field.is_required():
+                    raise
+                value = field.get_default(call_default_factory=True)
+                if value is PydanticUndefined:  # pragma: no cover
+                    continue
+            values[name] = nested(value, context)
+
+        return schema.model_construct(**values)
+
+    return construct
+
+
+def _constructor(annotation: Any) -> Constructor | None:  # noqa: PLR0911
+    """Build a constructor for an annotation or None if values of the annotation have to be validated."""
+
+    if annotation is Any or annotation in _PLAIN_TYPES or annotation is type(None):
+        return _identity
+
+    if isinstance(annotation, type):
+        if issubclass(annotation, Schema):
+            return _schema_constructor(annotation)
+        return None if hasattr(annotation, "model_fields") else _identity
+
+    origin = get_origin(annotation)
+    args = get_args(annotation)
+
+    if origin is Literal:
+        return _identity
+
+    if origin is Annotated:
+        return None if _has_validators(annotation.__metadata__) else _constructor(args[0])
+
+    if origin in (list, tuple, set, frozenset, dict):
+        items = [_constructor(arg) for arg in args if arg is not Ellipsis]
+        if all(item is _identity for item in items):
+            return _identity
+        if origin is not list or items[0] is None:
+            return None
+        item = items[0]
+        return lambda value, context: [item(element, context) for element in value]
+
+    if origin in (Union, UnionType):
+        members = [arg for arg in args if arg is not type(None)]
+        if len(members) != 1:
+            return _identity if all(_constructor(member) is _identity for member in members) else None
+        member = _constructor(members[0])
+        if member is None or member is _identity:
+            return member
+        return lambda value, context: None if value is None else member(value, context)
+
+    return None
+
+
+def response_constructor(annotation: Any, *, cache: bool = True) -> Constructor | None:
+    """Get the constructor building the response for an annotation without validation.
+
+    Schemas are built with ``model_construct`` from the attributes Ninja would validate (resolvers, aliases, dotted
+    sources, defaults), nested schemas, lists and optionals are constructed recursively and other values are passed
+    through without checking constraints. Annotations containing validators, ambiguous unions or plain pydantic models
+    can not be constructed and have no constructor. Constructors are cached per annotation, annotations created at
+    runtime (e.g. restricted to a sparse field set) should not be cached, the cached constructors are evicted least
+    recently used beyond RESPONSE_CONSTRUCTORS_MAXSIZE.
+
+    Args:
+        annotation (Any): The response annotation.
+        cache (bool, optional): Cache the constructor. Defaults to True.
+
+    Returns:
+        Constructor | None: The constructor, called with the result and the validation context, or None.
+    """
+
+    if not cache:
+        return _constructor(annotation)
+
+    try:
+        with _response_constructors_lock:
+            if annotation in _response_constructors:
+                _response_constructors.move_to_end(annotation)
+                return _response_constructors[annotation]
+    except TypeError:
+        return _constructor(annotation)
+
+    constructor = _constructor(annotation)
+    with _response_constructors_lock:
+        constructor = _response_constructors.setdefault(annotation, constructor)
+        _response_constructors.move_to_end(annotation)
+        while len(_response_constructors) > RESPONSE_CONSTRUCTORS_MAXSIZE:
+            _response_constructors.popitem(last=False)
+
+    return constructor
+
+
+def clear_response_constructors() -> None:
+    """Remove all cached constructors."""
+
+    with _response_constructors_lock:
+        _response_constructors.clear()
@@ -17,7 +17,6 @@ from ninja import Schema
 from pydantic import Field
 
 from ninja_extended.api.api import ExtendedNinjaAPI
-from ninja_extended.api.errors import OperationIdNotFoundInAPIError, OperationIdNotFoundInRouterError
 from ninja_extended.api.operation import ExtendedOperation
 from ninja_extended.api.router import ExtendedRouter
 from ninja_extended.errors import APIError
@@ -89,13 +88,7 @@ def get_operation_from_api_by_operation_id(api: ExtendedNinjaAPI, operation_id:
         ExtendedOperation: The operation.
     """
 
-    for _, router in api._routers:  # noqa: SLF001
-        for path_operation in router.path_operations.values():
-            for operation in path_operation.operations:
-                if operation.operation_id == operation_id:
-                    return operation
-
-    raise OperationIdNotFoundInAPIError(api=api, operation_id=operation_id)
+    return api.get_operation(operation_id)
 
 
 def get_operation_from_router_by_operation_id(router: ExtendedRouter, operation_id: str) -> ExtendedOperation:
@@ -111,12 +104,7 @@ def get_operation_from_router_by_operation_id(router: ExtendedRouter, operation_
     Returns:
         ExtendedOperation: The operation.
     """
-    for path_operation in router.path_operations.values():
-        for operation in path_operation.operations:
-            if operation.operation_id == operation_id:
-                return operation
-
-    raise OperationIdNotFoundInRouterError(router=router, operation_id=operation_id)
+    return router.get_operation(operation_id)
 
 
 def is_response_registered_in_operation(  # noqa: PLR0912
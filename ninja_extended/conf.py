@@ -0,0 +1,27 @@
+"""Module conf."""
+
+from django.conf import settings as django_settings
+from pydantic import BaseModel, ConfigDict, Field
+
+
+class Settings(BaseModel):
+    """Settings of Django Ninja Extended, read from the Django settings."""
+
+    model_config = ConfigDict(from_attributes=True)
+
+    # Trusted responses
+    TRUSTED_RESPONSE_VALIDATION_RATE: float = Field(
+        0.0, ge=0.0, le=1.0, alias="NINJA_EXTENDED_TRUSTED_RESPONSE_VALIDATION_RATE"
+    )
+
+    # Lazy operations
+    LAZY_OPERATIONS: bool = Field(default=False, alias="NINJA_EXTENDED_LAZY_OPERATIONS")
+
+    # Route trie
+    ROUTE_TRIE: bool = Field(default=False, alias="NINJA_EXTENDED_ROUTE_TRIE")
+
+    # Query accounting
+    QUERY_BUDGET: int | None = Field(None, ge=0, alias="NINJA_EXTENDED_QUERY_BUDGET")
+
+
+settings = Settings.model_validate(django_settings)
@@ -2,4 +2,15 @@
 
 # ruff: noqa: F401
 
+from ninja_extended.pagination.count import (
+    CachedCount,
+    CappedCount,
+    CountResult,
+    CountStrategy,
+    EstimatedCount,
+    ExactCount,
+    WindowCount,
+)
+from ninja_extended.pagination.has_more import HasMorePagination
+from ninja_extended.pagination.keyset import KeysetPagination
 from ninja_extended.pagination.page_number_page_size import PageNumberPageSizePagination
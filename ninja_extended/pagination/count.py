@@ -0,0 +1,314 @@
+"""Module pagination.count."""
+
+from abc import ABC, abstractmethod
+from hashlib import sha256
+from typing import Any, NamedTuple
+
+from asgiref.sync import sync_to_async
+from django.core.cache import caches
+from django.db import connections
+from django.db.models import Count, QuerySet, Window
+from django.db.models.query import ModelIterable, ValuesIterable, ValuesListIterable
+from ninja import Schema
+
+
+class CountResult(NamedTuple):
+    """Result of a count strategy."""
+
+    count: int
+    exact: bool
+
+
+class CountStrategy(ABC):
+    """Base class for strategies counting the items of a paginated queryset."""
+
+    @abstractmethod
+    def count(self, queryset: QuerySet) -> CountResult:
+        """Count the items of the queryset."""
+
+    @abstractmethod
+    async def acount(self, queryset: QuerySet) -> CountResult:
+        """Count the items of the queryset."""
+
+    def count_page(self, queryset: QuerySet, offset: int, limit: int) -> tuple[list | None, CountResult]:  # noqa: ARG002
+        """Count the items and optionally fetch the page with the same query.
+
+        Args:
+            queryset (QuerySet): The queryset.
+            offset (int): The offset of the page.
+            limit (int): The size of the page.
+
+        Returns:
+            tuple[list | None, CountResult]: The page (None if it was not fetched) and the count.
+        """
+
+        return None, self.count(queryset)
+
+    async def acount_page(self, queryset: QuerySet, offset: int, limit: int) -> tuple[list | None, CountResult]:  # noqa: ARG002
+        """Count the items and optionally fetch the page with the same query.
+
+        Args:
+            queryset (QuerySet): The queryset.
+            offset (int): The offset of the page.
+            limit (int): The size of the page.
+
+        Returns:
+            tuple[list | None, CountResult]: The page (None if it was not fetched) and the count.
+        """
+
+        return None, await self.acount(queryset)
+
+    def display(self, result: CountResult) -> int | str:
+        """Get the count reported in the paginated response."""
+
+        return result.count
+
+    def output_schema(self, output: type[Schema]) -> type[Schema]:
+        """Adapt the output schema of the pagination to the reported count."""
+
+        return output
+
+
+class ExactCount(CountStrategy):
+    """Count the items with a ``COUNT(*)`` query."""
+
+    def count(self, queryset: QuerySet) -> CountResult:
+        """Count the items of the queryset."""
+
+        try:
+            return CountResult(count=queryset.all().count(), exact=True)
+        except AttributeError:
+            return CountResult(count=len(queryset), exact=True)
+
+    async def acount(self, queryset: QuerySet) -> CountResult:
+        """Count the items of the queryset."""
+
+        try:
+            return CountResult(count=await queryset.all().acount(), exact=True)
+        except AttributeError:
+            return CountResult(count=len(queryset), exact=True)
+
+
+class CachedCount(ExactCount):
+    """Cache exact counts for a while, keyed by the compiled SQL and its parameters."""
+
+    def __init__(self, timeout: int = 60, cache_alias: str = "default", key_prefix: str = "ninja_extended:count"):
+        """Initialize a CachedCount.
+
+        Args:
+            timeout (int, optional): The time to live of a cached count in seconds. Defaults to 60.
+            cache_alias (str, optional): The Django cache to store the counts in. Defaults to "default".
+            key_prefix (str, optional): The prefix of the cache keys. Defaults to "ninja_extended:count".
+        """
+
+        self.timeout = timeout
+        self.cache_alias = cache_alias
+        self.key_prefix = key_prefix
+
+    def _key(self, queryset: QuerySet) -> str:
+        sql, params = queryset.query.sql_with_params()
+        digest = sha256(repr((queryset.db, sql, params)).encode()).hexdigest()
+
+        return f"{self.key_prefix}:{digest}"
+
+    def count(self, queryset: QuerySet) -> CountResult:
+        """Count the items of the queryset."""
+
+        if not isinstance(queryset, QuerySet):
+            return super().count(queryset)
+
+        cache = caches[self.cache_alias]
+        key = self._key(queryset)
+        count = cache.get(key)
+
+        if count is None:
+            count = super().count(queryset).count
+            cache.set(key, count, self.timeout)
+
+        return CountResult(count=count, exact=True)
+
+    async def acount(self, queryset: QuerySet) -> CountResult:
+        """Count the items of the queryset."""
+
+        if not isinstance(queryset, QuerySet):
+            return await super().acount(queryset)
+
+        cache = caches[self.cache_alias]
+        key = self._key(queryset)
+        count = await cache.aget(key)
+
+        if count is None:
+            count = (await super().acount(queryset)).count
+            await cache.aset(key, count, self.timeout)
+
+        return CountResult(count=count, exact=True)
+
+
+class EstimatedCount(ExactCount):
+    """Estimate the count of unfiltered querysets from the Postgres planner statistics (``pg_class.reltuples``).
+
+    Filtered, grouped or distinct querysets, other database backends and tables smaller than the threshold are counted exactly.
+    """
+
+    def __init__(self, threshold: int = 10_000):
+        """Initialize an EstimatedCount.
+
+        Args:
+            threshold (int, optional): Estimates below this value are replaced by an exact count. Defaults to 10_000.
+        """
+
+        self.threshold = threshold
+
+    @staticmethod
+    def _is_estimable(queryset: QuerySet) -> bool:
+        query = queryset.query
+
+        return (
+            connections[queryset.db].vendor == "postgresql"
+            and not query.where
+            and not query.distinct
+            and not query.group_by
+            and not query.combinator
+            and not query.is_sliced
+        )
+
+    def _estimate(self, queryset: QuerySet) -> int | None:
+        if not isinstance(queryset, QuerySet) or not self._is_estimable(queryset):
+            return None
+
+        connection = connections[queryset.db]
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "SELECT reltuples::bigint FROM pg_class WHERE oid = %s::regclass",
+                [connection.ops.quote_name(queryset.model._meta.db_table)],  # noqa: SLF001
+            )
+            row = cursor.fetchone()
+
+        if row is None or row[0] < self.threshold:
+            return None
+
+        return row[0]
+
+    def count(self, queryset: QuerySet) -> CountResult:
+        """Count the items of the queryset."""
+
+        estimate = self._estimate(queryset)
+        if estimate is None:
+            return super().count(queryset)
+
+        return CountResult(count=estimate, exact=False)
+
+    async def acount(self, queryset: QuerySet) -> CountResult:
+        """Count the items of the queryset."""
+
+        estimate = await sync_to_async(self._estimate)(queryset)
+        if estimate is None:
+            return await super().acount(queryset)
+
+        return CountResult(count=estimate, exact=False)
+
+
+class CappedCount(ExactCount):
+    """Count at most ``cap`` items, larger counts are reported as ``"<cap>+"``."""
+
+    def __init__(self, cap: int = 1_000):
+        """Initialize a CappedCount.
+
+        Args:
+            cap (int, optional): The maximum number of items to count. Defaults to 1_000.
+        """
+
+        self.cap = cap
+
+    def count(self, queryset: QuerySet) -> CountResult:
+        """Count the items of the queryset."""
+
+        count = super().count(queryset[: self.cap + 1]).count
+
+        return CountResult(count=min(count, self.cap), exact=count <= self.cap)
+
+    async def acount(self, queryset: QuerySet) -> CountResult:
+        """Count the items of the queryset."""
+
+        count = (await super().acount(queryset[: self.cap + 1])).count
+
+        return CountResult(count=min(count, self.cap), exact=count <= self.cap)
+
+    def display(self, result: CountResult) -> int | str:
+        """Get the count reported in the paginated response."""
+
+        return result.count if result.exact else f"{result.count}+"
+
+    def output_schema(self, output: type[Schema]) -> type[Schema]:
+        """Adapt the output schema of the pagination to the reported count."""
+
+        annotations: dict[str, Any] = {"count": int | str}
+
+        return type(f"Capped{output.__name__}", (output,), {"__annotations__": annotations})
+
+
+class WindowCount(ExactCount):
+    """Fetch the page and the total count with a single query by annotating ``COUNT(*) OVER ()``.
+
+    The total is read from the first row of the page, an extra count query is only executed if the page is empty.
+    Querysets of model instances, values() dicts and values_list() tuples are supported, others (e.g. flat or named
+    values_list()) are counted with a separate query.
+    """
+
+    annotation = "_ninja_extended_total_count"
+
+    @staticmethod
+    def _is_windowable(queryset: QuerySet) -> bool:
+        return (
+            isinstance(queryset, QuerySet)
+            and queryset._iterable_class in (ModelIterable, ValuesIterable, ValuesListIterable)  # noqa: SLF001
+            and not queryset.query.distinct
+            and not queryset.query.is_sliced
+        )
+
+    def _annotate(self, queryset: QuerySet, offset: int, limit: int) -> QuerySet:
+        return queryset.annotate(**{self.annotation: Window(expression=Count("*"))})[offset : offset + limit]
+
+    def _total(self, rows: list) -> CountResult:
+        """Read the total count from the first row and remove the annotation from the rows.
+
+        The annotation is the last column of values_list() tuples.
+        """
+
+        if isinstance(rows[0], tuple):
+            count = rows[0][-1]
+            rows[:] = [row[:-1] for row in rows]
+        elif isinstance(rows[0], dict):
+            count = rows[0][self.annotation]
+            for row in rows:
+                del row[self.annotation]
+        else:
+            count = getattr(rows[0], self.annotation)
+            for row in rows:
+                delattr(row, self.annotation)
+
+        return CountResult(count=count, exact=True)
+
+    def count_page(self, queryset: QuerySet, offset: int, limit: int) -> tuple[list | None, CountResult]:
+        """Count the items and fetch the page with the same query."""
+
+        if not self._is_windowable(queryset):
+            return super().count_page(queryset, offset, limit)
+
+        rows = list(self._annotate(queryset, offset, limit))
+        if not rows:
+            return rows, self.count(queryset)
+
+        return rows, self._total(rows)
+
+    async def acount_page(self, queryset: QuerySet, offset: int, limit: int) -> tuple[list | None, CountResult]:
+        """Count the items and fetch the page with the same query."""
+
+        if not self._is_windowable(queryset):
+            return await super().acount_page(queryset, offset, limit)
+
+        rows = [row async for row in self._annotate(queryset, offset, limit)]
+        if not rows:
+            return rows, await self.acount(queryset)
+
+        return rows, self._total(rows)
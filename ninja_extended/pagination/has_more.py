@@ -0,0 +1,92 @@
+"""Module pagination.has_more."""
+
+from typing import Any
+from urllib.parse import urlencode, urlparse
+
+from django.db.models import QuerySet
+from django.http import HttpRequest
+from ninja import Schema
+from ninja.pagination import AsyncPaginationBase
+
+from ninja_extended.pagination.page_number_page_size import PageNumberPageSizePagination, _aevaluate
+
+
+class HasMorePagination(AsyncPaginationBase):
+    """Pagination with page number and page size without counting the items.
+
+    One item more than the page size is fetched to find out whether there is a next page, so no count query is
+    executed and the output has neither ``count`` nor ``pages``.
+    """
+
+    PageNumberPageSizePaginationInput = PageNumberPageSizePagination.PageNumberPageSizePaginationInput
+
+    Input = PageNumberPageSizePaginationInput
+
+    class Output(Schema):
+        """Output for HasMorePagination."""
+
+        current_page: int
+        previous_page: int | None
+        next_page: int | None
+        previous_url: str | None
+        next_url: str | None
+
+    def __init__(self, **kwargs: Any) -> None:
+        """Initialize a HasMorePagination."""
+
+        super().__init__(**kwargs)
+
+    @staticmethod
+    def _page(queryset: QuerySet, pagination: PageNumberPageSizePaginationInput) -> QuerySet:
+        offset = (pagination.page - 1) * pagination.page_size
+
+        return queryset[offset : offset + pagination.page_size + 1]
+
+    @staticmethod
+    def _result(items: list, pagination: PageNumberPageSizePaginationInput, request: HttpRequest) -> dict[str, Any]:
+        """Build the paginated result from the page fetched with one extra item."""
+
+        next_page, previous_page = None, None
+        next_url, previous_url = None, None
+        query_params = request.GET.copy()
+        query_params["page_size"] = pagination.page_size
+
+        if pagination.page > 1:
+            previous_page = pagination.page - 1
+            query_params["page"] = previous_page
+            previous_url = request.build_absolute_uri(f"{urlparse(request.path).path}?{urlencode(query=query_params)}")
+        if len(items) > pagination.page_size:
+            next_page = pagination.page + 1
+            query_params["page"] = next_page
+            next_url = request.build_absolute_uri(f"{urlparse(request.path).path}?{urlencode(query=query_params)}")
+
+        return {
+            "current_page": pagination.page,
+            "previous_page": previous_page,
+            "next_page": next_page,
+            "previous_url": previous_url,
+            "next_url": next_url,
+            "items": items[: pagination.page_size],
+        }
+
+    def paginate_queryset(
+        self,
+        queryset: QuerySet,
+        pagination: PageNumberPageSizePaginationInput,
+        request: HttpRequest,
+        **params: Any,  # noqa: ARG002
+    ) -> Any:
+        """Paginate the queryset."""
+
+        return self._result(list(self._page(queryset, pagination)), pagination, request)
+
+    async def apaginate_queryset(
+        self,
+        queryset: QuerySet,
+        pagination: PageNumberPageSizePaginationInput,
+        request: HttpRequest,
+        **params: Any,  # noqa: ARG002
+    ) -> Any:
+        """Paginate the queryset."""
+
+        return self._result(await _aevaluate(self._page(queryset, pagination)), pagination, request)
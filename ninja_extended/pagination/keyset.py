@@ -0,0 +1,424 @@
+"""Module pagination.keyset."""
+
+import datetime
+from typing import Any, Literal, NamedTuple
+from urllib.parse import urlencode, urlparse
+
+from django.core import signing
+from django.core.exceptions import FieldDoesNotExist
+from django.core.exceptions import ValidationError as DjangoValidationError
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import connections
+from django.db.models import F, Field, Model, OrderBy, Q, QuerySet
+from django.db.models.query import ValuesIterable
+from django.http import HttpRequest
+from ninja import Field as SchemaField
+from ninja import Schema
+from ninja.conf import settings
+from ninja.errors import ConfigError, ValidationError
+from ninja.pagination import AsyncPaginationBase
+
+CURSOR_SALT = "ninja_extended.pagination.keyset"
+
+Direction = Literal["next", "previous"]
+
+
+class OrderingColumn(NamedTuple):
+    """A column of the keyset ordering.
+
+    ``nulls_largest`` is None for columns that can not be NULL, otherwise it tells whether NULLs are ordered after
+    (True) or before (False) all other values in ascending order.
+    """
+
+    lookup: str
+    descending: bool
+    nulls_largest: bool | None = None
+
+    @property
+    def signature(self) -> str:
+        """Get the signature of the column stored in cursors, e.g. "-created" or "name nulls_largest"."""
+
+        signature = f"-{self.lookup}" if self.descending else self.lookup
+        if self.nulls_largest is None:
+            return signature
+
+        return f"{signature} nulls_{'largest' if self.nulls_largest else 'smallest'}"
+
+    def order_by(self, reverse: bool) -> str | OrderBy:  # noqa: FBT001
+        """Get the ordering expression of the column with an explicit NULL placement.
+
+        Args:
+            reverse (bool): Whether to reverse the direction.
+
+        Returns:
+            str | OrderBy: The expression.
+        """
+
+        descending = self.descending != reverse
+        if self.nulls_largest is None:
+            return f"-{self.lookup}" if descending else self.lookup
+
+        nulls_first = self.nulls_largest == descending
+
+        return OrderBy(
+            F(self.lookup), descending=descending, nulls_first=nulls_first or None, nulls_last=not nulls_first or None
+        )
+
+
+def _resolve_field(model: type[Model], lookup: str) -> tuple[Field, bool]:
+    """Resolve a (possibly related) ordering lookup to its model field.
+
+    Args:
+        model (type[Model]): The model.
+        lookup (str): The ordering lookup, e.g. "resource__value_unique".
+
+    Raises:
+        ConfigError: If the lookup does not resolve to a concrete field, e.g. an annotation.
+
+    Returns:
+        tuple[Field, bool]: The field and whether the lookup can be NULL (including NULLs of nullable relations).
+    """
+
+    invalid_lookup_message = (
+        f"Ordering lookup '{lookup}' can not be used for keyset pagination, only (related) model fields are supported."
+    )
+    field = None
+    nullable = False
+
+    for part in lookup.split("__"):
+        if model is None:
+            raise ConfigError(invalid_lookup_message)
+        try:
+            field = model._meta.pk if part == "pk" else model._meta.get_field(part)  # noqa: SLF001
+        except FieldDoesNotExist:
+            raise ConfigError(invalid_lookup_message) from None
+        nullable = nullable or field.null
+        model = field.related_model
+
+    if field is None or field.is_relation and not field.concrete:
+        raise ConfigError(invalid_lookup_message)
+
+    return field, nullable
+
+
+def _lookup_value(item: Any, lookup: str) -> Any:
+    """Get the value of an ordering lookup from a model instance or a values() row."""
+
+    if isinstance(item, dict):
+        return item[lookup]
+
+    for part in lookup.split("__"):
+        if item is None:
+            return None
+        item = getattr(item, part)
+
+    return item.pk if isinstance(item, Model) else item
+
+
+class KeysetPagination(AsyncPaginationBase):
+    """Keyset (cursor) pagination.
+
+    Instead of skipping rows with ``OFFSET``, the next page is selected with a seek predicate on the active ordering
+    of the queryset (including orderings applied by a ``SortSchema``), so every page costs the same as the first one.
+    The primary key is appended to the ordering as a tie-breaker if it is not already part of it.
+    """
+
+    class KeysetPaginationInput(Schema):
+        """Input for KeysetPagination."""
+
+        cursor: str | None = SchemaField(default=None, description="The cursor of the page.")
+        page_size: int = SchemaField(default=settings.PAGINATION_PER_PAGE, ge=1, description="The page size.")
+
+    Input = KeysetPaginationInput
+
+    class Output(Schema):
+        """Output for KeysetPagination."""
+
+        previous_cursor: str | None
+        next_cursor: str | None
+        previous_url: str | None
+        next_url: str | None
+
+    def __init__(self, **kwargs: Any) -> None:
+        """Initialize a KeysetPagination."""
+
+        super().__init__(**kwargs)
+
+    @staticmethod
+    def _ordering(queryset: QuerySet) -> list[OrderingColumn]:
+        """Get the ordering of the queryset, ending with the primary key.
+
+        The lookups are validated on every page, so orderings on annotations or other non-model fields fail on the
+        first page already. NULLs are placed as in the ordering of the queryset, defaulting to the database's
+        placement.
+
+        Args:
+            queryset (QuerySet): The queryset.
+
+        Raises:
+            ConfigError: If the ordering can not be used for keyset pagination.
+
+        Returns:
+            list[OrderingColumn]: The ordering.
+        """
+
+        order_by = queryset.query.order_by
+        if not order_by and queryset.query.default_ordering:
+            order_by = queryset.model._meta.ordering  # noqa: SLF001
+
+        nulls_order_largest = connections[queryset.db].features.nulls_order_largest
+        ordering = []
+        for order in order_by:
+            nulls_largest = nulls_order_largest
+            if isinstance(order, str) and order != "?":
+                lookup, descending = order.lstrip("-"), order.startswith("-")
+            elif isinstance(order, OrderBy) and isinstance(order.expression, F):
+                lookup, descending = order.expression.name, order.descending
+                if order.nulls_first or order.nulls_last:
+                    nulls_largest = bool(order.nulls_first) == descending
+            elif isinstance(order, F):
+                lookup, descending = order.name, False
+            else:
+                invalid_ordering_message = f"Ordering '{order}' can not be used for keyset pagination."
+                raise ConfigError(invalid_ordering_message)
+
+            _, nullable = _resolve_field(queryset.model, lookup)
+            ordering.append(OrderingColumn(lookup, descending, nulls_largest if nullable else None))
+
+        pk_name = queryset.model._meta.pk.name  # noqa: SLF001
+        if not any(column.lookup in ("pk", pk_name) for column in ordering):
+            ordering.append(OrderingColumn(pk_name, descending=False))
+
+        return ordering
+
+    @staticmethod
+    def _beyond(column: OrderingColumn, value: Any, operator: str) -> Q:
+        """Build the predicate for the values of a column greater (gt) or less (lt) than a value, including NULLs."""
+
+        if column.nulls_largest is None:
+            return Q(**{f"{column.lookup}__{operator}": value})
+
+        towards_nulls = column.nulls_largest == (operator == "gt")
+        if value is None:
+            # NULL is the last value towards the NULLs and every non-NULL value lies beyond it in the other direction
+            return Q(pk__in=[]) if towards_nulls else Q(**{f"{column.lookup}__isnull": False})
+
+        predicate = Q(**{f"{column.lookup}__{operator}": value})
+
+        return predicate | Q(**{f"{column.lookup}__isnull": True}) if towards_nulls else predicate
+
+    @staticmethod
+    def _equal(column: OrderingColumn, value: Any) -> Q:
+        """Build the predicate for the values of a column equal to a value (or NULL)."""
+
+        if value is None:
+            return Q(**{f"{column.lookup}__isnull": True})
+
+        return Q(**{column.lookup: value})
+
+    @classmethod
+    def _seek(cls, ordering: list[OrderingColumn], values: list[Any], direction: Direction) -> Q:
+        """Build the seek predicate for the rows after (or before) the given cursor values.
+
+        Args:
+            ordering (list[OrderingColumn]): The ordering.
+            values (list[Any]): The values of the ordering lookups of the cursor row.
+            direction (Direction): The direction to seek in.
+
+        Returns:
+            Q: The seek predicate.
+        """
+
+        predicate = Q(pk__in=[])
+        for index, column in enumerate(ordering):
+            operator = "lt" if column.descending == (direction == "next") else "gt"
+            condition = cls._beyond(column, values[index], operator)
+            for previous_column, previous_value in zip(ordering[:index], values[:index], strict=True):
+                condition &= cls._equal(previous_column, previous_value)
+            predicate |= condition
+
+        return predicate
+
+    @staticmethod
+    def _encode_cursor(ordering: list[OrderingColumn], item: Any, direction: Direction) -> str:
+        """Encode a signed cursor pointing to the given item.
+
+        Datetimes and times are encoded in full ISO 8601 precision, as the JSON encoder truncates them to milliseconds
+        and rows differing below a millisecond would be skipped or repeated.
+        """
+
+        encoder = DjangoJSONEncoder()
+        values = []
+        for column in ordering:
+            value = _lookup_value(item, column.lookup)
+            if isinstance(value, datetime.datetime | datetime.time):
+                value = value.isoformat()
+            elif value is not None and not isinstance(value, bool | int | float | str):
+                value = encoder.default(value)
+            values.append(value)
+
+        return signing.dumps(
+            {"d": direction, "o": [column.signature for column in ordering], "v": values},
+            salt=CURSOR_SALT,
+        )
+
+    @staticmethod
+    def _decode_cursor(queryset: QuerySet, ordering: list[OrderingColumn], cursor: str) -> tuple[Direction, list]:
+        """Decode and verify a signed cursor.
+
+        Args:
+            queryset (QuerySet): The queryset.
+            ordering (list[OrderingColumn]): The ordering.
+            cursor (str): The cursor.
+
+        Raises:
+            ValidationError: If the cursor is invalid or does not match the ordering.
+
+        Returns:
+            tuple[Direction, list]: The direction and the ordering values of the cursor.
+        """
+
+        try:
+            payload = signing.loads(cursor, salt=CURSOR_SALT)
+            if payload["d"] not in ("next", "previous") or payload["o"] != [column.signature for column in ordering]:
+                raise ValueError  # noqa: TRY301
+
+            values = [
+                None if value is None else _resolve_field(queryset.model, column.lookup)[0].to_python(value)
+                for column, value in zip(ordering, payload["v"], strict=True)
+            ]
+        except (
+            signing.BadSignature,
+            DjangoValidationError,
+            FieldDoesNotExist,
+            KeyError,
+            TypeError,
+            ValueError,
+        ) as error:
+            raise ValidationError(
+                errors=[
+                    {
+                        "type": "value_error",
+                        "loc": ("query", "cursor"),
+                        "msg": "Invalid cursor",
+                    }
+                ]
+            ) from error
+
+        return payload["d"], values
+
+    @staticmethod
+    def _select_ordering(queryset: QuerySet, ordering: list[OrderingColumn]) -> tuple[QuerySet, tuple[str, ...]]:
+        """Add the ordering columns missing from the selection of a values() queryset.
+
+        Args:
+            queryset (QuerySet): The queryset.
+            ordering (list[OrderingColumn]): The ordering.
+
+        Raises:
+            ConfigError: If the queryset returns rows other than model instances and dicts, e.g. of values_list().
+
+        Returns:
+            tuple[QuerySet, tuple[str, ...]]: The queryset and the added columns, to be removed from the rows again.
+        """
+
+        if queryset._fields is None:
+            return queryset, ()
+
+        if not issubclass(queryset._iterable_class, ValuesIterable):  # noqa: SLF001
+            raise ConfigError("KeysetPagination does not support values_list() querysets.")  # noqa: EM101
+
+        fields = queryset._fields or tuple(field.attname for field in queryset.model._meta.concrete_fields)  # noqa: SLF001
+        hidden = tuple(column.lookup for column in ordering if column.lookup not in fields)
+        if not hidden:
+            return queryset, ()
+
+        return queryset.values(*fields, *hidden), hidden
+
+    def _prepare(self, queryset: QuerySet, pagination: KeysetPaginationInput) -> tuple:
+        """Prepare the queryset for fetching the page."""
+
+        if not isinstance(queryset, QuerySet):
+            raise ConfigError("KeysetPagination requires the operation to return a QuerySet.")  # noqa: EM101
+
+        ordering = self._ordering(queryset)
+        queryset, hidden = self._select_ordering(queryset, ordering)
+        direction: Direction = "next"
+        if pagination.cursor is not None:
+            direction, values = self._decode_cursor(queryset, ordering, pagination.cursor)
+            queryset = queryset.filter(self._seek(ordering, values, direction))
+
+        reverse = direction == "previous"
+        queryset = queryset.order_by(*[column.order_by(reverse) for column in ordering])
+
+        return ordering, direction, queryset[: pagination.page_size + 1], hidden
+
+    def _result(  # noqa: PLR0913
+        self,
+        items: list,
+        ordering: list[OrderingColumn],
+        direction: Direction,
+        pagination: KeysetPaginationInput,
+        request: HttpRequest,
+        hidden: tuple[str, ...] = (),
+    ) -> dict[str, Any]:
+        """Build the paginated result from the fetched rows, removing the hidden columns of values() rows."""
+
+        has_more = len(items) > pagination.page_size
+        items = items[: pagination.page_size]
+        if direction == "previous":
+            items.reverse()
+
+        has_next = has_more if direction == "next" else True
+        has_previous = has_more if direction == "previous" else pagination.cursor is not None
+
+        next_cursor, previous_cursor = None, None
+        next_url, previous_url = None, None
+        query_params = request.GET.copy()
+        query_params["page_size"] = pagination.page_size
+
+        if items and has_previous:
+            previous_cursor = self._encode_cursor(ordering, items[0], "previous")
+            query_params["cursor"] = previous_cursor
+            previous_url = request.build_absolute_uri(f"{urlparse(request.path).path}?{urlencode(query=query_params)}")
+        if items and has_next:
+            next_cursor = self._encode_cursor(ordering, items[-1], "next")
+            query_params["cursor"] = next_cursor
+            next_url = request.build_absolute_uri(f"{urlparse(request.path).path}?{urlencode(query=query_params)}")
+
+        if hidden:
+            items = [{key: value for key, value in item.items() if key not in hidden} for item in items]
+
+        return {
+            "previous_cursor": previous_cursor,
+            "next_cursor": next_cursor,
+            "previous_url": previous_url,
+            "next_url": next_url,
+            "items": items,
+        }
+
+    def paginate_queryset(
+        self,
+        queryset: QuerySet,
+        pagination: KeysetPaginationInput,
+        request: HttpRequest,
+        **params: Any,  # noqa: ARG002
+    ) -> Any:
+        """Paginate the queryset."""
+
+        ordering, direction, page, hidden = self._prepare(queryset, pagination)
+
+        return self._result(list(page), ordering, direction, pagination, request, hidden)
+
+    async def apaginate_queryset(
+        self,
+        queryset: QuerySet,
+        pagination: KeysetPaginationInput,
+        request: HttpRequest,
+        **params: Any,  # noqa: ARG002
+    ) -> Any:
+        """Paginate the queryset."""
+
+        ordering, direction, page, hidden = self._prepare(queryset, pagination)
+
+        return self._result([item async for item in page], ordering, direction, pagination, request, hidden)
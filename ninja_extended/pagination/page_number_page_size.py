@@ -1,6 +1,6 @@
 """Module pagination.page_number_page_size."""
 
-from collections.abc import AsyncGenerator, Callable
+from collections.abc import Callable, Iterable
 from functools import partial, wraps
 from math import ceil
 from typing import Any
@@ -9,6 +9,7 @@ from urllib.parse import urlencode, urlparse
 import ninja.pagination
 from django.db.models import QuerySet
 from django.http import HttpRequest
+from django.http.response import HttpResponseBase
 from ninja import Field, Schema
 from ninja.conf import settings
 from ninja.errors import ConfigError, ValidationError
@@ -19,6 +20,49 @@ from ninja.utils import (
     is_async_callable,
 )
 
+from ninja_extended.api.instrumentation import phase
+from ninja_extended.pagination.count import CountResult, CountStrategy, ExactCount
+
+
+async def _aevaluate(items: Iterable) -> list:
+    """Evaluate a page of items without blocking the event loop.
+
+    Args:
+        items (Iterable): The items, either a QuerySet (slice) or an already evaluated iterable.
+
+    Returns:
+        list: The evaluated items.
+    """
+
+    if isinstance(items, QuerySet):
+        return [item async for item in items]
+
+    return list(items)
+
+
+def _prepare_items(view_func: Callable, request: HttpRequest, items: Any) -> Any:
+    """Let the operation of the view prepare the items (e.g. plan the queryset) before they are paginated.
+
+    The operation may also replace the items with a response, e.g. to stream them instead of paginating them or to
+    answer a conditional request with 304 Not Modified.
+    """
+
+    operation = getattr(view_func, "_ninja_operation", None)
+    if hasattr(operation, "prepare_items"):
+        return operation.prepare_items(request, items)
+
+    return items
+
+
+async def _aprepare_items(view_func: Callable, request: HttpRequest, items: Any) -> Any:
+    """Let the operation of the async view prepare the items before they are paginated (async)."""
+
+    operation = getattr(view_func, "_ninja_operation", None)
+    if hasattr(operation, "aprepare_items"):
+        return await operation.aprepare_items(request, items)
+
+    return _prepare_items(view_func, request, items)
+
 
 def _inject_page_number_page_size_pagination(
     func: Callable,
@@ -36,18 +80,17 @@ def _inject_page_number_page_size_pagination(
             if paginator.pass_parameter:
                 kwargs[paginator.pass_parameter] = pagination_params
 
-            items = await func(request, **kwargs)
+            items = await _aprepare_items(view_with_pagination, request, await func(request, **kwargs))
+            if isinstance(items, HttpResponseBase):
+                return items
 
-            result = await paginator.apaginate_queryset(items, pagination=pagination_params, request=request, **kwargs)
+            with phase(request, "pagination"):
+                result = await paginator.apaginate_queryset(
+                    items, pagination=pagination_params, request=request, **kwargs
+                )
 
-            async def evaluate(results: list | QuerySet) -> AsyncGenerator:
-                for result in results:
-                    yield result
-
-            if paginator.Output:
-                result[paginator.items_attribute] = [
-                    result async for result in evaluate(result[paginator.items_attribute])
-                ]
+                if paginator.Output:
+                    result[paginator.items_attribute] = await _aevaluate(result[paginator.items_attribute])
             return result
 
     else:
@@ -58,18 +101,21 @@ def _inject_page_number_page_size_pagination(
             if paginator.pass_parameter:
                 kwargs[paginator.pass_parameter] = pagination_params
 
-            items = func(request, **kwargs)
+            items = _prepare_items(view_with_pagination, request, func(request, **kwargs))
+            if isinstance(items, HttpResponseBase):
+                return items
 
-            result = paginator.paginate_queryset(items, pagination=pagination_params, request=request, **kwargs)
-            if paginator.Output:
-                result[paginator.items_attribute] = list(result[paginator.items_attribute])
-                # ^ forcing queryset evaluation #TODO: check why pydantic did not do it here
+            with phase(request, "pagination"):
+                result = paginator.paginate_queryset(items, pagination=pagination_params, request=request, **kwargs)
+                if paginator.Output:
+                    result[paginator.items_attribute] = list(result[paginator.items_attribute])
+                    # ^ forcing queryset evaluation #TODO: check why pydantic did not do it here
             return result
 
     contribute_operation_args(
         view_with_pagination,
         "ninja_pagination",
-        paginator.PageNumberPageSizePaginationInput,
+        paginator.Input,
         paginator.InputSource,
     )
 
@@ -94,6 +140,8 @@ class PageNumberPageSizePagination(AsyncPaginationBase):
         page: int = Field(default=1, ge=1, description="The page number.")
         page_size: int = Field(default=settings.PAGINATION_PER_PAGE, ge=1, description="The page size.")
 
+    Input = PageNumberPageSizePaginationInput
+
     class Output(Schema):
         """Output for PageNumberPagination."""
 
@@ -105,23 +153,22 @@ class PageNumberPageSizePagination(AsyncPaginationBase):
         previous_url: str | None
         next_url: str | None
 
-    def __init__(self, **kwargs: Any) -> None:
-        """Initialize a PageNumberPageSizePagination."""
+    def __init__(self, count_strategy: CountStrategy | None = None, **kwargs: Any) -> None:
+        """Initialize a PageNumberPageSizePagination.
+
+        Args:
+            count_strategy (CountStrategy | None, optional): The strategy counting the items. Defaults to ExactCount().
+            **kwargs: Additional keyword arguments.
+        """
 
         super().__init__(**kwargs)
 
-    def paginate_queryset(
-        self,
-        queryset: QuerySet,
-        pagination: PageNumberPageSizePaginationInput,
-        request: HttpRequest,
-        **params: Any,  # noqa: ARG002
-    ) -> Any:
-        """Paginate the queryset."""
+        self.count_strategy = count_strategy or ExactCount()
+        self.Output = self.count_strategy.output_schema(self.Output)
 
-        offset = (pagination.page - 1) * pagination.page_size
-        count = self._items_count(queryset)
-        pages = ceil(count / pagination.page_size)
+    @staticmethod
+    def _validate_page(pagination: PageNumberPageSizePaginationInput, pages: int) -> None:
+        """Validate that the requested page is not beyond the last page."""
 
         if pagination.page > pages:
             raise ValidationError(
@@ -137,17 +184,32 @@ class PageNumberPageSizePagination(AsyncPaginationBase):
                 ]
             )
 
-        if count == 0:
-            return {
-                "count": 0,
-                "current_page": 0,
-                "pages": 0,
-                "previous_page": None,
-                "next_page": None,
-                "previous_url": None,
-                "next_url": None,
-                "items": [],
-            }
+    @staticmethod
+    def _empty_result() -> dict[str, Any]:
+        """Get the result for an empty queryset."""
+
+        return {
+            "count": 0,
+            "current_page": 0,
+            "pages": 0,
+            "previous_page": None,
+            "next_page": None,
+            "previous_url": None,
+            "next_url": None,
+            "items": [],
+        }
+
+    def _result(  # noqa: PLR0913
+        self,
+        items: Any,
+        count_result: CountResult,
+        pages: int,
+        pagination: PageNumberPageSizePaginationInput,
+        request: HttpRequest,
+        *,
+        has_next: bool,
+    ) -> dict[str, Any]:
+        """Build the paginated result for a page of items."""
 
         next_page, previous_page = None, None
         next_url, previous_url = None, None
@@ -158,23 +220,46 @@ class PageNumberPageSizePagination(AsyncPaginationBase):
             previous_page = pagination.page - 1
             query_params["page"] = previous_page
             previous_url = request.build_absolute_uri(f"{urlparse(request.path).path}?{urlencode(query=query_params)}")
-        if offset + pagination.page_size < count:
+        if has_next:
             next_page = pagination.page + 1
             query_params["page"] = next_page
             next_url = request.build_absolute_uri(f"{urlparse(request.path).path}?{urlencode(query=query_params)}")
 
         return {
-            "count": count,
+            "count": self.count_strategy.display(count_result),
             "current_page": pagination.page,
             "pages": pages,
             "previous_page": previous_page,
             "next_page": next_page,
             "previous_url": previous_url,
             "next_url": next_url,
-            "items": queryset[offset : offset + pagination.page_size],
+            "items": items,
         }
 
-    def apaginate_queryset(
+    def _inexact_result(
+        self,
+        items: list,
+        count_result: CountResult,
+        pagination: PageNumberPageSizePaginationInput,
+        request: HttpRequest,
+    ) -> dict[str, Any]:
+        """Build the paginated result for a page fetched with one extra item, used when the count is not exact.
+
+        Since the count is only an estimate or a lower bound, the next page is derived from the extra item. An empty
+        page beyond the first one is rejected, and the last page with items caps the number of pages.
+        """
+
+        has_next = len(items) > pagination.page_size
+        counted_pages = ceil(count_result.count / pagination.page_size)
+
+        if not items and pagination.page > 1:
+            self._validate_page(pagination, max(min(counted_pages, pagination.page - 1), 1))
+
+        pages = max(counted_pages, pagination.page + 1) if has_next else pagination.page
+
+        return self._result(items[: pagination.page_size], count_result, pages, pagination, request, has_next=has_next)
+
+    def paginate_queryset(
         self,
         queryset: QuerySet,
         pagination: PageNumberPageSizePaginationInput,
@@ -184,56 +269,62 @@ class PageNumberPageSizePagination(AsyncPaginationBase):
         """Paginate the queryset."""
 
         offset = (pagination.page - 1) * pagination.page_size
-        count = self._aitems_count(queryset)
-        pages = ceil(count / pagination.page_size)
+        items, count_result = self.count_strategy.count_page(queryset, offset, pagination.page_size)
 
-        if pagination.page > pages:
-            raise ValidationError(
-                errors=[
-                    {
-                        "type": "less_than_equal",
-                        "loc": ("query", "page"),
-                        "msg": f"Input should be less than or equal to {pages}",
-                        "ctx": {
-                            "le": pages,
-                        },
-                    }
-                ]
-            )
+        if not count_result.exact:
+            items = list(queryset[offset : offset + pagination.page_size + 1])
+            return self._inexact_result(items, count_result, pagination, request)
 
-        if count == 0:
-            return {
-                "count": 0,
-                "current_page": 0,
-                "pages": 0,
-                "previous_page": None,
-                "next_page": None,
-                "previous_url": None,
-                "next_url": None,
-                "items": [],
-            }
+        pages = ceil(count_result.count / pagination.page_size)
 
-        next_page, previous_page = None, None
-        next_url, previous_url = None, None
-        query_params = request.GET.copy()
-        query_params["page_size"] = pagination.page_size
+        self._validate_page(pagination, pages)
 
-        if pagination.page > 1:
-            previous_page = pagination.page - 1
-            query_params["page"] = previous_page
-            previous_url = request.build_absolute_uri(f"{urlparse(request.path).path}?{urlencode(query=query_params)}")
-        if offset + pagination.page_size < count:
-            next_page = pagination.page + 1
-            query_params["page"] = next_page
-            next_url = request.build_absolute_uri(f"{urlparse(request.path).path}?{urlencode(query=query_params)}")
+        if count_result.count == 0:
+            return self._empty_result()
 
-        return {
-            "count": count,
-            "current_page": pagination.page,
-            "pages": pages,
-            "previous_page": previous_page,
-            "next_page": next_page,
-            "previous_url": previous_url,
-            "next_url": next_url,
-            "items": queryset[offset : offset + pagination.page_size],
-        }
+        if items is None:
+            items = queryset[offset : offset + pagination.page_size]
+
+        return self._result(
+            items,
+            count_result,
+            pages,
+            pagination,
+            request,
+            has_next=offset + pagination.page_size < count_result.count,
+        )
+
+    async def apaginate_queryset(
+        self,
+        queryset: QuerySet,
+        pagination: PageNumberPageSizePaginationInput,
+        request: HttpRequest,
+        **params: Any,  # noqa: ARG002
+    ) -> Any:
+        """Paginate the queryset."""
+
+        offset = (pagination.page - 1) * pagination.page_size
+        items, count_result = await self.count_strategy.acount_page(queryset, offset, pagination.page_size)
+
+        if not count_result.exact:
+            items = await _aevaluate(queryset[offset : offset + pagination.page_size + 1])
+            return self._inexact_result(items, count_result, pagination, request)
+
+        pages = ceil(count_result.count / pagination.page_size)
+
+        self._validate_page(pagination, pages)
+
+        if count_result.count == 0:
+            return self._empty_result()
+
+        if items is None:
+            items = await _aevaluate(queryset[offset : offset + pagination.page_size])
+
+        return self._result(
+            items,
+            count_result,
+            pages,
+            pagination,
+            request,
+            has_next=offset + pagination.page_size < count_result.count,
+        )
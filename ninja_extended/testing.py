@@ -0,0 +1,56 @@
+"""Module testing."""
+
+from collections.abc import Iterator
+from contextlib import contextmanager
+
+from ninja_extended.api.api import ExtendedNinjaAPI
+from ninja_extended.api.queries import QueryAccounting, QueryStats
+
+
+@contextmanager
+def assert_query_budget(
+    api: ExtendedNinjaAPI, operation_id: str, max_queries: int, *, max_duplicates: int | None = None
+) -> Iterator[QueryStats]:
+    """Assert that every request of an operation within the block stays within a query budget.
+
+    Example:
+        with assert_query_budget(api, "listResources", 2):
+            test_client.get("/resources/")
+
+    Args:
+        api (ExtendedNinjaAPI): The API of the operation.
+        operation_id (str): The operation id.
+        max_queries (int): The maximum number of queries per request.
+        max_duplicates (int | None, optional): The maximum number of repeated executions of the same query over all
+            requests (N+1 queries). Defaults to None (not checked).
+
+    Raises:
+        AssertionError: If the operation was not called or exceeded the budget.
+
+    Yields:
+        QueryStats: The query stats of the operation, complete after the block.
+    """
+
+    accounting = QueryAccounting()
+    accounting.stats[operation_id] = stats = QueryStats()
+    api.instrumentation.append(accounting)
+    try:
+        yield stats
+    finally:
+        api.instrumentation.remove(accounting)
+
+    if not stats.requests:
+        msg = f"Operation '{operation_id}' was not called."
+        raise AssertionError(msg)
+
+    if stats.max_queries > max_queries:
+        msg = f"Operation '{operation_id}' executed {stats.max_queries} queries, expected at most {max_queries}."
+        raise AssertionError(msg)
+
+    duplicates = sum(stats.duplicates.values())
+    if max_duplicates is not None and duplicates > max_duplicates:
+        msg = (
+            f"Operation '{operation_id}' repeated queries {duplicates} times, expected at most {max_duplicates}: "
+            f"{dict(stats.duplicates)}"
+        )
+        raise AssertionError(msg)
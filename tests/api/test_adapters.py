@@ -0,0 +1,118 @@
+from django.http import HttpRequest
+from ninja import Schema
+from ninja.testing import TestClient
+
+from ninja_extended.api import adapters
+from ninja_extended.api.adapters import response_adapter, response_models
+from ninja_extended.api.api import ExtendedNinjaAPI
+from ninja_extended.api.registry import RouterOperationRegistry
+from ninja_extended.api.router import ExtendedRouter
+from ninja_extended.api.utils import response_factory
+from ninja_extended.errors import (
+    CheckConstraintError,
+    NotNullConstraintError,
+    UniqueConstraintError,
+    ValidationError,
+)
+
+
+def test_response_adapter_interns_discriminated_unions():
+    response_1 = response_factory(UniqueConstraintError, CheckConstraintError, NotNullConstraintError)
+    response_2 = response_factory(NotNullConstraintError, UniqueConstraintError, CheckConstraintError)
+
+    adapter = response_adapter(response_1[422])
+
+    assert response_1[422] != response_2[422]
+    assert response_adapter(response_2[422]) is adapter
+    assert response_adapter(response_factory(UniqueConstraintError, CheckConstraintError)[422]) is not adapter
+
+
+def test_response_adapter_evicts_least_recently_used_adapters(monkeypatch):
+    monkeypatch.setattr(adapters, "RESPONSE_ADAPTERS_MAXSIZE", 2)
+    adapters.clear_response_adapters()
+
+    adapter = response_adapter(list[int])
+    response_adapter(list[str])
+    assert response_adapter(list[int]) is adapter
+    response_adapter(list[bytes])
+
+    assert response_adapter(list[int]) is adapter
+    assert len(adapters._response_adapters) == 2  # noqa: SLF001
+    assert list[str] not in adapters._response_adapters  # noqa: SLF001
+
+
+def test_registry_reset_clears_response_adapters():
+    response_adapter(list[int])
+
+    RouterOperationRegistry.reset()
+
+    assert not adapters._response_adapters  # noqa: SLF001
+
+
+def test_response_adapter_validates_flattened_discriminated_union():
+    adapter = response_adapter(
+        response_factory(UniqueConstraintError, CheckConstraintError, NotNullConstraintError, ValidationError)[422]
+    )
+
+    error = adapter.validate_python(
+        {"type": "errors/check-constraint", "status": 422, "resource": "Resource", "path": "/", "operation_id": "id"}
+    )
+
+    assert isinstance(error, CheckConstraintError.schema)
+
+
+def test_operations_intern_discriminated_union_adapters():
+    api = ExtendedNinjaAPI(title="API", version="1.0.0", description="Description", urls_namespace="test-adapters")
+    router = ExtendedRouter(tags=["router"])
+    error = {
+        "type": "errors/check-constraint",
+        "status": 422,
+        "resource": "Resource",
+        "path": "/",
+        "operation_id": "id",
+    }
+
+    @router.get(
+        path="/1",
+        operation_id="getOne",
+        summary="Summary.",
+        response=response_factory(UniqueConstraintError, CheckConstraintError),
+    )
+    def get_one(request: HttpRequest):  # noqa: ARG001
+        return 422, error
+
+    @router.get(
+        path="/2",
+        operation_id="getTwo",
+        summary="Summary.",
+        response=response_factory(CheckConstraintError, UniqueConstraintError),
+    )
+    def get_two(request: HttpRequest):  # noqa: ARG001
+        return 422, error
+
+    api.add_router(prefix="/", router=router)
+    operation_1 = router.path_operations["/1"].operations[0]
+    operation_2 = router.path_operations["/2"].operations[0]
+
+    response = TestClient(api).get("/1")
+
+    assert operation_1.response_adapters[422] is operation_2.response_adapters[422]
+    assert operation_1.response_adapters[422].core_schema["type"] == "tagged-union"
+    assert response.status_code == 422
+    assert response.json() == error
+
+
+class ChildSchema(Schema):
+    id: int
+
+
+class ParentSchema(Schema):
+    children: list[ChildSchema]
+
+
+def test_response_models_includes_nested_models():
+    errors = response_factory(UniqueConstraintError, CheckConstraintError)[422]
+
+    assert response_models(list[ParentSchema] | None) == {ParentSchema, ChildSchema}
+    assert response_models(errors) == {UniqueConstraintError.schema, CheckConstraintError.schema}
+    assert response_models(int) == set()
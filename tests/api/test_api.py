@@ -1,8 +1,13 @@
 import pytest
 from django.http import HttpRequest
+from ninja import Schema
 
 from ninja_extended.api.api import ExtendedNinjaAPI
-from ninja_extended.api.errors import OperationIdOnAPIAlreadyRegisteredError
+from ninja_extended.api.errors import (
+    OperationIdNotFoundInAPIError,
+    OperationIdNotFoundInRouterError,
+    OperationIdOnAPIAlreadyRegisteredError,
+)
 from ninja_extended.api.registry import APIOperationRegistry
 from ninja_extended.api.router import ExtendedRouter
 
@@ -74,3 +79,55 @@ def test_extended_router_operation_ids_registered(
         "operation_id_1",
         "operation_id_2",
     ]
+
+
+def test_extended_api_get_operation(api: ExtendedNinjaAPI, router_1: ExtendedRouter, router_2: ExtendedRouter):
+    def operation(request: HttpRequest):
+        pass
+
+    router_1.get(path="/", operation_id="operation_1", summary="Summary.")(operation)
+    router_2.get(path="/", operation_id="operation_2", summary="Summary.")(operation)
+    router_1.add_router(prefix="/2", router=router_2)
+    api.add_router(prefix="/1", router=router_1)
+    router_1.get(path="/late", operation_id="operation_3", summary="Summary.")(operation)
+
+    assert api.get_operation("operation_1") is router_1.get_operation("operation_1")
+    assert api.get_operation("operation_2") is router_2.get_operation("operation_2")
+    assert api.get_operation("operation_3").path == "/late"
+
+    with pytest.raises(OperationIdNotFoundInAPIError):
+        api.get_operation("operation_4")
+
+    with pytest.raises(OperationIdNotFoundInRouterError):
+        router_1.get_operation("operation_2")
+
+
+class WarmupSchema(Schema):
+    id: int
+
+
+def test_extended_api_warmup(api: ExtendedNinjaAPI, router_1: ExtendedRouter, monkeypatch, mocker):
+    @router_1.get(path="/", operation_id="getWarmup", summary="Summary.", response=WarmupSchema, trusted_response=True)
+    def operation(request: HttpRequest):  # noqa: ARG001
+        return {"id": 1}
+
+    api.add_router(prefix="/", router=router_1)
+
+    monkeypatch.setattr(WarmupSchema, "__pydantic_complete__", False)
+    model_rebuild = mocker.spy(WarmupSchema, "model_rebuild")
+    get_response_constructor = mocker.spy(api.get_operation("getWarmup"), "get_response_constructor")
+    document = mocker.spy(api.openapi_cache, "document")
+    gc = mocker.patch("ninja_extended.api.api.gc")
+
+    api.warmup()
+
+    model_rebuild.assert_called_once_with()
+    get_response_constructor.assert_called_once()
+    # the API is not included in the URLconf
+    document.assert_not_called()
+    gc.freeze.assert_not_called()
+
+    api.warmup(freeze=True)
+
+    gc.collect.assert_called_once_with()
+    gc.freeze.assert_called_once_with()
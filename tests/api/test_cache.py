@@ -0,0 +1,234 @@
+import pytest
+from api.models import Resource
+from asgiref.sync import async_to_sync
+from django.core.cache import cache
+from django.http import HttpRequest
+from ninja import Schema
+from ninja.testing import TestAsyncClient, TestClient
+
+from ninja_extended.api.api import ExtendedNinjaAPI
+from ninja_extended.api.cache import CachedResponse, DjangoCacheBackend, LRUCacheBackend, ResponseCache, model_tag
+from ninja_extended.api.router import ExtendedRouter
+
+
+class ResourceSchema(Schema):
+    id: int
+    value_unique: str
+
+
+@pytest.fixture(name="response_cache", scope="module")
+def response_cache_fixture():
+    return ResponseCache(models=[Resource], tags=["resources"])
+
+
+@pytest.fixture(name="api", scope="module")
+def api_fixture(response_cache: ResponseCache):
+    api = ExtendedNinjaAPI(title="API", version="1.0.0", description="Description", urls_namespace="test-cache")
+    router = ExtendedRouter(tags=["router"])
+
+    @router.get(
+        path="/", operation_id="listResources", summary="Summary.", response=list[ResourceSchema], cache=response_cache
+    )
+    def list_resources(request: HttpRequest):  # noqa: ARG001
+        return Resource.objects.order_by("pk")
+
+    api.add_router(prefix="/", router=router)
+
+    return api
+
+
+@pytest.fixture(name="test_client", scope="module")
+def test_client_fixture(api: ExtendedNinjaAPI):
+    return TestClient(api)
+
+
+def create_resource(i: int) -> Resource:
+    value = f"value_{i}"
+    return Resource.objects.create(
+        value_unique=value,
+        value_unique_together_1=value,
+        value_unique_together_2=value,
+        value_not_null=value,
+        value_check=i,
+    )
+
+
+@pytest.mark.django_db
+def test_response_cache_serves_cached_responses(test_client: TestClient, django_assert_num_queries):
+    create_resource(1)
+
+    response = test_client.get(path="/")
+
+    with django_assert_num_queries(0):
+        cached = test_client.get(path="/")
+
+    assert cached.status_code == 200
+    assert cached.content == response.content
+    assert cached["Content-Type"] == response["Content-Type"]
+
+
+@pytest.mark.django_db
+def test_response_cache_invalidates_on_model_changes(test_client: TestClient, response_cache: ResponseCache):
+    resource = create_resource(1)
+    assert [item["id"] for item in test_client.get(path="/").json()] == [resource.pk]
+
+    other = create_resource(2)
+    assert [item["id"] for item in test_client.get(path="/").json()] == [resource.pk, other.pk]
+
+    resource.delete()
+    assert [item["id"] for item in test_client.get(path="/").json()] == [other.pk]
+
+    Resource.objects.filter(pk=other.pk).update(value_unique="updated")
+    assert test_client.get(path="/").json() == [{"id": other.pk, "value_unique": "value_2"}]
+
+    response_cache.invalidate("resources")
+    assert test_client.get(path="/").json() == [{"id": other.pk, "value_unique": "updated"}]
+
+
+@pytest.mark.django_db
+def test_response_cache_key(response_cache: ResponseCache, rf):
+    request = rf.get("/", {"b": "1", "a": "2"})
+    same = rf.get("/", {"a": "2", "b": "1"})
+    other_query = rf.get("/", {"a": "3"})
+    other_accept = rf.get("/", {"b": "1", "a": "2"}, headers={"Accept": "text/csv"})
+    other_principal = rf.get("/", {"b": "1", "a": "2"})
+    other_principal.auth = "token"
+
+    key = response_cache.key(request, "listResources")
+
+    assert key == response_cache.key(same, "listResources")
+    assert key != response_cache.key(request, "getResource")
+    assert key != response_cache.key(other_query, "listResources")
+    assert key != response_cache.key(other_accept, "listResources")
+    assert key != response_cache.key(other_principal, "listResources")
+
+    response_cache.invalidate()
+
+    assert key != response_cache.key(request, "listResources")
+
+
+def test_response_cache_lookup_only_safe_methods(rf):
+    response_cache = ResponseCache()
+
+    assert response_cache.lookup(rf.post("/"), "createResource") == (None, None)
+
+    key, response = response_cache.lookup(rf.get("/"), "listResources")
+
+    assert key is not None
+    assert response is None
+
+
+def test_lru_cache_backend_evicts_least_recently_used():
+    backend = LRUCacheBackend(maxsize=2)
+    value = CachedResponse(status=200, content=b"[]", content_type="application/json")
+
+    backend.set("a", value, None)
+    backend.set("b", value, None)
+    backend.get("a")
+    backend.set("c", value, None)
+
+    assert backend.get("a") == value
+    assert backend.get("b") is None
+    assert backend.get("c") == value
+
+
+def test_lru_cache_backend_expires(mocker):
+    monotonic = mocker.patch("ninja_extended.api.cache.monotonic", return_value=100.0)
+    backend = LRUCacheBackend()
+    value = CachedResponse(status=200, content=b"[]", content_type="application/json")
+
+    backend.set("a", value, 10)
+    assert backend.get("a") == value
+
+    monotonic.return_value = 110.0
+    assert backend.get("a") is None
+
+
+def test_lru_cache_backend_tag_versions():
+    backend = LRUCacheBackend()
+
+    assert backend.tag_versions(["a", "b"]) == [0, 0]
+
+    backend.invalidate(["a"])
+
+    assert backend.tag_versions(["a", "b"]) == [1, 0]
+
+
+def test_django_cache_backend():
+    cache.clear()
+    backend = DjangoCacheBackend()
+    value = CachedResponse(status=200, content=b"[]", content_type="application/json")
+
+    backend.set("a", value, None)
+    versions = backend.tag_versions([model_tag(Resource)])
+
+    assert backend.get("a") == value
+    assert backend.get("b") is None
+    assert backend.tag_versions([model_tag(Resource)]) == versions
+
+    backend.invalidate([model_tag(Resource), "evicted"])
+
+    assert backend.tag_versions([model_tag(Resource)]) == [versions[0] + 1]
+    assert backend.tag_versions(["evicted"])[0] > 0
+
+
+async def run_django_cache_backend_async(backend: DjangoCacheBackend, value: CachedResponse):
+    await backend.aset("a", value, None)
+    versions = await backend.atag_versions([model_tag(Resource)])
+
+    return (
+        await backend.aget("a"),
+        await backend.aget("b"),
+        versions,
+        await backend.atag_versions([model_tag(Resource)]),
+    )
+
+
+def test_django_cache_backend_async():
+    cache.clear()
+    backend = DjangoCacheBackend()
+    value = CachedResponse(status=200, content=b"[]", content_type="application/json")
+
+    cached, missing, versions, repeated_versions = async_to_sync(run_django_cache_backend_async)(backend, value)
+
+    assert cached == value
+    assert missing is None
+    assert repeated_versions == versions
+    assert backend.tag_versions([model_tag(Resource)]) == versions
+
+
+async def get_twice(test_client: TestAsyncClient):
+    return await test_client.get(path="/"), await test_client.get(path="/")
+
+
+def test_response_cache_of_async_operation_uses_async_backend(mocker):
+    cache.clear()
+    backend = DjangoCacheBackend()
+    for method in ("get", "set", "tag_versions"):
+        mocker.patch.object(backend, method, side_effect=AssertionError("blocking cache call"))
+    calls = []
+    api = ExtendedNinjaAPI(title="API", version="1.0.0", description="Description", urls_namespace="test-cache-async")
+    router = ExtendedRouter(tags=["router"])
+
+    @router.get(
+        path="/",
+        operation_id="listValues",
+        summary="Summary.",
+        response=list[int],
+        cache=ResponseCache(backend=backend, tags=["values"]),
+    )
+    async def list_values(request: HttpRequest):  # noqa: ARG001
+        calls.append(True)
+        return [1, 2]
+
+    api.add_router(prefix="/", router=router)
+
+    response, cached_response = async_to_sync(get_twice)(TestAsyncClient(api))
+
+    assert response.status_code == 200
+    assert cached_response.content == response.content == b"[1,2]"
+    assert len(calls) == 1
+
+
+def test_model_tag():
+    assert model_tag(Resource) == "api.Resource"
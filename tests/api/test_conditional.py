@@ -0,0 +1,256 @@
+from datetime import datetime, timezone
+
+import pytest
+from api.models import Resource
+from asgiref.sync import async_to_sync
+from django.http import HttpRequest
+from django.utils.http import http_date
+from ninja import Schema
+from ninja.pagination import paginate
+from ninja.testing import TestAsyncClient, TestClient
+
+from ninja_extended.api.api import ExtendedNinjaAPI
+from ninja_extended.api.cache import ResponseCache
+from ninja_extended.api.conditional import aggregate_etag, aggregate_last_modified
+from ninja_extended.api.operation import ExtendedOperation
+from ninja_extended.api.router import ExtendedRouter
+from ninja_extended.pagination import PageNumberPageSizePagination
+
+LAST_MODIFIED = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+
+class ResourceSchema(Schema):
+    id: int
+    value_unique: str
+
+
+def last_modified(request: HttpRequest, result):  # noqa: ARG001
+    return LAST_MODIFIED
+
+
+@pytest.fixture(name="api", scope="module")
+def api_fixture():
+    api = ExtendedNinjaAPI(title="API", version="1.0.0", description="Description", urls_namespace="test-conditional")
+    router = ExtendedRouter(tags=["router"])
+
+    @router.get(
+        path="/",
+        operation_id="listResources",
+        summary="Summary.",
+        response=list[ResourceSchema],
+        etag=aggregate_etag("pk", "value_unique"),
+    )
+    def list_resources(request: HttpRequest):  # noqa: ARG001
+        return Resource.objects.order_by("pk")
+
+    @router.get(
+        path="/last-modified",
+        operation_id="listResourcesLastModified",
+        summary="Summary.",
+        response=list[ResourceSchema],
+        last_modified=last_modified,
+    )
+    def list_resources_last_modified(request: HttpRequest):  # noqa: ARG001
+        return Resource.objects.order_by("pk")
+
+    @router.get(
+        path="/cached",
+        operation_id="listResourcesCached",
+        summary="Summary.",
+        response=list[ResourceSchema],
+        cache=ResponseCache(models=[Resource]),
+        etag=aggregate_etag("pk", "value_unique"),
+    )
+    def list_resources_cached(request: HttpRequest):  # noqa: ARG001
+        return Resource.objects.order_by("pk")
+
+    @router.get(
+        path="/paginated",
+        operation_id="listResourcesPaginated",
+        summary="Summary.",
+        response=list[ResourceSchema],
+        etag=aggregate_etag("pk", "value_unique"),
+        last_modified=last_modified,
+    )
+    @paginate(PageNumberPageSizePagination)
+    def list_resources_paginated(request: HttpRequest):  # noqa: ARG001
+        return Resource.objects.order_by("pk")
+
+    api.add_router(prefix="/", router=router)
+
+    return api
+
+
+@pytest.fixture(name="test_client", scope="module")
+def test_client_fixture(api: ExtendedNinjaAPI):
+    return TestClient(api)
+
+
+@pytest.fixture(name="test_async_client", scope="module")
+def test_async_client_fixture():
+    api = ExtendedNinjaAPI(
+        title="API", version="1.0.0", description="Description", urls_namespace="test-conditional-async"
+    )
+    router = ExtendedRouter(tags=["router"])
+
+    @router.get(
+        path="/",
+        operation_id="listResources",
+        summary="Summary.",
+        response=list[ResourceSchema],
+        etag=aggregate_etag("pk", "value_unique"),
+    )
+    async def list_resources(request: HttpRequest):  # noqa: ARG001
+        return Resource.objects.order_by("pk")
+
+    @router.get(
+        path="/paginated",
+        operation_id="listResourcesPaginated",
+        summary="Summary.",
+        response=list[ResourceSchema],
+        etag=aggregate_etag("pk", "value_unique"),
+    )
+    @paginate(PageNumberPageSizePagination)
+    async def list_resources_paginated(request: HttpRequest):  # noqa: ARG001
+        return Resource.objects.order_by("pk")
+
+    api.add_router(prefix="/", router=router)
+
+    return TestAsyncClient(api)
+
+
+@pytest.fixture(name="resource")
+def resource_fixture():
+    return Resource.objects.create(
+        value_unique="value",
+        value_unique_together_1="value",
+        value_unique_together_2="value",
+        value_not_null="value",
+        value_check=1,
+    )
+
+
+@pytest.mark.django_db
+@pytest.mark.usefixtures("resource")
+def test_conditional_get_returns_not_modified_before_serialization(
+    test_client: TestClient, mocker, django_assert_num_queries
+):
+    response = test_client.get(path="/")
+    etag = response["ETag"]
+
+    assert response.status_code == 200
+    assert etag.startswith('W/"')
+
+    render_result = mocker.spy(ExtendedOperation, "_render_result")
+    with django_assert_num_queries(1):
+        not_modified = test_client.get(path="/", headers={"IF-NONE-MATCH": etag})
+
+    assert not_modified.status_code == 304
+    assert not_modified.content == b""
+    assert not_modified["ETag"] == etag
+    render_result.assert_not_called()
+
+
+@pytest.mark.django_db
+def test_conditional_get_etag_changes_with_result(test_client: TestClient, resource: Resource):
+    etag = test_client.get(path="/")["ETag"]
+
+    Resource.objects.filter(pk=resource.pk).update(value_unique="updated")
+    response = test_client.get(path="/", headers={"IF-NONE-MATCH": etag})
+
+    assert response.status_code == 200
+    assert response.json() == [{"id": resource.pk, "value_unique": "updated"}]
+    assert response["ETag"] != etag
+
+    assert test_client.get(path="/", headers={"Accept": "text/csv"})["ETag"] != response["ETag"]
+
+
+@pytest.mark.django_db
+@pytest.mark.usefixtures("resource")
+def test_conditional_get_last_modified(test_client: TestClient):
+    response = test_client.get(path="/last-modified")
+
+    assert response.status_code == 200
+    assert response["Last-Modified"] == http_date(LAST_MODIFIED.timestamp())
+
+    not_modified = test_client.get(
+        path="/last-modified", headers={"IF-MODIFIED-SINCE": http_date(LAST_MODIFIED.timestamp())}
+    )
+    modified = test_client.get(
+        path="/last-modified", headers={"IF-MODIFIED-SINCE": http_date(LAST_MODIFIED.timestamp() - 1)}
+    )
+
+    assert not_modified.status_code == 304
+    assert modified.status_code == 200
+
+
+@pytest.mark.django_db
+@pytest.mark.usefixtures("resource")
+def test_conditional_get_cached_responses(test_client: TestClient, django_assert_num_queries):
+    etag = test_client.get(path="/cached")["ETag"]
+
+    with django_assert_num_queries(0):
+        cached = test_client.get(path="/cached")
+        not_modified = test_client.get(path="/cached", headers={"IF-NONE-MATCH": etag})
+
+    assert cached.status_code == 200
+    assert cached["ETag"] == etag
+    assert not_modified.status_code == 304
+    assert not_modified["ETag"] == etag
+
+
+@pytest.mark.django_db
+def test_conditional_get_paginated(test_client: TestClient, resource: Resource, django_assert_num_queries):
+    response = test_client.get(path="/paginated?page_size=1")
+    etag = response["ETag"]
+
+    assert response.status_code == 200
+    assert response.json()["items"] == [{"id": resource.pk, "value_unique": "value"}]
+    assert etag == test_client.get(path="/")["ETag"]
+    assert response["Last-Modified"] == http_date(LAST_MODIFIED.timestamp())
+
+    with django_assert_num_queries(1):
+        not_modified = test_client.get(path="/paginated?page_size=1", headers={"IF-NONE-MATCH": etag})
+
+    assert not_modified.status_code == 304
+    assert not_modified["ETag"] == etag
+
+    Resource.objects.filter(pk=resource.pk).update(value_unique="updated")
+
+    assert test_client.get(path="/paginated?page_size=1", headers={"IF-NONE-MATCH": etag}).status_code == 200
+
+
+async def get(test_client: TestAsyncClient, path: str, **kwargs):
+    return await test_client.get(path=path, **kwargs)
+
+
+@pytest.mark.django_db
+@pytest.mark.usefixtures("resource")
+def test_conditional_get_async(test_async_client: TestAsyncClient):
+    response = async_to_sync(get)(test_async_client, "/")
+    not_modified = async_to_sync(get)(test_async_client, "/", headers={"IF-NONE-MATCH": response["ETag"]})
+
+    assert response.status_code == 200
+    assert not_modified.status_code == 304
+
+
+@pytest.mark.django_db
+@pytest.mark.usefixtures("resource")
+def test_conditional_get_paginated_async(test_async_client: TestAsyncClient):
+    response = async_to_sync(get)(test_async_client, "/paginated")
+    not_modified = async_to_sync(get)(test_async_client, "/paginated", headers={"IF-NONE-MATCH": response["ETag"]})
+
+    assert response.status_code == 200
+    assert response.json()["count"] == 1
+    assert not_modified.status_code == 304
+
+
+@pytest.mark.django_db
+@pytest.mark.usefixtures("resource")
+def test_aggregate_functions_ignore_other_results(rf):
+    request = rf.get("/")
+
+    assert aggregate_etag("pk")(request, [1, 2]) is None
+    assert aggregate_etag("pk")(request, Resource.objects) is not None
+    assert aggregate_last_modified("pk")(request, {"id": 1}) is None
+    assert aggregate_last_modified("pk")(request, Resource.objects.all()) is not None
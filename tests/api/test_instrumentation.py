@@ -0,0 +1,233 @@
+# ruff: noqa: ARG002
+
+import pytest
+from api.models import Resource
+from asgiref.sync import async_to_sync
+from django.http import HttpRequest, StreamingHttpResponse
+from ninja import Schema
+from ninja.pagination import paginate
+from ninja.testing import TestAsyncClient, TestClient
+
+from ninja_extended.api import queries, sqlcomment
+from ninja_extended.api.api import ExtendedNinjaAPI
+from ninja_extended.api.instrumentation import Histogram, Instrumentation, ServerTiming, TimingHistograms, Timings
+from ninja_extended.api.queries import QueryAccounting
+from ninja_extended.api.router import ExtendedRouter
+from ninja_extended.api.sqlcomment import SQLCommenter
+from ninja_extended.pagination import PageNumberPageSizePagination
+
+
+class ResourceSchema(Schema):
+    id: int
+    value_unique: str
+
+
+class RecordingInstrumentation(Instrumentation):
+    def __init__(self):
+        self.events = []
+
+    def on_start(self, request, operation):
+        self.events.append(("start", operation.operation_id))
+
+    def on_phase(self, request, operation, phase, duration):
+        self.events.append(("phase", phase))
+
+    def on_suspend(self, request, operation):
+        self.events.append(("suspend", None))
+
+    def on_resume(self, request, operation):
+        self.events.append(("resume", None))
+
+    def on_finish(self, request, operation, response, timings):
+        self.events.append(("finish", response.status_code if response is not None else None))
+
+
+def auth(request: HttpRequest):
+    return request.headers.get("Authorization") == "token" or None
+
+
+@pytest.fixture(name="histograms", scope="module")
+def histograms_fixture():
+    return TimingHistograms()
+
+
+@pytest.fixture(name="recording", scope="module")
+def recording_fixture():
+    return RecordingInstrumentation()
+
+
+@pytest.fixture(name="test_client", scope="module")
+def test_client_fixture(histograms: TimingHistograms, recording: RecordingInstrumentation):
+    api = ExtendedNinjaAPI(
+        title="API",
+        version="1.0.0",
+        description="Description",
+        urls_namespace="test-instrumentation",
+        instrumentation=[ServerTiming(), histograms, recording],
+    )
+    router = ExtendedRouter(tags=["router"])
+
+    @router.get(
+        path="/",
+        operation_id="listResources",
+        summary="Summary.",
+        response=list[ResourceSchema],
+        auth=auth,
+    )
+    @paginate(PageNumberPageSizePagination)
+    def list_resources(request: HttpRequest):  # noqa: ARG001
+        return Resource.objects.order_by("pk")
+
+    api.add_router(prefix="/", router=router)
+
+    return TestClient(api)
+
+
+@pytest.mark.django_db
+def test_instrumentation_times_phases(
+    test_client: TestClient, histograms: TimingHistograms, recording: RecordingInstrumentation
+):
+    Resource.objects.create(
+        value_unique="value",
+        value_unique_together_1="value",
+        value_unique_together_2="value",
+        value_not_null="value",
+        value_check=1,
+    )
+    histograms.reset()
+    recording.events.clear()
+
+    response = test_client.get(path="/", headers={"Authorization": "token"})
+
+    assert response.status_code == 200
+    assert [metric.split(";")[0] for metric in response["Server-Timing"].split(", ")] == [
+        "auth",
+        "params",
+        "pagination",
+        "view",
+        "serialization",
+        "rendering",
+        "total",
+    ]
+    assert recording.events[0] == ("start", "listResources")
+    assert recording.events[-1] == ("finish", 200)
+    assert ("phase", "pagination") in recording.events
+
+    snapshot = histograms.snapshot()
+
+    assert snapshot["listResources"]["total"]["count"] == 1
+    assert snapshot["listResources"]["view"]["buckets"]["+Inf"] == 1
+
+
+@pytest.mark.django_db
+def test_instrumentation_times_rejected_requests(test_client: TestClient, histograms: TimingHistograms):
+    histograms.reset()
+
+    response = test_client.get(path="/")
+
+    assert response.status_code == 401
+    assert response["Server-Timing"].startswith("auth;dur=")
+    assert set(histograms.snapshot()["listResources"]) == {"auth", "total"}
+
+
+@pytest.fixture(name="error_api", scope="module")
+def error_api_fixture(recording: RecordingInstrumentation):
+    api = ExtendedNinjaAPI(
+        title="API",
+        version="1.0.0",
+        description="Description",
+        urls_namespace="test-instrumentation-error",
+        instrumentation=[ServerTiming(), QueryAccounting(), SQLCommenter(), recording],
+    )
+    router = ExtendedRouter(tags=["router"])
+
+    @router.get(path="/", operation_id="raiseError", summary="Summary.")
+    def raise_error(request: HttpRequest):  # noqa: ARG001
+        Resource.objects.count()
+        raise RuntimeError
+
+    @router.get(path="/async", operation_id="raiseErrorAsync", summary="Summary.")
+    async def raise_error_async(request: HttpRequest):  # noqa: ARG001
+        raise RuntimeError
+
+    api.add_router(prefix="/", router=router)
+
+    return api
+
+
+async def get_async(test_client: TestAsyncClient, path: str):
+    return await test_client.get(path=path)
+
+
+@pytest.mark.django_db
+def test_instrumentation_finishes_requests_raising_exceptions(
+    error_api: ExtendedNinjaAPI, recording: RecordingInstrumentation, monkeypatch
+):
+    # both test clients resolve the URLs of the same API
+    monkeypatch.setenv("NINJA_SKIP_REGISTRY", "1")
+    recording.events.clear()
+
+    with pytest.raises(RuntimeError):
+        TestClient(error_api).get(path="/")
+
+    assert recording.events == [("start", "raiseError"), ("phase", "params"), ("phase", "view"), ("finish", None)]
+    assert queries._records.get() == ()  # noqa: SLF001
+    assert sqlcomment._comment.get() is None  # noqa: SLF001
+
+    recording.events.clear()
+
+    with pytest.raises(RuntimeError):
+        async_to_sync(get_async)(TestAsyncClient(error_api), "/async")
+
+    assert recording.events[0] == ("start", "raiseErrorAsync")
+    assert recording.events[-1] == ("finish", None)
+
+
+def test_timings_exclude_nested_phases(mocker):
+    perf_counter = mocker.patch(
+        "ninja_extended.api.instrumentation.perf_counter", side_effect=[0.0, 1.0, 2.0, 5.0, 7.0]
+    )
+    timings = Timings(request=HttpRequest(), operation=mocker.Mock(), instrumentation=[])
+
+    with timings.phase("view"), timings.phase("pagination"):
+        pass
+
+    assert timings.durations == {"pagination": 3.0, "view": 3.0}
+    assert perf_counter.call_count == 5
+
+
+@pytest.mark.django_db
+def test_timings_finish_streamed_body_once_consumed_or_closed(mocker):
+    recording = RecordingInstrumentation()
+    timings = Timings(request=HttpRequest(), operation=mocker.Mock(), instrumentation=[recording])
+
+    response = timings.stream(StreamingHttpResponse(iter([b"a", b"b"])))
+
+    assert recording.events == [("suspend", None)]
+    assert b"".join(response.streaming_content) == b"ab"
+    assert recording.events == [
+        ("suspend", None),
+        *[("resume", None), ("phase", "streaming"), ("suspend", None)] * 2,
+        ("resume", None),
+        ("phase", "streaming"),
+        ("finish", 200),
+    ]
+    assert "streaming" in timings.durations
+
+    recording.events.clear()
+    response = Timings(request=HttpRequest(), operation=mocker.Mock(), instrumentation=[recording]).stream(
+        StreamingHttpResponse(iter([b"a"]))
+    )
+    response.close()
+    response.close()
+
+    assert recording.events == [("suspend", None), ("finish", 200)]
+
+
+def test_histogram_counts_cumulative_buckets():
+    histogram = Histogram(buckets=(0.1, 1.0))
+
+    for value in (0.05, 0.1, 0.5, 2.0):
+        histogram.observe(value)
+
+    assert histogram.to_dict() == {"buckets": {"0.1": 2, "1.0": 3, "+Inf": 4}, "count": 4, "sum": 2.65}
@@ -0,0 +1,70 @@
+import pytest
+from api.models import Resource
+from django.http import HttpRequest
+from ninja import Schema
+from ninja.testing import TestClient
+
+from ninja_extended.api.api import ExtendedNinjaAPI
+from ninja_extended.api.operation import ExtendedAsyncOperation, ExtendedOperation, LazyOperation
+from ninja_extended.api.router import ExtendedRouter
+
+
+class ResourceSchema(Schema):
+    id: int
+    value_unique: str
+
+
+@pytest.fixture(name="api", scope="module")
+def api_fixture():
+    api = ExtendedNinjaAPI(title="API", version="1.0.0", description="Description", urls_namespace="test-lazy")
+    router = ExtendedRouter(tags=["router"], lazy=True)
+
+    @router.get(path="/", operation_id="listResources", summary="Summary.", response=list[ResourceSchema])
+    def list_resources(request: HttpRequest):  # noqa: ARG001
+        return Resource.objects.order_by("pk")
+
+    @router.get(path="/{id}", operation_id="getResource", summary="Summary.", response=ResourceSchema)
+    def get_resource(request: HttpRequest, id: int):  # noqa: ARG001, A002
+        return Resource.objects.get(pk=id)
+
+    @router.get(path="/async", operation_id="getAsync", summary="Summary.")
+    async def get_async(request: HttpRequest):  # noqa: ARG001
+        return {}
+
+    api.add_router(prefix="/", router=router)
+
+    return api
+
+
+@pytest.fixture(name="operations", scope="module")
+def operations_fixture(api: ExtendedNinjaAPI):
+    return {operation_id: api._operations[operation_id] for operation_id in api._operations}  # noqa: SLF001
+
+
+@pytest.mark.django_db
+def test_lazy_operation_compiles_on_first_request(api: ExtendedNinjaAPI, operations: dict[str, LazyOperation]):
+    operation = operations["listResources"]
+
+    assert isinstance(operation, LazyOperation)
+    assert not operation.is_compiled
+    assert operations["getAsync"].is_async
+
+    response = TestClient(api).get(path="/")
+
+    assert response.status_code == 200
+    assert response.data == []
+    assert operation.is_compiled
+    assert isinstance(operation.compile(), ExtendedOperation)
+    assert operation.compile().api is api
+    assert not operations["getResource"].is_compiled
+
+
+@pytest.mark.django_db
+def test_lazy_operation_warmup(api: ExtendedNinjaAPI, operations: dict[str, LazyOperation]):
+    assert not operations["getAsync"].is_compiled
+
+    api.warmup()
+
+    assert all(operation.is_compiled for operation in operations.values())
+    assert isinstance(api.get_operation("getAsync"), ExtendedAsyncOperation)
+    assert set(api.get_openapi_schema(path_prefix="")["paths"]) == {"/", "/{id}", "/async"}
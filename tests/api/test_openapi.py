@@ -0,0 +1,120 @@
+import gzip
+import json
+
+import pytest
+from django.http import HttpRequest
+from ninja.responses import NinjaJSONEncoder
+
+from ninja_extended.api.api import ExtendedNinjaAPI
+from ninja_extended.api.openapi import OpenAPICache, OpenAPIDocument, accepts_gzip, operations_hash
+from ninja_extended.api.router import ExtendedRouter
+
+
+@pytest.fixture(name="api", scope="module")
+def api_fixture():
+    api = ExtendedNinjaAPI(title="API", version="1.0.0", description="Description", urls_namespace="test-openapi")
+    router = ExtendedRouter(tags=["router"], lazy=True)
+
+    @router.get(path="/", operation_id="getResource", summary="Summary.")
+    def get_resource(request: HttpRequest):  # noqa: ARG001
+        return {}
+
+    api.add_router(prefix="/", router=router)
+
+    return api
+
+
+def test_openapi_cache_builds_document_once(api: ExtendedNinjaAPI, mocker):
+    get_openapi_schema = mocker.spy(api, "get_openapi_schema")
+    openapi_cache = OpenAPICache()
+
+    document = openapi_cache.document(api, "/api/")
+
+    assert openapi_cache.document(api, "/api/") is document
+    assert json.loads(document.content) == json.loads(
+        json.dumps(api.get_openapi_schema(path_prefix="/api/"), cls=NinjaJSONEncoder)
+    )
+    assert gzip.decompress(document.gzip_content) == document.content
+    assert document.etag.startswith('"')
+    assert document.gzip_etag == f'{document.etag[:-1]}-gzip"'
+    get_openapi_schema.assert_called_with(path_prefix="/api/")
+    assert get_openapi_schema.call_count == 2
+
+
+def test_openapi_cache_persists_document(api: ExtendedNinjaAPI, tmp_path, mocker):
+    document = OpenAPICache(directory=tmp_path).document(api, "/api/")
+
+    assert OpenAPICache(directory=tmp_path).path(api, "/api/").exists()
+    assert not OpenAPICache().path(api, "/api/")
+
+    get_openapi_schema = mocker.spy(api, "get_openapi_schema")
+    loaded = OpenAPICache(directory=tmp_path).document(api, "/api/")
+
+    assert loaded == document
+    get_openapi_schema.assert_not_called()
+
+
+def test_openapi_cache_ignores_unreadable_documents(api: ExtendedNinjaAPI, tmp_path):
+    openapi_cache = OpenAPICache(directory=tmp_path)
+    openapi_cache.path(api, "/api/").write_bytes(b"invalid")
+
+    document = openapi_cache.document(api, "/api/")
+
+    assert json.loads(document.content)["info"]["title"] == "API"
+
+
+def test_operations_hash(api: ExtendedNinjaAPI):
+    assert operations_hash(api, "/api/") == operations_hash(api, "/api/")
+    assert operations_hash(api, "/api/") != operations_hash(api, "/v2/")
+
+    other = ExtendedNinjaAPI(title="API", version="1.0.0", description="Description", urls_namespace="test-openapi-2")
+    router = ExtendedRouter(tags=["router"])
+
+    @router.get(path="/", operation_id="getResource", summary="Summary.")
+    def get_resource(request: HttpRequest):  # noqa: ARG001
+        return {}
+
+    other.add_router(prefix="/", router=router)
+    before = operations_hash(other, "/api/")
+
+    @router.get(path="/other", operation_id="getOther", summary="Summary.")
+    def get_other(request: HttpRequest):  # noqa: ARG001
+        return {}
+
+    assert operations_hash(other, "/api/") != before
+
+
+def test_openapi_document_response(rf):
+    document = OpenAPIDocument.from_content(b'{"openapi":"3.1.0"}')
+
+    response = document.response(rf.get("/"))
+    gzip_response = document.response(rf.get("/", headers={"Accept-Encoding": "gzip, deflate"}))
+    not_modified = document.response(rf.get("/", headers={"If-None-Match": document.etag}))
+    gzip_not_modified = document.response(
+        rf.get("/", headers={"If-None-Match": document.gzip_etag, "Accept-Encoding": "gzip"})
+    )
+
+    assert response.content == document.content
+    assert response["ETag"] == document.etag
+    assert response["Vary"] == "Accept-Encoding"
+    assert not response.has_header("Content-Encoding")
+    assert gzip_response.content == document.gzip_content
+    assert gzip_response["Content-Encoding"] == "gzip"
+    assert gzip_response["ETag"] == document.gzip_etag
+    assert not_modified.status_code == 304
+    assert gzip_not_modified.status_code == 304
+
+
+@pytest.mark.parametrize(
+    ("accept_encoding", "expected"),
+    [
+        ("", False),
+        ("gzip", True),
+        ("br, GZIP;q=0.5", True),
+        ("gzip;q=0", False),
+        ("gzip;q=invalid", False),
+        ("gzipped", False),
+    ],
+)
+def test_accepts_gzip(rf, accept_encoding: str, expected: bool):  # noqa: FBT001
+    assert accepts_gzip(rf.get("/", headers={"Accept-Encoding": accept_encoding})) is expected
@@ -0,0 +1,106 @@
+import pytest
+from api.models import Resource
+from asgiref.sync import async_to_sync
+from django.http import HttpRequest
+from ninja import Schema
+from ninja.testing import TestAsyncClient, TestClient
+
+from ninja_extended.api.api import ExtendedNinjaAPI
+from ninja_extended.api.instrumentation import ServerTiming
+from ninja_extended.api.router import ExtendedRouter
+
+
+class ResourceSchema(Schema):
+    id: int
+    value_unique: str
+
+
+async def async_auth(request: HttpRequest):
+    return request.headers.get("Authorization") == "token" or None
+
+
+@pytest.fixture(name="test_client", scope="module")
+def test_client_fixture():
+    api = ExtendedNinjaAPI(
+        title="API",
+        version="1.0.0",
+        description="Description",
+        urls_namespace="test-operation-async",
+        instrumentation=[ServerTiming()],
+    )
+    router = ExtendedRouter(tags=["router"])
+
+    @router.get(path="/", operation_id="listResources", summary="Summary.", response=list[ResourceSchema])
+    async def list_resources(request: HttpRequest):  # noqa: ARG001
+        return Resource.objects.order_by("pk")
+
+    @router.get(path="/auth", operation_id="getAuth", summary="Summary.", auth=async_auth)
+    async def get_auth(request: HttpRequest):  # noqa: ARG001
+        return {"authenticated": True}
+
+    api.add_router(prefix="/", router=router)
+
+    return TestAsyncClient(api)
+
+
+async def get(test_client: TestAsyncClient, path: str, **kwargs):
+    return await test_client.get(path=path, **kwargs)
+
+
+@pytest.mark.django_db
+def test_extended_async_operation_awaits_view_and_evaluates_queryset(test_client: TestAsyncClient):
+    Resource.objects.create(
+        value_unique="value",
+        value_unique_together_1="value",
+        value_unique_together_2="value",
+        value_not_null="value",
+        value_check=1,
+    )
+
+    response = async_to_sync(get)(test_client, "/")
+
+    assert response.status_code == 200
+    assert response.data == [{"id": Resource.objects.get().id, "value_unique": "value"}]
+    assert [metric.split(";")[0] for metric in response["Server-Timing"].split(", ")] == [
+        "params",
+        "view",
+        "serialization",
+        "rendering",
+        "total",
+    ]
+
+
+@pytest.mark.django_db
+def test_extended_async_operation_awaits_async_auth(test_client: TestAsyncClient):
+    response = async_to_sync(get)(test_client, "/auth", headers={"Authorization": "token"})
+
+    assert response.status_code == 200
+    assert response.data == {"authenticated": True}
+    assert response["Server-Timing"].startswith("auth;dur=")
+
+    response = async_to_sync(get)(test_client, "/auth")
+
+    assert response.status_code == 401
+
+
+def test_extended_operation_hints_missing_functools_wraps():
+    api = ExtendedNinjaAPI(
+        title="API", version="1.0.0", description="Description", urls_namespace="test-operation-wraps"
+    )
+    router = ExtendedRouter(tags=["router"])
+
+    def decorator(func):
+        def wrapper(request, *args, **kwargs):
+            return func(request, *args, **kwargs)
+
+        return wrapper
+
+    @router.get(path="/", operation_id="getValue", summary="Summary.")
+    @decorator
+    def get_value(request: HttpRequest, value: int):  # noqa: ARG001
+        return value
+
+    api.add_router(prefix="/", router=router)
+
+    with pytest.raises(TypeError, match=r"Did you fail to use functools\.wraps\(\) in a decorator\?"):
+        TestClient(api).get(path="/")
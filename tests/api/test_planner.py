@@ -0,0 +1,244 @@
+import pytest
+from api.models import Child1, Resource
+from django.http import HttpRequest
+from django.test import RequestFactory
+from ninja import Schema
+from ninja.testing import TestClient
+from pydantic import field_validator
+
+from ninja_extended.api.api import ExtendedNinjaAPI
+from ninja_extended.api.errors import ResponseSchemaNotFlatError, ResponseSchemaNotFoundError
+from ninja_extended.api.operation import ExtendedOperation
+from ninja_extended.api.planner import QueryPlanner, ValuesPlanner, response_item_schema, values_field_map
+from ninja_extended.api.router import ExtendedRouter
+
+
+class ResourceSchema(Schema):
+    id: int
+    value_unique: str
+
+
+class ChildSchema(Schema):
+    id: int
+    resource: ResourceSchema
+
+
+class ChildIdSchema(Schema):
+    id: int
+
+
+class ResourceWithChildrenSchema(Schema):
+    id: int
+    value_unique: str
+    children_1: list[ChildIdSchema]
+
+
+@pytest.fixture
+def children():
+    children = []
+    for i in range(3):
+        value = f"value_{i}"
+        resource = Resource.objects.create(
+            value_unique=value,
+            value_unique_together_1=value,
+            value_unique_together_2=value,
+            value_not_null=value,
+            value_check=i,
+        )
+        children.extend(Child1.objects.create(resource=resource) for _ in range(2))
+
+    return children
+
+
+def test_response_item_schema():
+    assert response_item_schema({200: list[ResourceSchema], 404: ChildSchema}) is ResourceSchema
+    assert response_item_schema({201: ResourceSchema | None}) is ResourceSchema
+    assert response_item_schema({204: None}) is None
+    assert response_item_schema(ChildSchema) is ChildSchema
+
+
+def test_query_planner_plans_forward_relations():
+    plan = QueryPlanner(schema=ChildSchema).plan(Child1)
+
+    assert plan.select_related == ("resource",)
+    assert plan.prefetch_related == ()
+    assert plan.only == ("id", "resource", "resource__id", "resource__value_unique")
+
+
+@pytest.mark.django_db
+def test_query_planner_avoids_n_plus_one_for_forward_relations(children, django_assert_num_queries):  # noqa: ARG001
+    queryset = QueryPlanner(schema=ChildSchema).apply(Child1.objects.all())
+
+    with django_assert_num_queries(1):
+        items = [ChildSchema.model_validate(child).model_dump() for child in queryset]
+
+    assert len(items) == 6
+    assert items[0]["resource"]["value_unique"] == "value_0"
+
+
+@pytest.mark.django_db
+def test_query_planner_avoids_n_plus_one_for_reverse_relations(children, django_assert_num_queries):  # noqa: ARG001
+    queryset = QueryPlanner(schema=ResourceWithChildrenSchema).apply(Resource.objects.order_by("pk"))
+
+    with django_assert_num_queries(2):
+        items = [ResourceWithChildrenSchema.model_validate(resource).model_dump() for resource in queryset]
+
+    assert [len(item["children_1"]) for item in items] == [2, 2, 2]
+
+
+@pytest.mark.django_db
+def test_query_planner_prefetches_model_instances(children, django_assert_num_queries):
+    resource = QueryPlanner(schema=ResourceWithChildrenSchema).apply(Resource.objects.get(pk=children[0].resource_id))
+
+    with django_assert_num_queries(0):
+        assert len(ResourceWithChildrenSchema.model_validate(resource).children_1) == 2
+
+
+def test_query_planner_skips_values_querysets():
+    queryset = Resource.objects.values("id")
+
+    assert QueryPlanner(schema=ResourceWithChildrenSchema).apply(queryset) is queryset
+
+
+def test_values_field_map():
+    assert values_field_map(ResourceSchema) == {"id": "id", "value_unique": "value_unique"}
+    assert values_field_map(ChildSchema) is None
+    assert values_field_map(ResourceWithChildrenSchema) is None
+
+
+@pytest.mark.django_db
+def test_values_planner_fetches_rows(children):  # noqa: ARG001
+    planner = ValuesPlanner(field_map={"id": "id", "value_unique": "value_unique"})
+
+    rows = list(planner.apply(Resource.objects.order_by("pk")))
+
+    assert rows[0] == {"id": rows[0]["id"], "value_unique": "value_0"}
+    assert ResourceSchema.model_validate(rows[0]).value_unique == "value_0"
+
+
+def test_values_planner_skips_unsupported_models():
+    planner = ValuesPlanner(field_map={"id": "id", "value_unique": "value_unique"})
+    queryset = Child1.objects.all()
+
+    assert planner.apply(queryset) is queryset
+    assert planner.supports(Resource)
+    assert not planner.supports(Child1)
+
+
+def operation(request: HttpRequest):
+    pass
+
+
+def test_extended_operation_plans_queries():
+    extended_operation = ExtendedOperation(
+        path="/",
+        operation_id="operation_id",
+        summary="Summary.",
+        description="Description.",
+        tags=[],
+        methods=["GET"],
+        view_func=operation,
+        response={200: list[ChildSchema]},
+        plan_queries=True,
+    )
+
+    queryset = extended_operation.prepare_result(RequestFactory().get("/"), Child1.objects.all())
+
+    assert queryset.query.select_related == {"resource": {}}
+
+
+def test_extended_operation_raises_response_schema_not_found():
+    with pytest.raises(
+        expected_exception=ResponseSchemaNotFoundError,
+        match="Operation id 'operation_id' has no successful response with a schema.",
+    ):
+        ExtendedOperation(
+            path="/",
+            operation_id="operation_id",
+            summary="Summary.",
+            description="Description.",
+            tags=[],
+            methods=["GET"],
+            view_func=operation,
+            response={204: None},
+            plan_queries=True,
+        )
+
+
+def test_extended_operation_raises_response_schema_not_flat():
+    with pytest.raises(
+        expected_exception=ResponseSchemaNotFlatError,
+        match="Operation id 'operation_id' has a response schema with resolvers, nested schemas or dotted sources.",
+    ):
+        ExtendedOperation(
+            path="/",
+            operation_id="operation_id",
+            summary="Summary.",
+            description="Description.",
+            tags=[],
+            methods=["GET"],
+            view_func=operation,
+            response={200: list[ChildSchema]},
+            values_fast_path=True,
+        )
+
+
+class ValidatedResourceSchema(Schema):
+    id: int
+    value_unique: str
+
+    @field_validator("value_unique")
+    @classmethod
+    def upper(cls, value: str) -> str:
+        return value.upper()
+
+
+@pytest.fixture(name="test_client", scope="module")
+def test_client_fixture():
+    api = ExtendedNinjaAPI(title="API", version="1.0.0", description="Description", urls_namespace="test-planner")
+    router = ExtendedRouter(tags=["router"])
+
+    @router.get(
+        path="/",
+        operation_id="listResources",
+        summary="Summary.",
+        response=list[ResourceSchema],
+        values_fast_path=True,
+    )
+    def list_resources(request: HttpRequest):  # noqa: ARG001
+        return Resource.objects.order_by("pk")
+
+    @router.get(
+        path="/validated",
+        operation_id="listResourcesValidated",
+        summary="Summary.",
+        response=list[ValidatedResourceSchema],
+        values_fast_path=True,
+    )
+    def list_resources_validated(request: HttpRequest):  # noqa: ARG001
+        return Resource.objects.order_by("pk")
+
+    api.add_router(prefix="/", router=router)
+
+    return TestClient(api)
+
+
+@pytest.mark.django_db
+def test_extended_operation_constructs_values_rows_without_validation(test_client, children, mocker):  # noqa: ARG001
+    operation = test_client.router_or_app.get_operation("listResources")
+    adapter = operation.get_response_adapter(200, operation.response_models[200])
+    validate_python = mocker.spy(adapter, "validate_python")
+
+    response = test_client.get(path="/")
+
+    assert response.status_code == 200
+    assert response.json() == [{"id": i + 1, "value_unique": f"value_{i}"} for i in range(3)]
+    validate_python.assert_not_called()
+
+
+@pytest.mark.django_db
+def test_extended_operation_validates_values_rows_of_schema_with_validators(test_client, children):  # noqa: ARG001
+    response = test_client.get(path="/validated")
+
+    assert response.status_code == 200
+    assert response.json() == [{"id": i + 1, "value_unique": f"VALUE_{i}"} for i in range(3)]
@@ -0,0 +1,196 @@
+import json
+import logging
+
+import pytest
+from api.models import Resource
+from asgiref.sync import async_to_sync
+from django.http import HttpRequest
+from django.test import RequestFactory
+from ninja import Schema
+from ninja.testing import TestClient
+
+from ninja_extended.api import queries
+from ninja_extended.api.api import ExtendedNinjaAPI
+from ninja_extended.api.queries import QueryAccounting, QueryRecord, fingerprint
+from ninja_extended.api.router import ExtendedRouter
+from ninja_extended.testing import assert_query_budget
+
+
+class ResourceSchema(Schema):
+    id: int
+    value_unique: str
+
+
+@pytest.fixture(name="accounting", scope="module")
+def accounting_fixture():
+    return QueryAccounting(budgets={"listResourcesNPlusOne": 2})
+
+
+@pytest.fixture(name="api", scope="module")
+def api_fixture(accounting: QueryAccounting):
+    api = ExtendedNinjaAPI(
+        title="API",
+        version="1.0.0",
+        description="Description",
+        urls_namespace="test-queries",
+        instrumentation=[accounting],
+    )
+    router = ExtendedRouter(tags=["router"])
+
+    @router.get(path="/", operation_id="listResources", summary="Summary.", response=list[ResourceSchema])
+    def list_resources(request: HttpRequest):  # noqa: ARG001
+        return Resource.objects.order_by("pk")
+
+    @router.get(path="/n-plus-one", operation_id="listResourcesNPlusOne", summary="Summary.", response=list[int])
+    def list_resources_n_plus_one(request: HttpRequest):  # noqa: ARG001
+        return [Resource.objects.get(pk=pk).pk for pk in Resource.objects.values_list("pk", flat=True)]
+
+    @router.get(
+        path="/streamed",
+        operation_id="listResourcesStreamed",
+        summary="Summary.",
+        response=list[ResourceSchema],
+        stream_json_array=True,
+    )
+    def list_resources_streamed(request: HttpRequest):  # noqa: ARG001
+        return Resource.objects.order_by("pk")
+
+    @router.get(
+        path="/streamed-async",
+        operation_id="listResourcesStreamedAsync",
+        summary="Summary.",
+        response=list[ResourceSchema],
+        stream_json_array=True,
+    )
+    async def list_resources_streamed_async(request: HttpRequest):  # noqa: ARG001
+        return Resource.objects.order_by("pk")
+
+    @router.get(path="/error", operation_id="raiseError", summary="Summary.")
+    def raise_error(request: HttpRequest):  # noqa: ARG001
+        Resource.objects.count()
+        raise RuntimeError
+
+    api.add_router(prefix="/", router=router)
+
+    return api
+
+
+@pytest.fixture(name="test_client", scope="module")
+def test_client_fixture(api: ExtendedNinjaAPI):
+    return TestClient(api)
+
+
+@pytest.fixture(name="resources")
+def resources_fixture():
+    for i in range(3):
+        value = f"value_{i}"
+        Resource.objects.create(
+            value_unique=value,
+            value_unique_together_1=value,
+            value_unique_together_2=value,
+            value_not_null=value,
+            value_check=i,
+        )
+
+
+@pytest.mark.django_db
+@pytest.mark.usefixtures("resources")
+def test_query_accounting_records_queries_per_operation(
+    test_client: TestClient, accounting: QueryAccounting, caplog: pytest.LogCaptureFixture
+):
+    accounting.reset()
+
+    with caplog.at_level(logging.WARNING, logger="ninja_extended.api.queries"):
+        test_client.get(path="/")
+        test_client.get(path="/n-plus-one")
+
+    snapshot = accounting.snapshot()
+
+    assert snapshot["listResources"]["requests"] == 1
+    assert snapshot["listResources"]["queries"] == 1
+    assert snapshot["listResources"]["duplicates"] == {}
+    assert snapshot["listResourcesNPlusOne"]["max_queries"] == 4
+    assert list(snapshot["listResourcesNPlusOne"]["duplicates"].values()) == [2]
+    assert len(caplog.records) == 1
+    assert "'listResourcesNPlusOne' executed 4 queries exceeding its budget of 2" in caplog.records[0].getMessage()
+
+
+@pytest.mark.django_db
+def test_query_accounting_restores_records(test_client: TestClient, accounting: QueryAccounting):
+    accounting.reset()
+    outer = QueryRecord()
+    token = queries._records.set((outer,))  # noqa: SLF001
+
+    try:
+        test_client.get(path="/")
+        with pytest.raises(RuntimeError):
+            test_client.get(path="/error")
+
+        assert queries._records.get() == (outer,)  # noqa: SLF001
+    finally:
+        queries._records.reset(token)  # noqa: SLF001
+
+    assert accounting.snapshot()["raiseError"]["queries"] == 1
+    assert accounting._tokens == {}  # noqa: SLF001
+
+
+@pytest.mark.django_db
+@pytest.mark.usefixtures("resources")
+def test_assert_query_budget(api: ExtendedNinjaAPI, test_client: TestClient):
+    with assert_query_budget(api, "listResources", 1, max_duplicates=0) as stats:
+        test_client.get(path="/")
+
+    assert stats.queries == 1
+
+    with pytest.raises(AssertionError, match="executed 4 queries, expected at most 3"):  # noqa: SIM117
+        with assert_query_budget(api, "listResourcesNPlusOne", 3):
+            test_client.get(path="/n-plus-one")
+
+    with pytest.raises(AssertionError, match="repeated queries 2 times"):  # noqa: SIM117
+        with assert_query_budget(api, "listResourcesNPlusOne", 4, max_duplicates=0):
+            test_client.get(path="/n-plus-one")
+
+    with pytest.raises(AssertionError, match="was not called"):  # noqa: SIM117
+        with assert_query_budget(api, "listResources", 1):
+            pass
+
+
+@pytest.mark.django_db
+@pytest.mark.usefixtures("resources")
+def test_query_accounting_records_queries_of_streamed_body(api: ExtendedNinjaAPI, accounting: QueryAccounting):
+    accounting.reset()
+    operation = api.get_operation("listResourcesStreamed")
+
+    with assert_query_budget(api, "listResourcesStreamed", 1) as stats:
+        response = operation.run(RequestFactory().get("/streamed"))
+
+        assert "listResourcesStreamed" not in accounting.snapshot()
+        assert queries._records.get() == ()  # noqa: SLF001
+        assert len(json.loads(b"".join(response.streaming_content))) == 3
+
+    assert stats.queries == 1
+    assert accounting.snapshot()["listResourcesStreamed"]["queries"] == 1
+    assert accounting._tokens == {}  # noqa: SLF001
+    assert queries._records.get() == ()  # noqa: SLF001
+
+
+@pytest.mark.django_db(transaction=True)
+@pytest.mark.usefixtures("resources")
+def test_query_accounting_records_queries_of_async_streamed_body(api: ExtendedNinjaAPI, accounting: QueryAccounting):
+    accounting.reset()
+    operation = api.get_operation("listResourcesStreamedAsync")
+
+    async def consume():
+        response = await operation.run(RequestFactory().get("/streamed-async"))
+        return b"".join([chunk async for chunk in response.streaming_content])
+
+    content = async_to_sync(consume)()
+
+    assert len(json.loads(content)) == 3
+    assert accounting.snapshot()["listResourcesStreamedAsync"]["queries"] == 1
+    assert accounting._tokens == {}  # noqa: SLF001
+
+
+def test_fingerprint_ignores_parameters():
+    assert fingerprint('SELECT *\n  FROM "t" WHERE "id" IN (%s, %s, %s)') == 'SELECT * FROM "t" WHERE "id" IN (...)'
+    assert fingerprint('SELECT * FROM "t" WHERE "id" IN (%s)') == 'SELECT * FROM "t" WHERE "id" IN (...)'
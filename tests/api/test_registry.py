@@ -1,5 +1,7 @@
 """Tests for APIOperationRegistry and RouterOperationRegistry."""
 
+import gc
+
 import pytest
 from ninja import NinjaAPI, Router
 
@@ -18,14 +20,14 @@ from ninja_extended.api.registry import APIOperationRegistry, RouterOperationReg
 def reset_router_operation_registry_fixture():
     """Fixture for resetting the RouterOperationRegistry."""
 
-    RouterOperationRegistry.registry = {}
+    RouterOperationRegistry.reset()
 
 
 @pytest.fixture(name="reset_api_operation_registry", autouse=True)
 def reset_api_operation_registry_fixture():
     """Fixture for resetting the APIOperationRegistry."""
 
-    APIOperationRegistry.registry = {}
+    APIOperationRegistry.reset()
 
 
 @pytest.fixture(name="router")
@@ -66,7 +68,7 @@ def operation_id_2_fixture():
 def test_router_registry_is_empty():
     """Test that the initial RouterOperationRegistry is empty."""
 
-    assert RouterOperationRegistry.registry == {}
+    assert dict(RouterOperationRegistry.registry) == {}
 
 
 def test_router_registry_register_router_raises_router_already_registered(router: Router):
@@ -86,9 +88,8 @@ def test_router_registry_register_router(router: Router):
     """Test that a router is registered successfully and has no operation ids."""
 
     RouterOperationRegistry.register_router(router=router)
-    router_id = id(router)
 
-    assert RouterOperationRegistry.registry == {router_id: []}
+    assert dict(RouterOperationRegistry.registry) == {router: {}}
 
 
 def test_router_registry_register_operation_id_raises_router_not_registered(router: Router, operation_id: str):
@@ -124,9 +125,8 @@ def test_router_registry_register_operation_id(router: Router, operation_id: str
 
     RouterOperationRegistry.register_router(router=router)
     RouterOperationRegistry.register_operation_id(router=router, operation_id=operation_id)
-    router_id = id(router)
 
-    assert RouterOperationRegistry.registry == {router_id: ["operation1"]}
+    assert dict(RouterOperationRegistry.registry) == {router: {"operation1": None}}
 
 
 def test_router_registry_operation_ids(router: Router, operation_id: str):
@@ -141,7 +141,7 @@ def test_router_registry_operation_ids(router: Router, operation_id: str):
 def test_api_registry_is_empty():
     """Test that the initial APIOperationRegistry is empty."""
 
-    assert APIOperationRegistry.registry == {}
+    assert dict(APIOperationRegistry.registry) == {}
 
 
 def test_api_registry_register_router_raises_api_already_registered(api: NinjaAPI):
@@ -161,9 +161,8 @@ def test_api_registry_register_api(api: Router):
     """Test that an API is registered successfully and has no operation ids."""
 
     APIOperationRegistry.register_api(api=api)
-    api_id = id(api)
 
-    assert APIOperationRegistry.registry == {api_id: []}
+    assert dict(APIOperationRegistry.registry) == {api: {}}
 
 
 def test_api_registry_register_routers_operation_ids_raises_api_not_registered(api: NinjaAPI, router: Router):
@@ -213,9 +212,8 @@ def test_api_registry_register_routers_operation_ids(
     RouterOperationRegistry.register_router(router=router_2)
     RouterOperationRegistry.register_operation_id(router=router_2, operation_id=operation_id_2)
     APIOperationRegistry.register_routers_operation_ids(api=api, router=router_2)
-    api_id = id(api)
 
-    assert APIOperationRegistry.registry == {api_id: ["operation1", "operation2"]}
+    assert dict(APIOperationRegistry.registry) == {api: {"operation1": None, "operation2": None}}
 
 
 def test_api_registry_operation_ids(
@@ -236,3 +234,42 @@ def test_api_registry_operation_ids(
     APIOperationRegistry.register_routers_operation_ids(api=api, router=router_2)
 
     assert APIOperationRegistry.operation_ids(api=api) == ["operation1", "operation2"]
+
+
+def test_router_registry_releases_routers(operation_id: str):
+    """Test that routers are released from the registry when they are garbage collected."""
+
+    router = Router()
+    RouterOperationRegistry.register_router(router=router)
+    RouterOperationRegistry.register_operation_id(router=router, operation_id=operation_id)
+
+    del router
+    gc.collect()
+
+    assert len(RouterOperationRegistry.registry) == 0
+
+
+def test_api_registry_releases_apis():
+    """Test that APIs are released from the registry when they are garbage collected."""
+
+    APIOperationRegistry.register_api(api=NinjaAPI())
+    gc.collect()
+
+    assert len(APIOperationRegistry.registry) == 0
+
+
+def test_registries_scoped(router: Router, api: NinjaAPI):
+    """Test that scoped registries start empty and restore the previous registry."""
+
+    RouterOperationRegistry.register_router(router=router)
+    APIOperationRegistry.register_api(api=api)
+
+    with RouterOperationRegistry.scoped(), APIOperationRegistry.scoped():
+        RouterOperationRegistry.register_router(router=router)
+        APIOperationRegistry.register_api(api=api)
+
+    with pytest.raises(expected_exception=RouterAlreadyRegisteredError):
+        RouterOperationRegistry.register_router(router=router)
+
+    with pytest.raises(expected_exception=APIAlreadyRegisteredError):
+        APIOperationRegistry.register_api(api=api)
@@ -0,0 +1,130 @@
+import datetime
+import decimal
+import enum
+import uuid
+from collections import OrderedDict, defaultdict
+
+import pytest
+from django.test import RequestFactory
+from django.utils.safestring import SafeString
+from ninja import Schema
+from pydantic import TypeAdapter
+
+from ninja_extended.api import parsers, renderers
+from ninja_extended.api.parsers import FastParser
+from ninja_extended.api.renderers import FastJSONRenderer
+
+
+class ItemSchema(Schema):
+    id: int
+    value: str | None = None
+
+
+@pytest.fixture(params=[True, False], ids=["orjson", "stdlib"])
+def use_orjson(request, mocker):
+    if not request.param:
+        mocker.patch.object(renderers, "orjson", None)
+        mocker.patch.object(parsers, "orjson", None)
+
+    return request.param
+
+
+def test_fast_json_renderer_render(use_orjson):  # noqa: ARG001
+    data = {
+        "datetime": datetime.datetime(2024, 1, 1, 12, 0, 0, 123456, tzinfo=datetime.timezone.utc),
+        "decimal": decimal.Decimal("1.50"),
+        "items": [1, None, "a"],
+    }
+
+    content = FastJSONRenderer().render(RequestFactory().get("/"), data, response_status=200)
+
+    assert content == b'{"datetime":"2024-01-01T12:00:00.123Z","decimal":"1.50","items":[1,null,"a"]}'
+
+
+class ItemList(list):
+    pass
+
+
+@pytest.mark.parametrize(
+    ("data", "expected"),
+    [
+        (OrderedDict([("b", 1), ("a", 2)]), b'{"b":1,"a":2}'),
+        (defaultdict(list, {"a": [1]}), b'{"a":[1]}'),
+        (SafeString("<b>value</b>"), b'"<b>value</b>"'),
+        (ItemList([1, 2]), b"[1,2]"),
+        ({"items": ItemList([OrderedDict(a=SafeString("a"))])}, b'{"items":[{"a":"a"}]}'),
+    ],
+    ids=["ordered-dict", "default-dict", "safe-string", "list-subclass", "nested"],
+)
+def test_fast_json_renderer_render_builtin_subclasses(use_orjson, data, expected):  # noqa: ARG001
+    content = FastJSONRenderer().render(RequestFactory().get("/"), data, response_status=200)
+
+    assert content == expected
+
+
+def test_fast_json_renderer_render_validated():
+    renderer = FastJSONRenderer()
+    type_adapter = TypeAdapter(list[ItemSchema])
+    data = type_adapter.validate_python([{"id": 1}, {"id": 2, "value": "value"}])
+
+    content = renderer.render_validated(RequestFactory().get("/"), type_adapter, data, exclude_none=True)
+
+    assert content == b'[{"id":1},{"id":2,"value":"value"}]'
+
+
+class Color(str, enum.Enum):
+    RED = "red"
+
+
+class TypedSchema(Schema):
+    datetime: datetime.datetime
+    time: datetime.time
+    duration: datetime.timedelta
+    color: Color
+    decimal: decimal.Decimal
+    date: datetime.date
+    uuid: uuid.UUID
+
+
+def test_fast_json_renderer_render_validated_matches_encoder(use_orjson):  # noqa: ARG001
+    renderer = FastJSONRenderer()
+    type_adapter = TypeAdapter(TypedSchema)
+    data = type_adapter.validate_python(
+        {
+            "datetime": datetime.datetime(2024, 1, 1, 12, 0, 0, 123456, tzinfo=datetime.timezone.utc),
+            "time": datetime.time(12, 0, 0, 123456),
+            "duration": datetime.timedelta(seconds=90),
+            "color": Color.RED,
+            "decimal": decimal.Decimal("1.50"),
+            "date": datetime.date(2024, 1, 1),
+            "uuid": uuid.UUID(int=1),
+        }
+    )
+    request = RequestFactory().get("/")
+
+    content = renderer.render_validated(request, type_adapter, data)
+
+    assert content == renderer.render(request, type_adapter.dump_python(data), response_status=200)
+    assert content == (
+        b'{"datetime":"2024-01-01T12:00:00.123Z","time":"12:00:00.123","duration":"P0DT00H01M30S",'
+        b'"color":"red","decimal":"1.50","date":"2024-01-01","uuid":"00000000-0000-0000-0000-000000000001"}'
+    )
+
+
+def test_fast_json_renderer_render_validated_dumps_json_if_output_matches(mocker):
+    renderer = FastJSONRenderer()
+    type_adapter = TypeAdapter(list[ItemSchema])
+    data = type_adapter.validate_python([{"id": 1, "value": "value"}])
+    render = mocker.spy(renderer, "render")
+    request = RequestFactory().get("/")
+
+    content = renderer.render_validated(request, type_adapter, data)
+
+    assert content == renderer.render(request, type_adapter.dump_python(data), response_status=200)
+    assert render.call_count == 1
+
+
+def test_fast_parser_parse_body(use_orjson):  # noqa: ARG001
+    request = RequestFactory().post("/", data=b'{"id": 1, "items": [1, 2]}', content_type="application/json")
+
+    assert FastParser().parse_body(request) == {"id": 1, "items": [1, 2]}
@@ -8,7 +8,7 @@ from ninja_extended.api.router import ExtendedRouter
 
 @pytest.fixture(name="reset_router_operation_registry", autouse=True)
 def reset_router_operation_registry_fixture():
-    RouterOperationRegistry.registry = {}
+    RouterOperationRegistry.reset()
 
 
 @pytest.fixture(name="router")
@@ -60,3 +60,14 @@ def test_extended_router_operation_ids_registered(router: ExtendedRouter):
         "operation_id_1",
         "operation_id_2",
     ]
+
+
+@pytest.mark.parametrize("method", ["post", "put", "patch", "delete"])
+def test_extended_router_write_methods_do_not_stream(router: ExtendedRouter, method: str):
+    def operation(request: HttpRequest):
+        pass
+
+    with pytest.raises(TypeError, match="streaming_export"):
+        getattr(router, method)(path="/", operation_id="operation_id", summary="Summary.", streaming_export=True)(
+            operation
+        )
@@ -0,0 +1,136 @@
+import pytest
+from ninja import Schema
+from ninja.errors import ValidationError
+from pydantic import field_serializer, field_validator, model_validator
+
+from ninja_extended.api import adapters, trusted
+from ninja_extended.api.sparse import SparseFieldsets
+
+
+class ResourceSchema(Schema):
+    id: int
+    value_unique: str
+    value_check: int | None
+
+    @staticmethod
+    def resolve_value_unique(obj):
+        return obj["value_unique"].upper()
+
+
+class ResponseSchema(Schema):
+    response: list[ResourceSchema]
+
+
+def test_sparse_fieldsets_are_cached():
+    sparse_fieldsets = SparseFieldsets(schema=ResourceSchema)
+
+    fieldset = sparse_fieldsets.resolve(frozenset({"id", "value_unique"}))
+
+    assert sparse_fieldsets.resolve(frozenset({"value_unique", "id"})) is fieldset
+    assert list(fieldset.schema.model_fields) == ["id", "value_unique"]
+    assert fieldset.schema.model_validate({"id": 1, "value_unique": "value"}).model_dump() == {
+        "id": 1,
+        "value_unique": "VALUE",
+    }
+    assert fieldset.query_planner.schema is fieldset.schema
+
+
+def test_sparse_fieldsets_raise_on_unknown_fields():
+    sparse_fieldsets = SparseFieldsets(schema=ResourceSchema)
+
+    with pytest.raises(ValidationError) as error:
+        sparse_fieldsets.resolve(frozenset({"id", "unknown"}))
+
+    assert error.value.errors[0]["msg"] == "Unknown fields: unknown"
+
+
+def test_sparse_fieldsets_response_model():
+    sparse_fieldsets = SparseFieldsets(schema=ResourceSchema)
+    fieldset = sparse_fieldsets.resolve(frozenset({"id"}))
+
+    response_model = sparse_fieldsets.response_model(ResponseSchema, fieldset)
+
+    assert sparse_fieldsets.response_model(ResponseSchema, fieldset) is response_model
+    assert response_model.model_validate({"response": [{"id": 1}]}).model_dump() == {"response": [{"id": 1}]}
+
+
+def test_sparse_fieldsets_response_adapters_are_bounded():
+    sparse_fieldsets = SparseFieldsets(schema=ResourceSchema, maxsize=2)
+    interned = len(adapters._response_adapters)  # noqa: SLF001
+
+    for fields in ({"id"}, {"value_unique"}, {"value_check"}, {"id", "value_check"}):
+        response_model = sparse_fieldsets.response_model(ResponseSchema, sparse_fieldsets.resolve(frozenset(fields)))
+        adapter = sparse_fieldsets.response_adapter(response_model)
+
+        assert sparse_fieldsets.response_adapter(response_model) is adapter
+        assert adapter.dump_python(adapter.validate_python([{"id": 1, "value_unique": "value", "value_check": 1}])) == [
+            {
+                name: value
+                for name, value in {"id": 1, "value_unique": "VALUE", "value_check": 1}.items()
+                if name in fields
+            }
+        ]
+
+    assert len(sparse_fieldsets._response_adapters) <= 2  # noqa: SLF001
+    assert len(adapters._response_adapters) == interned  # noqa: SLF001
+
+
+def test_sparse_fieldsets_response_constructors_are_bounded():
+    sparse_fieldsets = SparseFieldsets(schema=ResourceSchema, maxsize=2)
+    cached = len(trusted._response_constructors)  # noqa: SLF001
+
+    for fields in ({"id"}, {"value_check"}, {"id", "value_check"}):
+        response_model = sparse_fieldsets.response_model(ResponseSchema, sparse_fieldsets.resolve(frozenset(fields)))
+        constructor = sparse_fieldsets.response_constructor(response_model)
+
+        assert sparse_fieldsets.response_constructor(response_model) is constructor
+        assert constructor([{"id": 1, "value_check": 1}], None)[0].model_dump() == dict.fromkeys(fields, 1)
+
+    assert len(sparse_fieldsets._response_constructors) <= 2  # noqa: SLF001
+    assert len(trusted._response_constructors) == cached  # noqa: SLF001
+
+
+class ValidatedSchema(Schema):
+    id: int
+    value_unique: str
+    value_check: int | None
+
+    @field_validator("value_unique", "value_check", mode="before")
+    @classmethod
+    def strip(cls, value):
+        return value.strip() if isinstance(value, str) else value
+
+    @field_validator("value_check")
+    @classmethod
+    def check(cls, value):
+        if value is not None and value < 0:
+            raise ValueError("negative")  # noqa: EM101
+        return value
+
+    @field_serializer("value_unique")
+    def serialize_value_unique(self, value):
+        return value.upper()
+
+    @model_validator(mode="after")
+    def validate_model(self):
+        if self.id == 0:
+            raise ValueError("zero")  # noqa: EM101
+        return self
+
+
+def test_sparse_fieldsets_keep_validators_and_serializers():
+    sparse_fieldsets = SparseFieldsets(schema=ValidatedSchema)
+
+    schema = sparse_fieldsets.resolve(frozenset({"id", "value_unique"})).schema
+
+    assert schema.model_validate({"id": 1, "value_unique": " value "}).model_dump() == {
+        "id": 1,
+        "value_unique": "VALUE",
+    }
+    with pytest.raises(ValueError, match="zero"):
+        schema.model_validate({"id": 0, "value_unique": "value"})
+
+    schema = sparse_fieldsets.resolve(frozenset({"id", "value_check"})).schema
+
+    with pytest.raises(ValueError, match="negative"):
+        schema.model_validate({"id": 1, "value_check": -1})
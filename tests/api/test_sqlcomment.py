@@ -0,0 +1,134 @@
+import pytest
+from api.models import Resource
+from django.db import connection
+from django.http import HttpRequest
+from ninja import Schema
+from ninja.testing import TestClient
+
+from ninja_extended.api import sqlcomment
+from ninja_extended.api.api import ExtendedNinjaAPI
+from ninja_extended.api.router import ExtendedRouter
+from ninja_extended.api.sqlcomment import SQLCommenter, install_comment_wrapper, sql_comment
+
+
+class ResourceSchema(Schema):
+    id: int
+    value_unique: str
+
+
+@pytest.fixture(name="test_client", scope="module")
+def test_client_fixture():
+    api = ExtendedNinjaAPI(
+        title="API",
+        version="1.0.0",
+        description="Description",
+        urls_namespace="test-sqlcomment",
+        instrumentation=[SQLCommenter(tags={"application": "demo"})],
+    )
+    router = ExtendedRouter(tags=["resources"])
+
+    @router.get(path="/", operation_id="listResources", summary="Summary.", response=list[ResourceSchema])
+    def list_resources(request: HttpRequest):  # noqa: ARG001
+        return Resource.objects.order_by("pk")
+
+    @router.get(
+        path="/streamed",
+        operation_id="listResourcesStreamed",
+        summary="Summary.",
+        response=list[ResourceSchema],
+        stream_json_array=True,
+    )
+    def list_resources_streamed(request: HttpRequest):  # noqa: ARG001
+        return Resource.objects.order_by("pk")
+
+    api.add_router(prefix="/", router=router)
+
+    return TestClient(api)
+
+
+@pytest.mark.django_db
+def test_sql_commenter_prefixes_queries_of_operation(test_client: TestClient):
+    executed = []
+
+    def record(execute, sql, params, many, context):
+        executed.append(sql)
+        return execute(sql, params, many, context)
+
+    install_comment_wrapper(connection)
+    with connection.execute_wrapper(record):
+        response = test_client.get(path="/")
+        Resource.objects.count()
+
+    assert response.status_code == 200
+    assert executed[0].startswith(
+        "/*application='demo',method='GET',operation_id='listResources',tag='resources'*/ SELECT"
+    )
+    assert executed[1].startswith("SELECT")
+
+
+@pytest.mark.django_db
+def test_sql_commenter_prefixes_queries_of_streamed_body(test_client: TestClient):
+    executed = []
+
+    def record(execute, sql, params, many, context):
+        executed.append(sql)
+        return execute(sql, params, many, context)
+
+    install_comment_wrapper(connection)
+    with connection.execute_wrapper(record):
+        response = test_client.get(path="/streamed")
+        assert sqlcomment._comment.get() is None  # noqa: SLF001
+        assert response.content == b"[]"
+
+    assert executed[0].startswith("/*application='demo',method='GET',operation_id='listResourcesStreamed'")
+    assert sqlcomment._comment.get() is None  # noqa: SLF001
+
+
+@pytest.mark.django_db
+def test_sql_commenter_escapes_comment_of_queries_with_params():
+    api = ExtendedNinjaAPI(
+        title="API",
+        version="1.0.0",
+        description="Description",
+        urls_namespace="test-sqlcomment-params",
+        instrumentation=[SQLCommenter()],
+    )
+    router = ExtendedRouter(tags=["resources", "search"])
+
+    @router.get(path="/", operation_id="countResources", summary="Summary.", response=list[int])
+    def count_resources(request: HttpRequest):  # noqa: ARG001
+        with connection.cursor() as cursor:
+            cursor.execute("SELECT 1")
+            return [Resource.objects.filter(value_check__gte=0).count(), cursor.fetchone()[0]]
+
+    api.add_router(prefix="/", router=router)
+    executed = []
+
+    def record(execute, sql, params, many, context):
+        executed.append(sql)
+        return execute(sql, params, many, context)
+
+    install_comment_wrapper(connection)
+    with connection.execute_wrapper(record):
+        response = TestClient(api).get(path="/")
+
+    assert response.status_code == 200
+    assert response.json() == [0, 1]
+    assert executed[0] == "/*method='GET',operation_id='countResources',tag='resources%2Csearch'*/ SELECT 1"
+    assert executed[1].startswith("/*method='GET',operation_id='countResources',tag='resources%%2Csearch'*/ SELECT")
+
+
+@pytest.mark.django_db
+def test_sql_commenter_restores_comment(test_client: TestClient):
+    token = sqlcomment._comment.set(("/*outer*/ ", "/*outer*/ "))  # noqa: SLF001
+
+    try:
+        test_client.get(path="/")
+
+        assert sqlcomment._comment.get() == ("/*outer*/ ", "/*outer*/ ")  # noqa: SLF001
+    finally:
+        sqlcomment._comment.reset(token)  # noqa: SLF001
+
+
+def test_sql_comment_encodes_values():
+    assert sql_comment(b="x*/ DROP", a="1", c=None) == "/*a='1',b='x%2A%2F%20DROP'*/ "
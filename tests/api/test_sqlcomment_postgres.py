@@ -0,0 +1,50 @@
+import pytest
+from api.models import Resource
+from django.db import connections
+from django.http import HttpRequest
+from django.test.utils import CaptureQueriesContext
+from ninja.testing import TestClient
+
+from ninja_extended.api.api import ExtendedNinjaAPI
+from ninja_extended.api.router import ExtendedRouter
+from ninja_extended.api.sqlcomment import SQLCommenter
+
+
+@pytest.fixture(name="test_client", scope="module")
+def test_client_fixture():
+    api = ExtendedNinjaAPI(
+        title="API",
+        version="1.0.0",
+        description="Description",
+        urls_namespace="test-sqlcomment-postgres",
+        instrumentation=[SQLCommenter(tags={"application": "demo app"})],
+    )
+    router = ExtendedRouter(tags=["resources", "search"])
+
+    @router.get(path="/", operation_id="countResources", summary="Summary.", response=int)
+    def count_resources(request: HttpRequest):  # noqa: ARG001
+        return Resource.objects.using("postgres").filter(value_check__gte=0).count()
+
+    api.add_router(prefix="/", router=router)
+
+    return TestClient(api)
+
+
+@pytest.mark.django_db(databases=["postgres"])
+def test_sql_commenter_comments_queries_with_params_postgres(test_client: TestClient):
+    Resource.objects.using("postgres").create(
+        value_unique="value",
+        value_unique_together_1="value",
+        value_unique_together_2="value",
+        value_not_null="value",
+        value_check=1,
+    )
+
+    with CaptureQueriesContext(connections["postgres"]) as context:
+        response = test_client.get(path="/")
+
+    assert response.status_code == 200
+    assert response.json() == 1
+    assert context.captured_queries[0]["sql"].startswith(
+        "/*application='demo%20app',method='GET',operation_id='countResources',tag='resources%2Csearch'*/ SELECT"
+    )
@@ -0,0 +1,59 @@
+from django.test import RequestFactory
+from ninja import Schema
+
+from ninja_extended.api.renderers import FastJSONRenderer
+from ninja_extended.api.streaming import (
+    CSVFormat,
+    JSONArrayFormat,
+    NDJSONFormat,
+    StreamingSerializer,
+    negotiate_stream_format,
+)
+
+
+class ItemSchema(Schema):
+    id: int
+    tags: list[str]
+
+
+def test_negotiate_stream_format():
+    factory = RequestFactory()
+
+    assert isinstance(negotiate_stream_format(factory.get("/", HTTP_ACCEPT="application/x-ndjson")), NDJSONFormat)
+    assert isinstance(negotiate_stream_format(factory.get("/", HTTP_ACCEPT="text/csv;q=0.9, */*")), CSVFormat)
+    assert negotiate_stream_format(factory.get("/", HTTP_ACCEPT="*/*")) is None
+    assert negotiate_stream_format(factory.get("/")) is None
+
+
+def test_streaming_serializer_writes_chunks():
+    request = RequestFactory().get("/")
+    serializer = StreamingSerializer(schema=ItemSchema, chunk_size=2)
+
+    response = serializer.response(request, [{"id": i, "tags": ["a", "b"]} for i in range(3)], CSVFormat())
+
+    assert list(response.streaming_content) == [
+        b'id,tags\r\n0,"[""a"", ""b""]"\r\n',
+        b'1,"[""a"", ""b""]"\r\n2,"[""a"", ""b""]"\r\n',
+    ]
+
+
+def test_streaming_serializer_writes_json_array():
+    request = RequestFactory().get("/")
+    serializer = StreamingSerializer(schema=ItemSchema, chunk_size=2)
+
+    response = serializer.response(request, [{"id": i, "tags": []} for i in range(3)], JSONArrayFormat())
+
+    assert (
+        b"".join(response.streaming_content) == b'[{"id": 0, "tags": []},{"id": 1, "tags": []},{"id": 2, "tags": []}]'
+    )
+
+
+def test_streaming_serializer_renders_rows_with_renderer():
+    request = RequestFactory().get("/")
+    serializer = StreamingSerializer(schema=ItemSchema, chunk_size=2)
+
+    response = serializer.response(
+        request, [{"id": i, "tags": ["a"]} for i in range(2)], NDJSONFormat(), renderer=FastJSONRenderer()
+    )
+
+    assert b"".join(response.streaming_content) == b'{"id":0,"tags":["a"]}\n{"id":1,"tags":["a"]}\n'
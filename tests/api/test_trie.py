@@ -0,0 +1,154 @@
+import pytest
+from django.http import HttpRequest
+from django.urls import Resolver404, URLResolver, path
+from django.urls.resolvers import RoutePattern
+from ninja.testing import TestClient
+
+from ninja_extended.api.api import ExtendedNinjaAPI
+from ninja_extended.api.router import ExtendedRouter
+from ninja_extended.api.trie import ReverseOnlyURLPattern, RouteTrie, RouteTrieURLPattern, route_trie_urls
+
+
+def view(request: HttpRequest, **kwargs):  # noqa: ARG001
+    return kwargs
+
+
+@pytest.fixture(name="api", scope="module")
+def api_fixture():
+    api = ExtendedNinjaAPI(
+        title="API", version="1.0.0", description="Description", urls_namespace="test-trie", route_trie=True
+    )
+    router = ExtendedRouter(tags=["router"])
+
+    @router.get(path="/resources", operation_id="listResources", summary="Summary.")
+    def list_resources(request: HttpRequest):  # noqa: ARG001
+        return {"operation": "listResources"}
+
+    @router.get(path="/resources/me", operation_id="getMe", summary="Summary.")
+    def get_me(request: HttpRequest):  # noqa: ARG001
+        return {"operation": "getMe"}
+
+    @router.get(path="/resources/{int:id}", operation_id="getResource", summary="Summary.")
+    def get_resource(request: HttpRequest, id: int):  # noqa: A002, ARG001
+        return {"operation": "getResource", "id": id}
+
+    @router.get(path="/resources/{slug}/children", operation_id="listChildren", summary="Summary.")
+    def list_children(request: HttpRequest, slug: str):  # noqa: ARG001
+        return {"operation": "listChildren", "slug": slug}
+
+    @router.get(path="/files/{path:name}", operation_id="getFile", summary="Summary.")
+    def get_file(request: HttpRequest, name: str):  # noqa: ARG001
+        return {"operation": "getFile", "name": name}
+
+    api.add_router(prefix="/", router=router)
+
+    return api
+
+
+@pytest.fixture(name="test_client", scope="module")
+def test_client_fixture(api: ExtendedNinjaAPI):
+    return TestClient(api)
+
+
+@pytest.fixture(name="resolver", scope="module")
+def resolver_fixture(test_client: TestClient):
+    return URLResolver(RoutePattern("api/"), test_client.urls)
+
+
+def test_route_trie_api_resolves_operations(test_client: TestClient):
+    assert test_client.get("/resources").json() == {"operation": "listResources"}
+    assert test_client.get("/resources/me").json() == {"operation": "getMe"}
+    assert test_client.get("/resources/1").json() == {"operation": "getResource", "id": 1}
+    assert test_client.get("/resources/one/children").json() == {"operation": "listChildren", "slug": "one"}
+    assert test_client.get("/files/a/b.txt").json() == {"operation": "getFile", "name": "a/b.txt"}
+
+
+def test_route_trie_api_urls(test_client: TestClient):
+    trie_patterns = [url for url in test_client.urls if isinstance(url, RouteTrieURLPattern)]
+    reverse_only = [url.name for url in test_client.urls if isinstance(url, ReverseOnlyURLPattern)]
+
+    assert len(trie_patterns) == 1
+    assert reverse_only == ["list_resources", "get_me", "get_resource", "list_children"]
+
+
+def test_route_trie_api_resolver(resolver: URLResolver):
+    match = resolver.resolve("api/resources/1")
+
+    assert match.kwargs == {"id": 1}
+    assert match.url_name == "get_resource"
+    assert match.route == "resources/<int:id>"
+    assert resolver.resolve("api/files/a/b.txt").url_name == "get_file"
+    assert resolver.reverse("get_resource", id=1) == "resources/1"
+
+    with pytest.raises(Resolver404):
+        resolver.resolve("api/resources/1/unknown")
+
+
+def test_route_trie_precedence_and_backtracking():
+    trie = RouteTrie()
+    first = path("a/<x>/b", view, name="first")
+    patterns = [
+        first,
+        path("a/<y>/b", view, name="second"),
+        path("a/me/c", view, name="static"),
+        path("a/<int:x>", view, name="int"),
+        path("a/<str:x>", view, name="str"),
+    ]
+
+    assert all(trie.add(pattern) for pattern in patterns)
+    assert trie.resolve("a/me/b").url_name == "first"
+    assert trie.resolve("a/me/b").kwargs == {"x": "me"}
+    assert trie.resolve("a/me/c").url_name == "static"
+    assert trie.resolve("a/1").url_name == "int"
+    assert trie.resolve("a/1").kwargs == {"x": 1}
+    assert trie.resolve("a/one").url_name == "str"
+    assert trie.resolve("a") is None
+    assert trie.resolve("a/") is None
+    assert trie.resolve("b") is None
+
+
+ROUTES = ["a/<x>/b", "a/me/<int:y>", "a/<int:x>/<y>", "a/me/c", "<x>/<y>/c", "a/", "a", "<slug:x>", "<int:x>"]
+
+
+@pytest.mark.parametrize(
+    "path_", ["a/me/b", "a/me/1", "a/1/b", "a/1/c", "a/me/c", "b/me/c", "a/", "a", "1", "one", "a/b/c/d", ""]
+)
+def test_route_trie_resolves_like_django(path_: str):
+    patterns = [path(route, view, name=route) for route in ROUTES]
+    trie = RouteTrie()
+    for pattern in patterns:
+        trie.add(pattern)
+
+    match = trie.resolve(path_)
+
+    try:
+        expected = URLResolver(RoutePattern(""), patterns).resolve(path_)
+    except Resolver404:
+        assert match is None
+    else:
+        assert (match.url_name, match.kwargs) == (expected.url_name, expected.kwargs)
+
+
+def test_route_trie_rejects_unsupported_routes():
+    trie = RouteTrie()
+
+    assert not trie.add(path("files/<path:name>", view))
+    assert not trie.add(path("files/file-<int:id>.json", view))
+    assert not trie.add(path("files/", view, {"extra": True}))
+
+    urls = route_trie_urls([path("files/<path:name>", view, name="file"), path("items/", view, name="items")])
+
+    assert [type(url) for url in urls] == [RouteTrieURLPattern, type(urls[1]), ReverseOnlyURLPattern]
+    assert urls[1].name == "file"
+    assert urls[2].resolve("items/") is None
+
+
+def test_route_trie_resolves_many_routes():
+    trie = RouteTrie()
+    for i in range(1500):
+        trie.add(path(f"resources-{i}/<int:id>/children/", view, name=f"route-{i}"))
+
+    match = trie.resolve("resources-1499/1/children/")
+
+    assert match.url_name == "route-1499"
+    assert match.kwargs == {"id": 1}
@@ -0,0 +1,87 @@
+from typing import Annotated
+
+from ninja import Field, Schema
+from pydantic import AfterValidator, BaseModel, field_validator
+
+from ninja_extended.api.trusted import response_constructor
+
+
+class Obj:
+    def __init__(self, **kwargs):
+        self.__dict__.update(kwargs)
+
+
+class ChildSchema(Schema):
+    name: str
+
+
+class ResourceSchema(Schema):
+    id: int
+    value: str = Field(alias="value_source")
+    parent_name: str | None = Field(None, alias="parent.name")
+    children: list[ChildSchema]
+    child: ChildSchema | None = None
+    upper: str
+
+    @staticmethod
+    def resolve_upper(obj):
+        return obj.value_source.upper()
+
+
+class TreeSchema(Schema):
+    children: list["TreeSchema"]
+
+
+class ValidatedSchema(Schema):
+    value: str
+
+    @field_validator("value")
+    @classmethod
+    def strip(cls, value: str) -> str:
+        return value.strip()
+
+
+class Model(BaseModel):
+    value: str
+
+
+def test_response_constructor_builds_schemas_without_validation():
+    constructor = response_constructor(list[ResourceSchema])
+    obj = Obj(id=1, value_source="value", parent=Obj(name="parent"), children=[Obj(name="child")], child=None)
+
+    resources = constructor([obj], {})
+
+    assert response_constructor(list[ResourceSchema]) is constructor
+    assert isinstance(resources[0], ResourceSchema)
+    assert isinstance(resources[0].children[0], ChildSchema)
+    assert resources[0].model_dump() == {
+        "id": 1,
+        "value": "value",
+        "parent_name": "parent",
+        "children": [{"name": "child"}],
+        "child": None,
+        "upper": "VALUE",
+    }
+
+
+def test_response_constructor_uses_defaults():
+    constructor = response_constructor(ResourceSchema)
+
+    resource = constructor(Obj(id=1, value_source="value", children=[]), {})
+
+    assert resource.parent_name is None
+    assert resource.child is None
+
+
+def test_response_constructor_passes_plain_values_through():
+    constructor = response_constructor(dict[str, int])
+
+    assert constructor({"a": 1}, {}) == {"a": 1}
+
+
+def test_response_constructor_requires_validation():
+    assert response_constructor(TreeSchema) is None
+    assert response_constructor(ValidatedSchema) is None
+    assert response_constructor(Model) is None
+    assert response_constructor(Annotated[str, AfterValidator(str.strip)]) is None
+    assert response_constructor(ChildSchema | ResourceSchema) is None
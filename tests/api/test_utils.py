@@ -19,14 +19,14 @@ from ninja_extended.errors import AuthenticationError, AuthorizationError, CSRFE
 def reset_router_operation_registry_fixture():
     """Fixture for resetting the RouterOperationRegistry."""
 
-    RouterOperationRegistry.registry = {}
+    RouterOperationRegistry.reset()
 
 
 @pytest.fixture(name="reset_api_operation_registry", autouse=True)
 def reset_api_operation_registry_fixture():
     """Fixture for resetting the APIOperationRegistry."""
 
-    APIOperationRegistry.registry = {}
+    APIOperationRegistry.reset()
 
 
 @pytest.fixture(name="router")
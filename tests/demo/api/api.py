@@ -21,7 +21,7 @@ from ninja_extended.errors import (
     register_error_handler,
     register_validation_error_handler,
 )
-from ninja_extended.pagination import PageNumberPageSizePagination
+from ninja_extended.pagination import KeysetPagination, PageNumberPageSizePagination
 
 api = ExtendedNinjaAPI(title="Test API", version="0.0.1", description="API description")
 router = ExtendedRouter(tags=["resources"])
@@ -45,6 +45,10 @@ register_validation_error_handler(api=api)
     operation_id="listResources",
     summary="List all Resources",
     response=response_factory((200, list[ResourceResponse])),
+    values_fast_path=True,
+    sparse_fields=True,
+    streaming_export=True,
+    stream_json_array=True,
 )
 def list_resources(request: HttpRequest):  # noqa: ARG001
     return Resource.objects.list_resources()
@@ -55,17 +59,33 @@ def list_resources(request: HttpRequest):  # noqa: ARG001
     operation_id="listResourcesPagination",
     summary="List all Resources with pagination",
     response=response_factory((200, list[ResourceResponse])),
+    values_fast_path=True,
+    sparse_fields=True,
+    streaming_export=True,
 )
 @paginate(PageNumberPageSizePagination)
 def list_resources_pagination(request: HttpRequest):  # noqa: ARG001
     return Resource.objects.list_resources()
 
 
+@router.get(
+    path="/keyset",
+    operation_id="listResourcesKeyset",
+    summary="List all Resources with keyset pagination",
+    response=response_factory((200, list[ResourceResponse])),
+)
+@paginate(KeysetPagination)
+def list_resources_keyset(request: HttpRequest):  # noqa: ARG001
+    return Resource.objects.list_resources()
+
+
 @router.get(
     path="/{id}",
     operation_id="getResourceById",
     summary="Get a Resource by id",
     response=response_factory((200, ResourceResponse), NotFoundError, MultipleObjectsReturnedError, ValidationError),
+    sparse_fields=True,
+    trusted_response=True,
 )
 def get_resource_by_id(request: HttpRequest, id: int):  # noqa: ARG001, A002
     return Resource.objects.get_resource_by_id(id=id)
@@ -0,0 +1,20 @@
+# Generated by Django 5.1.4 on 2026-10-18 02:25
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("api", "0004_child1_child2_delete_childmodel"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="Event",
+            fields=[
+                ("id", models.AutoField(editable=False, primary_key=True, serialize=False, unique=True)),
+                ("created", models.DateTimeField()),
+                ("time", models.TimeField()),
+            ],
+        ),
+    ]
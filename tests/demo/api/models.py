@@ -8,6 +8,7 @@ from django.db.models import (
     AutoField,
     CharField,
     CheckConstraint,
+    DateTimeField,
     ForeignKey,
     IntegerField,
     Manager,
@@ -15,6 +16,7 @@ from django.db.models import (
     ProtectedError,
     Q,
     QuerySet,
+    TimeField,
 )
 from django.db.transaction import atomic
 from ninja.constants import NOT_SET, NOT_SET_TYPE
@@ -183,3 +185,9 @@ class Child2(Model):
         related_name="children_2",
         null=False,
     )
+
+
+class Event(Model):
+    id = AutoField(primary_key=True, unique=True, editable=False)
+    created = DateTimeField(null=False)
+    time = TimeField(null=False)
@@ -0,0 +1,165 @@
+import pytest
+from api.models import Resource
+from asgiref.sync import async_to_sync
+from django.core.cache import cache
+from django.db import connections
+from django.db.models import Count
+from django.test import RequestFactory
+from ninja.errors import ValidationError
+
+from ninja_extended.pagination import (
+    CachedCount,
+    CappedCount,
+    CountResult,
+    EstimatedCount,
+    ExactCount,
+    PageNumberPageSizePagination,
+    WindowCount,
+)
+
+
+@pytest.fixture
+def resources():
+    for i in range(10):
+        value = f"value_{i}"
+        Resource.objects.create(
+            value_unique=value,
+            value_unique_together_1=value,
+            value_unique_together_2=value,
+            value_not_null=value,
+            value_check=i,
+        )
+
+    return list(Resource.objects.order_by("pk"))
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    cache.clear()
+
+
+@pytest.mark.django_db
+def test_exact_count(resources):  # noqa: ARG001
+    assert ExactCount().count(Resource.objects.all()) == CountResult(count=10, exact=True)
+    assert ExactCount().count([1, 2, 3]) == CountResult(count=3, exact=True)
+    assert async_to_sync(ExactCount().acount)(Resource.objects.all()) == CountResult(count=10, exact=True)
+
+
+@pytest.mark.django_db
+def test_cached_count_is_keyed_by_sql_and_params(resources, django_assert_num_queries):  # noqa: ARG001
+    strategy = CachedCount(timeout=60)
+
+    with django_assert_num_queries(2):
+        assert strategy.count(Resource.objects.filter(value_check__gte=5)) == CountResult(count=5, exact=True)
+        assert strategy.count(Resource.objects.filter(value_check__gte=5)) == CountResult(count=5, exact=True)
+        assert strategy.count(Resource.objects.filter(value_check__gte=8)) == CountResult(count=2, exact=True)
+
+
+@pytest.mark.django_db
+def test_estimated_count_falls_back_to_exact_count(resources):  # noqa: ARG001
+    assert EstimatedCount(threshold=0).count(Resource.objects.all()) == CountResult(count=10, exact=True)
+
+
+def test_estimated_count_does_not_estimate_grouped_queryset(mocker):
+    mocker.patch.object(connections["default"], "vendor", "postgresql")
+
+    assert EstimatedCount._is_estimable(Resource.objects.all())  # noqa: SLF001
+    assert not EstimatedCount._is_estimable(Resource.objects.values("value_check").annotate(count=Count("id")))  # noqa: SLF001
+
+
+@pytest.mark.django_db
+def test_capped_count(resources):  # noqa: ARG001
+    assert CappedCount(cap=5).count(Resource.objects.all()) == CountResult(count=5, exact=False)
+    assert CappedCount(cap=10).count(Resource.objects.all()) == CountResult(count=10, exact=True)
+    assert CappedCount(cap=5).display(CountResult(count=5, exact=False)) == "5+"
+
+
+@pytest.mark.django_db
+def test_pagination_with_capped_count(resources):
+    paginator = PageNumberPageSizePagination(count_strategy=CappedCount(cap=5))
+    request = RequestFactory().get("/resources/pagination")
+
+    result = paginator.paginate_queryset(
+        Resource.objects.order_by("pk"), PageNumberPageSizePagination.Input(page=2, page_size=3), request=request
+    )
+
+    assert result["count"] == "5+"
+    assert result["pages"] == 3
+    assert result["next_page"] == 3
+    assert result["items"] == resources[3:6]
+
+    result = paginator.paginate_queryset(
+        Resource.objects.order_by("pk"), PageNumberPageSizePagination.Input(page=4, page_size=3), request=request
+    )
+
+    assert result["count"] == "5+"
+    assert result["pages"] == 4
+    assert result["next_page"] is None
+    assert result["items"] == resources[9:]
+    assert paginator.Output.model_fields["count"].annotation == int | str
+
+
+@pytest.mark.django_db
+def test_pagination_with_capped_count_rejects_page_beyond_items(resources):  # noqa: ARG001
+    paginator = PageNumberPageSizePagination(count_strategy=CappedCount(cap=5))
+    request = RequestFactory().get("/resources/pagination")
+
+    with pytest.raises(ValidationError) as exc_info:
+        paginator.paginate_queryset(
+            Resource.objects.order_by("pk"), PageNumberPageSizePagination.Input(page=50, page_size=3), request=request
+        )
+
+    assert exc_info.value.errors[0]["loc"] == ("query", "page")
+    assert exc_info.value.errors[0]["ctx"] == {"le": 2}
+
+
+@pytest.mark.django_db
+def test_window_count_fetches_page_and_count_with_one_query(resources, django_assert_num_queries):
+    strategy = WindowCount()
+
+    with django_assert_num_queries(1):
+        items, result = strategy.count_page(Resource.objects.order_by("pk"), 3, 3)
+
+    assert result == CountResult(count=10, exact=True)
+    assert items == resources[3:6]
+    assert not hasattr(items[0], WindowCount.annotation)
+
+    with django_assert_num_queries(2):
+        items, result = strategy.count_page(Resource.objects.order_by("pk"), 12, 3)
+
+    assert result == CountResult(count=10, exact=True)
+    assert items == []
+
+
+@pytest.mark.django_db
+def test_window_count_supports_values_list(resources, django_assert_num_queries):
+    strategy = WindowCount()
+
+    with django_assert_num_queries(1):
+        items, result = strategy.count_page(Resource.objects.order_by("pk").values_list("id", "value_unique"), 3, 3)
+
+    assert result == CountResult(count=10, exact=True)
+    assert items == [(resource.id, resource.value_unique) for resource in resources[3:6]]
+
+    with django_assert_num_queries(1):
+        items, result = strategy.count_page(Resource.objects.order_by("pk").values_list("id", flat=True), 3, 3)
+
+    assert result == CountResult(count=10, exact=True)
+    assert items is None
+
+
+@pytest.mark.django_db
+def test_pagination_with_window_count(resources, django_assert_num_queries):
+    paginator = PageNumberPageSizePagination(count_strategy=WindowCount())
+    request = RequestFactory().get("/resources/pagination")
+
+    with django_assert_num_queries(1):
+        result = async_to_sync(paginator.apaginate_queryset)(
+            Resource.objects.order_by("pk").values("id"),
+            PageNumberPageSizePagination.Input(page=2, page_size=3),
+            request=request,
+        )
+
+    assert result["count"] == 10
+    assert result["pages"] == 4
+    assert result["items"] == [{"id": resource.id} for resource in resources[3:6]]
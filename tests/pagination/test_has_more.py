@@ -0,0 +1,60 @@
+import pytest
+from api.models import Resource
+from asgiref.sync import async_to_sync
+from django.test import RequestFactory
+
+from ninja_extended.pagination import HasMorePagination
+
+
+@pytest.fixture
+def resources():
+    for i in range(10):
+        value = f"value_{i}"
+        Resource.objects.create(
+            value_unique=value,
+            value_unique_together_1=value,
+            value_unique_together_2=value,
+            value_not_null=value,
+            value_check=1,
+        )
+
+    return list(Resource.objects.order_by("pk"))
+
+
+def test_has_more_output_has_no_count():
+    assert "count" not in HasMorePagination.Output.model_fields
+    assert "pages" not in HasMorePagination.Output.model_fields
+
+
+@pytest.mark.django_db
+def test_has_more_pagination_runs_a_single_query(resources, django_assert_num_queries):
+    paginator = HasMorePagination()
+    request = RequestFactory().get("/resources/pagination")
+
+    with django_assert_num_queries(1):
+        result = paginator.paginate_queryset(
+            Resource.objects.order_by("pk"), HasMorePagination.Input(page=2, page_size=3), request=request
+        )
+
+    assert result == {
+        "current_page": 2,
+        "previous_page": 1,
+        "next_page": 3,
+        "previous_url": "http://testserver/resources/pagination?page_size=3&page=1",
+        "next_url": "http://testserver/resources/pagination?page_size=3&page=3",
+        "items": resources[3:6],
+    }
+
+
+@pytest.mark.django_db
+def test_has_more_pagination_last_page(resources):
+    paginator = HasMorePagination()
+    request = RequestFactory().get("/resources/pagination")
+
+    result = async_to_sync(paginator.apaginate_queryset)(
+        Resource.objects.order_by("pk"), HasMorePagination.Input(page=4, page_size=3), request=request
+    )
+
+    assert result["next_page"] is None
+    assert result["next_url"] is None
+    assert result["items"] == resources[9:]
@@ -0,0 +1,206 @@
+import datetime
+
+import pytest
+from api.models import Event, Resource
+from django.db.models import F
+from django.http import HttpRequest
+from django.test import RequestFactory
+from ninja import Schema
+from ninja.errors import ConfigError, ValidationError
+from ninja.pagination import paginate
+from ninja.testing import TestClient
+
+from ninja_extended.api.api import ExtendedNinjaAPI
+from ninja_extended.api.router import ExtendedRouter
+from ninja_extended.pagination import KeysetPagination
+
+
+@pytest.fixture
+def resources():
+    for i in range(10):
+        value = f"value_{i}"
+        Resource.objects.create(
+            value_unique=value,
+            value_unique_together_1=value,
+            value_unique_together_2=value,
+            value_not_null=value,
+            value_check=i % 3,
+        )
+
+    return list(Resource.objects.order_by("pk"))
+
+
+@pytest.mark.django_db
+def test_keyset_pagination_follows_queryset_ordering(resources):
+    paginator = KeysetPagination()
+    queryset = Resource.objects.order_by("-value_check")
+    request = RequestFactory().get("/resources/keyset")
+    expected = sorted(resources, key=lambda resource: (-resource.value_check, resource.pk))
+
+    result = paginator.paginate_queryset(queryset, KeysetPagination.Input(page_size=4), request=request)
+    items = list(result["items"])
+
+    while result["next_cursor"]:
+        result = paginator.paginate_queryset(
+            queryset, KeysetPagination.Input(cursor=result["next_cursor"], page_size=4), request=request
+        )
+        items.extend(result["items"])
+
+    assert items == expected
+
+
+@pytest.mark.django_db
+def test_keyset_pagination_rejects_cursor_of_other_ordering(resources):  # noqa: ARG001
+    paginator = KeysetPagination()
+    request = RequestFactory().get("/resources/keyset")
+
+    result = paginator.paginate_queryset(
+        Resource.objects.order_by("value_check"), KeysetPagination.Input(page_size=4), request=request
+    )
+
+    with pytest.raises(ValidationError):
+        paginator.paginate_queryset(
+            Resource.objects.order_by("-value_check"),
+            KeysetPagination.Input(cursor=result["next_cursor"], page_size=4),
+            request=request,
+        )
+
+
+@pytest.fixture
+def nullable_resources(resources):
+    Resource.objects.filter(pk__in=[resource.pk for resource in resources[::4]]).update(value_check=None)
+
+    return list(Resource.objects.order_by("pk"))
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize(
+    "order",
+    [
+        "value_check",
+        "-value_check",
+        F("value_check").asc(nulls_first=True),
+        F("value_check").asc(nulls_last=True),
+        F("value_check").desc(nulls_first=True),
+        F("value_check").desc(nulls_last=True),
+    ],
+)
+def test_keyset_pagination_pages_nullable_ordering_in_both_directions(nullable_resources, order):  # noqa: ARG001
+    paginator = KeysetPagination()
+    queryset = Resource.objects.order_by(order)
+    request = RequestFactory().get("/resources/keyset")
+    expected = list(queryset.order_by(order, "pk"))
+
+    result = paginator.paginate_queryset(queryset, KeysetPagination.Input(page_size=3), request=request)
+    pages = [list(result["items"])]
+
+    while result["next_cursor"]:
+        result = paginator.paginate_queryset(
+            queryset, KeysetPagination.Input(cursor=result["next_cursor"], page_size=3), request=request
+        )
+        pages.append(list(result["items"]))
+
+    assert [item for page in pages for item in page] == expected
+
+    for page in reversed(pages[:-1]):
+        result = paginator.paginate_queryset(
+            queryset, KeysetPagination.Input(cursor=result["previous_cursor"], page_size=3), request=request
+        )
+        assert list(result["items"]) == page
+
+
+@pytest.mark.django_db
+def test_keyset_pagination_rejects_ordering_on_annotation(resources):  # noqa: ARG001
+    paginator = KeysetPagination()
+    queryset = Resource.objects.annotate(double_check=F("value_check") * 2).order_by("double_check")
+    request = RequestFactory().get("/resources/keyset")
+
+    with pytest.raises(ConfigError, match="double_check"):
+        paginator.paginate_queryset(queryset, KeysetPagination.Input(page_size=4), request=request)
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("order", ["created", "-created", "time", "-time"])
+def test_keyset_pagination_pages_sub_millisecond_values(order):
+    created = datetime.datetime(2024, 1, 1, 12, 0, 0, 100, tzinfo=datetime.timezone.utc)
+    events = [
+        Event.objects.create(
+            created=created + datetime.timedelta(microseconds=100 * i),
+            time=(created + datetime.timedelta(microseconds=100 * i)).time(),
+        )
+        for i in range(3)
+    ]
+    paginator = KeysetPagination()
+    queryset = Event.objects.order_by(order)
+    request = RequestFactory().get("/events/keyset")
+
+    result = paginator.paginate_queryset(queryset, KeysetPagination.Input(page_size=2), request=request)
+    items = list(result["items"])
+    result = paginator.paginate_queryset(
+        queryset, KeysetPagination.Input(cursor=result["next_cursor"], page_size=2), request=request
+    )
+    items.extend(result["items"])
+
+    assert items == (events[::-1] if order.startswith("-") else events)
+
+
+class ResourceSchema(Schema):
+    id: int
+    value_unique: str
+    value_check: int | None
+
+
+@pytest.fixture(name="test_client", scope="module")
+def test_client_fixture():
+    api = ExtendedNinjaAPI(title="API", version="1.0.0", description="Description", urls_namespace="test-keyset")
+    router = ExtendedRouter(tags=["router"])
+
+    @router.get(
+        path="/",
+        operation_id="listResources",
+        summary="Summary.",
+        response=list[ResourceSchema],
+        values_fast_path=True,
+        sparse_fields=True,
+    )
+    @paginate(KeysetPagination)
+    def list_resources(request: HttpRequest):  # noqa: ARG001
+        return Resource.objects.order_by("-value_check")
+
+    api.add_router(prefix="/", router=router)
+
+    return TestClient(api)
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize(
+    ("fields", "keys"),
+    [(None, {"id", "value_unique", "value_check"}), ("value_unique", {"value_unique"})],
+    ids=["values", "sparse-values"],
+)
+def test_keyset_pagination_pages_values_rows(test_client, resources, fields, keys):
+    expected = [
+        resource.value_unique
+        for resource in sorted(resources, key=lambda resource: (-resource.value_check, resource.pk))
+    ]
+    query = f"&fields={fields}" if fields is not None else ""
+
+    response = test_client.get(path=f"/?page_size=4{query}")
+    items = response.data["items"]
+    while response.data["next_cursor"]:
+        response = test_client.get(path=f"/?page_size=4&cursor={response.data['next_cursor']}{query}")
+        assert response.status_code == 200
+        items.extend(response.data["items"])
+
+    assert [item["value_unique"] for item in items] == expected
+    assert all(item.keys() == keys for item in items)
+
+
+@pytest.mark.django_db
+def test_keyset_pagination_rejects_values_list(resources):  # noqa: ARG001
+    with pytest.raises(ConfigError, match="KeysetPagination does not support values_list"):
+        KeysetPagination().paginate_queryset(
+            Resource.objects.values_list("value_unique"),
+            KeysetPagination.Input(page_size=4),
+            request=RequestFactory().get("/resources/keyset"),
+        )
@@ -0,0 +1,58 @@
+import pytest
+from api.models import Resource
+from asgiref.sync import async_to_sync
+from django.test import RequestFactory
+
+from ninja_extended.pagination import PageNumberPageSizePagination
+from ninja_extended.pagination.page_number_page_size import _inject_page_number_page_size_pagination
+
+
+@pytest.fixture
+def resources():
+    for i in range(10):
+        value = f"value_{i}"
+        Resource.objects.create(
+            value_unique=value,
+            value_unique_together_1=value,
+            value_unique_together_2=value,
+            value_not_null=value,
+            value_check=1,
+        )
+
+    return list(Resource.objects.order_by("pk"))
+
+
+@pytest.mark.django_db
+def test_apaginate_queryset_awaits_count_and_evaluates_page(resources):
+    paginator = PageNumberPageSizePagination()
+    request = RequestFactory().get("/resources/pagination")
+
+    result = async_to_sync(paginator.apaginate_queryset)(
+        Resource.objects.order_by("pk"),
+        pagination=PageNumberPageSizePagination.Input(page=2, page_size=3),
+        request=request,
+    )
+
+    assert result["count"] == 10
+    assert result["pages"] == 4
+    assert result["previous_page"] == 1
+    assert result["next_page"] == 3
+    assert isinstance(result["items"], list)
+    assert result["items"] == resources[3:6]
+
+
+@pytest.mark.django_db
+def test_async_view_with_pagination(resources):
+    async def view(request):  # noqa: ARG001
+        return Resource.objects.order_by("pk")
+
+    view_with_pagination = _inject_page_number_page_size_pagination(view, PageNumberPageSizePagination)
+    request = RequestFactory().get("/resources/pagination")
+
+    result = async_to_sync(view_with_pagination)(
+        request, ninja_pagination=PageNumberPageSizePagination.Input(page=4, page_size=3)
+    )
+
+    assert result["count"] == 10
+    assert result["next_page"] is None
+    assert result["items"] == resources[9:]
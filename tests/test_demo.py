@@ -1,11 +1,23 @@
+import json
+
 import pytest
 from api.api import api
 from api.models import Child1, Child2, Resource
 from ninja.testing import TestClient
+from pydantic import TypeAdapter
+
+from ninja_extended.conf import settings
 
 test_client = TestClient(api)
 
 
+@pytest.fixture(autouse=True)
+def skip_registry(monkeypatch):
+    # the demo API is also included in the demo URLconf, so resolving it again through the test client
+    # would otherwise be rejected as a duplicate registration
+    monkeypatch.setenv("NINJA_SKIP_REGISTRY", "1")
+
+
 @pytest.fixture
 def resource_data():
     return {
@@ -340,3 +352,265 @@ def test_pagination():
         "path": "/resources/pagination?page_size=3&page=5",
         "operation_id": "listResourcesPagination",
     }
+
+
+@pytest.mark.django_db(transaction=True, reset_sequences=True)
+def test_keyset_pagination():
+    for i in range(10):
+        value = f"value_{i}"
+        Resource.objects.create(
+            value_unique=value,
+            value_unique_together_1=value,
+            value_unique_together_2=value,
+            value_not_null=value,
+            value_check=1,
+        )
+
+    response = test_client.get(path="/resources/keyset?page_size=4")
+
+    assert response.status_code == 200
+    assert [item["value_unique"] for item in response.data["items"]] == [f"value_{i}" for i in range(4)]
+    assert response.data["previous_cursor"] is None
+    assert response.data["previous_url"] is None
+    assert response.data["next_cursor"] is not None
+
+    next_cursor = response.data["next_cursor"]
+    response = test_client.get(path=f"/resources/keyset?page_size=4&cursor={next_cursor}")
+
+    assert response.status_code == 200
+    assert [item["value_unique"] for item in response.data["items"]] == [f"value_{i}" for i in range(4, 8)]
+
+    next_cursor = response.data["next_cursor"]
+    response = test_client.get(path=f"/resources/keyset?page_size=4&cursor={next_cursor}")
+
+    assert response.status_code == 200
+    assert [item["value_unique"] for item in response.data["items"]] == [f"value_{i}" for i in range(8, 10)]
+    assert response.data["next_cursor"] is None
+    assert response.data["next_url"] is None
+
+    previous_cursor = response.data["previous_cursor"]
+    response = test_client.get(path=f"/resources/keyset?page_size=4&cursor={previous_cursor}")
+
+    assert response.status_code == 200
+    assert [item["value_unique"] for item in response.data["items"]] == [f"value_{i}" for i in range(4, 8)]
+    assert response.data["previous_url"].startswith("http://testlocation/resources/keyset?page_size=4&cursor=")
+
+
+@pytest.mark.django_db
+def test_keyset_pagination_invalid_cursor():
+    response = test_client.get(path="/resources/keyset?cursor=invalid")
+
+    assert response.status_code == 422
+    assert response.data == {
+        "type": "errors/validation",
+        "status": 422,
+        "errors": [
+            {
+                "type": "value_error",
+                "loc": ["query", "cursor"],
+                "msg": "Invalid cursor",
+                "ctx": None,
+            },
+        ],
+        "path": "/resources/keyset?cursor=invalid",
+        "operation_id": "listResourcesKeyset",
+    }
+
+
+@pytest.mark.django_db
+def test_list_resources_values_fast_path(django_assert_num_queries):
+    for i in range(3):
+        value = f"value_{i}"
+        Resource.objects.create(
+            value_unique=value,
+            value_unique_together_1=value,
+            value_unique_together_2=value,
+            value_not_null=value,
+            value_check=i,
+        )
+
+    with django_assert_num_queries(1) as context:
+        response = test_client.get(path="/resources/")
+
+    assert response.status_code == 200
+    assert response.data == [
+        {
+            "id": i + 1,
+            "value_unique": f"value_{i}",
+            "value_unique_together_1": f"value_{i}",
+            "value_unique_together_2": f"value_{i}",
+            "value_not_null": f"value_{i}",
+            "value_check": i,
+        }
+        for i in range(3)
+    ]
+    assert '"api_resource"."id", "api_resource"."value_unique",' in context.captured_queries[0]["sql"]
+
+
+@pytest.mark.django_db
+def test_sparse_fields(django_assert_num_queries):
+    for i in range(3):
+        value = f"value_{i}"
+        Resource.objects.create(
+            value_unique=value,
+            value_unique_together_1=value,
+            value_unique_together_2=value,
+            value_not_null=value,
+            value_check=i,
+        )
+
+    with django_assert_num_queries(2) as context:
+        response = test_client.get(path="/resources/pagination?page_size=2&fields=id,value_unique")
+
+    assert response.status_code == 200
+    assert response.data["count"] == 3
+    assert response.data["items"] == [{"id": 1, "value_unique": "value_0"}, {"id": 2, "value_unique": "value_1"}]
+    assert "value_not_null" not in context.captured_queries[1]["sql"]
+
+    response = test_client.get(path="/resources/2?fields=value_check")
+
+    assert response.status_code == 200
+    assert response.data == {"value_check": 1}
+
+    response = test_client.get(path="/resources/2")
+
+    assert response.status_code == 200
+    assert response.data["value_not_null"] == "value_1"
+
+
+def test_sparse_fields_openapi():
+    parameters = api.get_openapi_schema(path_prefix="")["paths"]["/resources/{id}"]["get"]["parameters"]
+
+    fields = next(parameter for parameter in parameters if parameter["name"] == "fields")
+
+    assert fields["in"] == "query"
+    assert fields["required"] is False
+    assert "value_unique" in fields["description"]
+
+
+@pytest.mark.django_db
+def test_sparse_fields_unknown_field():
+    response = test_client.get(path="/resources/?fields=id,unknown")
+
+    assert response.status_code == 422
+    assert response.data == {
+        "type": "errors/validation",
+        "status": 422,
+        "errors": [
+            {
+                "type": "value_error",
+                "loc": ["query", "fields"],
+                "msg": "Unknown fields: unknown",
+                "ctx": None,
+            },
+        ],
+        "path": "/resources/?fields=id,unknown",
+        "operation_id": "listResources",
+    }
+
+
+@pytest.mark.django_db
+def test_streaming_export():
+    for i in range(3):
+        value = f"value_{i}"
+        Resource.objects.create(
+            value_unique=value,
+            value_unique_together_1=value,
+            value_unique_together_2=value,
+            value_not_null=value,
+            value_check=i,
+        )
+
+    response = test_client.get(path="/resources/", headers={"Accept": "application/x-ndjson"})
+
+    assert response.status_code == 200
+    assert response["Content-Type"] == "application/x-ndjson"
+    assert [json.loads(line) for line in response.content.decode().splitlines()] == [
+        {
+            "id": i + 1,
+            "value_unique": f"value_{i}",
+            "value_unique_together_1": f"value_{i}",
+            "value_unique_together_2": f"value_{i}",
+            "value_not_null": f"value_{i}",
+            "value_check": i,
+        }
+        for i in range(3)
+    ]
+
+    response = test_client.get(
+        path="/resources/pagination?page_size=1&fields=id,value_unique", headers={"Accept": "text/csv"}
+    )
+
+    assert response.status_code == 200
+    assert response["Content-Type"] == "text/csv; charset=utf-8"
+    assert response.content.decode() == "id,value_unique\r\n1,value_0\r\n2,value_1\r\n3,value_2\r\n"
+
+    response = test_client.get(path="/resources/", headers={"Accept": "*/*"})
+
+    assert response.status_code == 200
+    assert len(response.data) == 3
+
+
+@pytest.mark.django_db
+def test_stream_json_array():
+    response = test_client.get(path="/resources/")
+
+    assert response.status_code == 200
+    assert response.streaming
+    assert response.content == b"[]"
+
+    for i in range(3):
+        value = f"value_{i}"
+        Resource.objects.create(
+            value_unique=value,
+            value_unique_together_1=value,
+            value_unique_together_2=value,
+            value_not_null=value,
+            value_check=i,
+        )
+
+    response = test_client.get(path="/resources/?fields=id")
+
+    assert response.status_code == 200
+    assert response.streaming
+    assert response["Content-Type"] == "application/json"
+    assert response.content == b'[{"id":1},{"id":2},{"id":3}]'
+
+
+@pytest.mark.django_db
+def test_trusted_response(resource_data, mocker):
+    resource = Resource.objects.create(**resource_data)
+    validate_python = mocker.spy(TypeAdapter, "validate_python")
+
+    response = test_client.get(path=f"/resources/{resource.id}")
+
+    assert response.status_code == 200
+    assert response.data == {"id": resource.id, **resource_data}
+    assert validate_python.call_count == 0
+
+    mocker.patch.object(settings, "TRUSTED_RESPONSE_VALIDATION_RATE", 1.0)
+
+    response = test_client.get(path=f"/resources/{resource.id}?fields=id")
+
+    assert response.status_code == 200
+    assert response.data == {"id": resource.id}
+    assert validate_python.call_count == 1
+
+
+def test_openapi_cache(client):
+    response = client.get("/api/openapi.json")
+    gzip_response = client.get("/api/openapi.json", headers={"Accept-Encoding": "gzip"})
+    not_modified = client.get("/api/openapi.json", headers={"If-None-Match": response["ETag"]})
+
+    assert response.status_code == 200
+    assert response.json()["paths"].keys() == api.get_openapi_schema()["paths"].keys()
+    assert gzip_response["Content-Encoding"] == "gzip"
+    assert not_modified.status_code == 304
+
+
+def test_warmup(mocker):
+    document = mocker.spy(api.openapi_cache, "document")
+
+    api.warmup()
+
+    document.assert_called_once_with(api, "/api/")